@@ -13,14 +13,17 @@ ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.append(str(ROOT_DIR))
 
-from stock_analyzer.db import Base, DATABASE_URL  # noqa: E402
+from stock_analyzer.db import Base, database_url  # noqa: E402
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
 section = config.config_ini_section
-config.set_section_option(section, "sqlalchemy.url", os.getenv("DATABASE_URL", DATABASE_URL))
+# DATABASE_URL, or the SQLITE_PATH fallback the app itself uses; "%" is escaped for configparser.
+config.set_section_option(
+    section, "sqlalchemy.url", os.getenv("DATABASE_URL", database_url).replace("%", "%%")
+)
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
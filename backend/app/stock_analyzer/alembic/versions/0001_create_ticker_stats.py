@@ -10,6 +10,9 @@ depends_on = None
 
 
 def upgrade() -> None:
+    # Databases created by Base.metadata.create_all already have the table.
+    if sa.inspect(op.get_bind()).has_table("ticker_stats"):
+        return
     op.create_table(
         "ticker_stats",
         sa.Column("id", sa.Integer(), primary_key=True),
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_analysis_history_indexes"
+down_revision = "0001_create_ticker_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # analysis_history used to be created only by Base.metadata.create_all, so it may already exist.
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("analysis_history"):
+        op.create_table(
+            "analysis_history",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("ticker", sa.String(length=32), nullable=False),
+            sa.Column("lang", sa.String(length=8), nullable=False),
+            sa.Column("benchmark", sa.String(length=32), nullable=True),
+            sa.Column("payload_json", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        )
+        op.create_index("ix_analysis_history_id", "analysis_history", ["id"])
+        op.create_index("ix_analysis_history_ticker", "analysis_history", ["ticker"])
+        existing = set()
+    else:
+        existing = {index["name"] for index in inspector.get_indexes("analysis_history")}
+
+    if "ix_analysis_history_created_at_id" not in existing:
+        op.create_index(
+            "ix_analysis_history_created_at_id", "analysis_history", ["created_at", "id"]
+        )
+    if "ix_analysis_history_ticker_created_at_id" not in existing:
+        op.create_index(
+            "ix_analysis_history_ticker_created_at_id",
+            "analysis_history",
+            ["ticker", "created_at", "id"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_analysis_history_ticker_created_at_id", table_name="analysis_history")
+    op.drop_index("ix_analysis_history_created_at_id", table_name="analysis_history")
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_analysis_payloads"
+down_revision = "0002_analysis_history_indexes"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    # Base.metadata.create_all may already have created the table, the column, or both.
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("analysis_payloads"):
+        op.create_table(
+            "analysis_payloads",
+            sa.Column("hash", sa.String(length=64), primary_key=True),
+            sa.Column("data", sa.LargeBinary(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        )
+    columns = {column["name"] for column in inspector.get_columns("analysis_history")}
+    if "payload_hash" not in columns:
+        with op.batch_alter_table("analysis_history") as batch:
+            batch.add_column(sa.Column("payload_hash", sa.String(length=64), nullable=True))
+            batch.alter_column("payload_json", existing_type=sa.String(), nullable=True)
+            batch.create_foreign_key(
+                "fk_analysis_history_payload_hash",
+                "analysis_payloads",
+                ["payload_hash"],
+                ["hash"],
+            )
+
+    # Move existing inline payloads into the deduplicated, compressed table.
+    bind = op.get_bind()
+    history = sa.table(
+        "analysis_history",
+        sa.column("id", sa.Integer),
+        sa.column("payload_json", sa.String),
+        sa.column("payload_hash", sa.String),
+    )
+    payloads = sa.table(
+        "analysis_payloads",
+        sa.column("hash", sa.String),
+        sa.column("data", sa.LargeBinary),
+    )
+    known = set(bind.execute(sa.select(payloads.c.hash)).scalars())
+    while True:
+        rows = bind.execute(
+            sa.select(history.c.id, history.c.payload_json)
+            .where(history.c.payload_json.is_not(None))
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        for row in rows:
+            try:
+                raw = json.dumps(
+                    json.loads(row.payload_json), ensure_ascii=False, separators=(",", ":")
+                ).encode("utf-8")
+            except json.JSONDecodeError:
+                raw = row.payload_json.encode("utf-8")
+            digest = hashlib.sha256(raw).hexdigest()
+            if digest not in known:
+                bind.execute(payloads.insert().values(hash=digest, data=zlib.compress(raw, 6)))
+                known.add(digest)
+            bind.execute(
+                history.update()
+                .where(history.c.id == row.id)
+                .values(payload_hash=digest, payload_json=None)
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    history = sa.table(
+        "analysis_history",
+        sa.column("id", sa.Integer),
+        sa.column("payload_json", sa.String),
+        sa.column("payload_hash", sa.String),
+    )
+    payloads = sa.table(
+        "analysis_payloads",
+        sa.column("hash", sa.String),
+        sa.column("data", sa.LargeBinary),
+    )
+    rows = bind.execute(
+        sa.select(history.c.id, payloads.c.data).join(
+            payloads, payloads.c.hash == history.c.payload_hash
+        )
+    ).all()
+    for row in rows:
+        bind.execute(
+            history.update()
+            .where(history.c.id == row.id)
+            .values(payload_json=zlib.decompress(row.data).decode("utf-8"))
+        )
+    with op.batch_alter_table("analysis_history") as batch:
+        batch.drop_constraint("fk_analysis_history_payload_hash", type_="foreignkey")
+        batch.drop_column("payload_hash")
+        batch.alter_column("payload_json", existing_type=sa.String(), nullable=False)
+    op.drop_table("analysis_payloads")
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0004_normalize_created_at"
+down_revision = "0003_analysis_payloads"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SQLite compares DATETIME values as text. Rows stamped by CURRENT_TIMESTAMP
+    # ("YYYY-MM-DD HH:MM:SS") get the microseconds SQLAlchemy binds parameters with,
+    # so since/until and cursor boundaries compare like with like.
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute(
+        "UPDATE analysis_history SET created_at = created_at || '.000000' "
+        "WHERE length(created_at) = 19"
+    )
+
+
+def downgrade() -> None:
+    pass
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+from typing import Iterator
+
 from fastapi import HTTPException
 
 from stock_analyzer.services.language import get_language
-from stock_analyzer.services.stock_analyzer.analysis import analyze_ticker, DEFAULT_REL_WINDOW
 
 from .models import AnalysisInput
 
+# The analysis stack (pandas, yfinance) is imported on first use, or by the
+# startup warm-up, so the API process can bind its port without waiting for it.
+
 
 def analyze_stock(input_data: AnalysisInput) -> dict:
+    from stock_analyzer.services.stock_analyzer.analysis import DEFAULT_REL_WINDOW, analyze_ticker
+
     ticker = input_data.ticker.strip().upper()
     if not ticker:
         raise HTTPException(status_code=400, detail="Ticker is required")
@@ -21,8 +27,33 @@ def analyze_stock(input_data: AnalysisInput) -> dict:
             benchmark_symbol=input_data.benchmark,
             backtest_days=input_data.backtest_days,
             relative_window=relative_window,
+            benchmarks=input_data.benchmarks,
+            relative_windows=input_data.relative_windows,
         )
     except HTTPException:
         raise
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+def stream_stock_analysis(input_data: AnalysisInput) -> Iterator[tuple[str, dict]]:
+    """Section-by-section variant of ``analyze_stock``; errors surface mid-iteration."""
+    from stock_analyzer.services.stock_analyzer.analysis import (
+        DEFAULT_REL_WINDOW,
+        iter_analysis_sections,
+    )
+
+    ticker = input_data.ticker.strip().upper()
+    if not ticker:
+        raise HTTPException(status_code=400, detail="Ticker is required")
+    lang = get_language(input_data.lang)
+    relative_window = input_data.relative_window or DEFAULT_REL_WINDOW
+    return iter_analysis_sections(
+        ticker,
+        lang,
+        benchmark_symbol=input_data.benchmark,
+        backtest_days=input_data.backtest_days,
+        relative_window=relative_window,
+        benchmarks=input_data.benchmarks,
+        relative_windows=input_data.relative_windows,
+    )
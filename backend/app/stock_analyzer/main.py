@@ -1,23 +1,102 @@
 from __future__ import annotations
 
+import asyncio
+import importlib
 import logging
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
 from .middleware import LoggingMiddleware, TickerStatsMiddleware
+from .middleware.stats_middleware import (
+    flush_ticker_stats,
+    load_leaderboard,
+    run_leaderboard_flush,
+)
+from .prewarm import PREWARM_ENABLED, PREWARM_ON_STARTUP, prewarm_once, run_prewarm_scheduler
 from .routes import all_routers
-from .db import Base, engine
+from .db import dispose_engines
+from .migrations import ensure_schema_current
 
-logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("stock_api")
 
-app = FastAPI(title="Stock Analyzer API", description="Multi-indicator stock analytics")
+# Imported off the event loop during warm-up so the first request does not pay for them.
+WARM_IMPORTS = (
+    "stock_analyzer.services.stock_analyzer.analysis",
+    "stock_analyzer.services.stock_analyzer.series",
+)
+SCHEMA_RETRY_MAX_SECONDS = 30.0
+
+
+async def _ensure_schema() -> None:
+    """Bring the schema to the latest migration, retrying with backoff until that succeeds.
+
+    The worker stays unready meanwhile, so requests never meet a stale schema.
+    """
+    delay = 1.0
+    while True:
+        try:
+            await run_in_threadpool(ensure_schema_current)
+            return
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Schema check failed, retrying in %.0f s: %s", delay, exc)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, SCHEMA_RETRY_MAX_SECONDS)
+
+
+def _import_warm_modules() -> None:
+    for module in WARM_IMPORTS:
+        importlib.import_module(module)
+
+
+async def warm_up(app: FastAPI) -> None:
+    """Bring the worker to ready: schema, stored counters, analysis stack, hot tickers."""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await _ensure_schema()
+    await load_leaderboard()
+    await run_in_threadpool(_import_warm_modules)
+    if PREWARM_ON_STARTUP:
+        await prewarm_once()
+    app.state.ready = True
+    logger.info("Worker ready in %.2f s", loop.time() - started)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logging.basicConfig(level=logging.INFO)
+    app.state.ready = False
+    # Startup returns immediately so /health is served while warm-up runs; /ready
+    # reports when it has finished.
+    tasks = [
+        asyncio.create_task(warm_up(app)),
+        asyncio.create_task(run_leaderboard_flush()),
+    ]
+    if PREWARM_ENABLED:
+        tasks.append(asyncio.create_task(run_prewarm_scheduler()))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        await flush_ticker_stats()
+        await dispose_engines()
+
+
+app = FastAPI(
+    title="Stock Analyzer API",
+    description="Multi-indicator stock analytics",
+    lifespan=lifespan,
+)
 
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(TickerStatsMiddleware)
 
-Base.metadata.create_all(bind=engine)
-
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
@@ -38,8 +117,17 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
 
 @app.get("/health")
 def health_check() -> dict:
+    """Liveness: the process is up and serving requests."""
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def readiness_check(request: Request) -> JSONResponse:
+    """Readiness: schema checked and caches warm; 503 until then."""
+    if getattr(request.app.state, "ready", False):
+        return JSONResponse({"status": "ready"})
+    return JSONResponse({"status": "starting"}, status_code=503)
+
+
 for router in all_routers:
     app.include_router(router)
@@ -2,23 +2,50 @@ from __future__ import annotations
 
 import logging
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from stock_analyzer.metrics import HTTP_REQUEST_SECONDS
 
 logger = logging.getLogger("stock_api")
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
+class LoggingMiddleware:
+    """Log method, path, status code and duration for every HTTP request.
+
+    Durations are also recorded in the request latency histogram, labelled by the
+    matched route template so path parameters do not explode label cardinality.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start = time.perf_counter()
-        response = await call_next(request)
-        duration = (time.perf_counter() - start) * 1000
-        logger.info(
-            "%s %s -> %s (%.2f ms)",
-            request.method,
-            request.url.path,
-            response.status_code,
-            duration,
-        )
-        return response
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = getattr(scope.get("route"), "path", None) or "<unmatched>"
+            HTTP_REQUEST_SECONDS.observe(
+                elapsed, method=scope["method"], route=route, status=str(status_code)
+            )
+            logger.info(
+                "%s %s -> %s (%.2f ms)",
+                scope["method"],
+                scope["path"],
+                status_code,
+                elapsed * 1000,
+            )
@@ -1,61 +1,145 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import os
 from typing import List
+from urllib.parse import parse_qs
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from sqlalchemy import select, update
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from stock_analyzer.db import SessionLocal
+from stock_analyzer.db import AsyncSessionLocal
 from stock_analyzer.models import TickerStat
+from stock_analyzer.services.analytics import TickerLeaderboard
 
+logger = logging.getLogger("stock_api")
 
-def record_ticker(ticker: str) -> None:
-    if not ticker:
+# The ticker sits near the start of a small JSON body; anything past this is not inspected.
+MAX_PEEK_BYTES = 4096
+FLUSH_INTERVAL_SECONDS = float(os.getenv("LEADERBOARD_FLUSH_SECONDS", "30"))
+DECAY_HALF_LIFE_SECONDS = float(os.getenv("LEADERBOARD_HALF_LIFE_HOURS", "24")) * 3600
+
+# Per worker process: the hour/day/week/decay windows only see this worker's
+# requests and start empty; only all-time counts are shared through ticker_stats.
+LEADERBOARD = TickerLeaderboard(half_life_seconds=DECAY_HALF_LIFE_SECONDS)
+_LOAD_LOCK = asyncio.Lock()
+
+
+async def load_leaderboard() -> None:
+    """Seed all-time counts from ``ticker_stats``; safe to call more than once.
+
+    A failed read leaves the leaderboard unloaded, so the next call retries.
+    """
+    if LEADERBOARD.loaded:
         return
-    with SessionLocal() as session:
+    async with _LOAD_LOCK:
+        if LEADERBOARD.loaded:
+            return
         try:
-            stat = session.query(TickerStat).filter_by(ticker=ticker).one_or_none()
-            if stat:
-                stat.count += 1
-            else:
-                stat = TickerStat(ticker=ticker, count=1)
-                session.add(stat)
-            session.commit()
-        except Exception:
-            session.rollback()
-
-
-def get_top_tickers(limit: int = 10) -> List[dict]:
-    with SessionLocal() as session:
+            async with AsyncSessionLocal() as session:
+                rows = (await session.execute(select(TickerStat.ticker, TickerStat.count))).all()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not load ticker stats, will retry: %s", exc)
+            return
+        LEADERBOARD.load((row.ticker, row.count) for row in rows)
+
+
+async def flush_ticker_stats() -> None:
+    """Persist counts recorded since the last flush to ``ticker_stats`` in one transaction."""
+    await load_leaderboard()
+    if not LEADERBOARD.loaded:
+        # Persisting before the stored totals are loaded would count these increments twice.
+        return
+    pending = LEADERBOARD.drain_pending()
+    if not pending:
+        return
+    async with AsyncSessionLocal() as session:
         try:
-            rows = (
-                session.query(TickerStat)
-                .order_by(TickerStat.count.desc())
-                .limit(limit)
-                .all()
-            )
-        except Exception:
-            return []
-        return [{"ticker": row.ticker, "count": row.count} for row in rows]
-
-
-class TickerStatsMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
-        body_bytes = None
-        if request.method == "POST" and request.url.path.startswith("/analyze"):
-            body_bytes = await request.body()
-            if body_bytes:
-                try:
-                    payload = json.loads(body_bytes)
-                    ticker = str(payload.get("ticker", "")).strip().upper()
-                    record_ticker(ticker)
-                except Exception:
-                    pass
-        if body_bytes is not None:
-            async def receive() -> dict:
-                return {"type": "http.request", "body": body_bytes, "more_body": False}
-
-            request._receive = receive  # type: ignore[attr-defined]
-        return await call_next(request)
+            for ticker, count in pending.items():
+                result = await session.execute(
+                    update(TickerStat)
+                    .where(TickerStat.ticker == ticker)
+                    .values(count=TickerStat.count + count)
+                )
+                if result.rowcount == 0:
+                    session.add(TickerStat(ticker=ticker, count=count))
+            await session.commit()
+        except Exception as exc:  # noqa: BLE001
+            await session.rollback()
+            LEADERBOARD.restore_pending(pending)
+            logger.warning("Could not persist ticker stats: %s", exc)
+
+
+async def run_leaderboard_flush(interval: float = FLUSH_INTERVAL_SECONDS) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await flush_ticker_stats()
+
+
+def record_ticker(ticker: str) -> None:
+    """Count one request in memory; the stored totals are merged in by ``load_leaderboard``."""
+    if not ticker:
+        return
+    LEADERBOARD.record(ticker)
+
+
+async def get_top_tickers(limit: int = 10, window: str = "all") -> List[dict]:
+    await load_leaderboard()
+    return LEADERBOARD.top(limit, window)
+
+
+def _extract_ticker(body: bytes) -> str:
+    try:
+        payload = json.loads(body)
+        return str(payload.get("ticker", "")).strip().upper()
+    except Exception:
+        return ""
+
+
+def _query_ticker(query_string: bytes) -> str:
+    values = parse_qs(query_string.decode("latin-1")).get("ticker")
+    return values[0].strip().upper() if values else ""
+
+
+class TickerStatsMiddleware:
+    """Count requested tickers on ``/analyze`` without re-buffering the request.
+
+    ``POST /analyze`` carries the ticker in its JSON body: the ``receive`` channel
+    is wrapped so the body chunks flow straight through to the application while
+    the first ``MAX_PEEK_BYTES`` are copied aside for parsing. The streaming
+    ``GET /analyze/stream`` variant carries it in the query string.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith("/analyze"):
+            await self.app(scope, receive, send)
+            return
+        if scope["method"] == "GET":
+            record_ticker(_query_ticker(scope.get("query_string", b"")))
+            await self.app(scope, receive, send)
+            return
+        if scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        peeked = bytearray()
+        recorded = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal recorded
+            message = await receive()
+            if recorded or message["type"] != "http.request":
+                return message
+            if len(peeked) < MAX_PEEK_BYTES:
+                peeked.extend(message.get("body", b"")[: MAX_PEEK_BYTES - len(peeked)])
+            if not message.get("more_body", False):
+                recorded = True
+                record_ticker(_extract_ticker(bytes(peeked)))
+            return message
+
+        await self.app(scope, receive_wrapper, send)
@@ -0,0 +1,54 @@
+"""Alembic migrations run from the API process.
+
+Workers bring the database to the latest revision during warm-up, so a
+database created by an older release gains new tables and columns before any
+request touches them. With ``DB_MIGRATE_ON_STARTUP=false`` (migrations run by
+a deploy step instead) workers only check the revision and stay unready until
+it is current.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from .db import database_url, get_engine
+
+ALEMBIC_DIR = Path(__file__).resolve().parent / "alembic"
+_TRUTHY = {"1", "true", "yes", "on"}
+MIGRATE_ON_STARTUP = os.getenv("DB_MIGRATE_ON_STARTUP", "true").strip().lower() in _TRUTHY
+
+
+def alembic_config() -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
+    return config
+
+
+def upgrade_to_head() -> None:
+    command.upgrade(alembic_config(), "head")
+
+
+def pending_revisions() -> bool:
+    """Whether the database is behind the newest migration."""
+    heads = set(ScriptDirectory.from_config(alembic_config()).get_heads())
+    with get_engine().connect() as connection:
+        current = set(MigrationContext.configure(connection).get_current_heads())
+    return current != heads
+
+
+def ensure_schema_current() -> None:
+    """Migrate (or, with migrations disabled, check) the schema; raises while it is behind."""
+    if MIGRATE_ON_STARTUP:
+        upgrade_to_head()
+    elif pending_revisions():
+        raise RuntimeError(
+            "Database schema is behind; run `alembic upgrade head` "
+            "or set DB_MIGRATE_ON_STARTUP=true"
+        )
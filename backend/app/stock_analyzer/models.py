@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, LargeBinary, String, func
 
 from .db import Base
 
 
+def utcnow() -> datetime:
+    """Naive UTC now, the form ``created_at`` is stored and compared in."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 @dataclass
 class AnalysisInput:
     ticker: str
@@ -14,6 +20,8 @@ class AnalysisInput:
     benchmark: str | None = None
     backtest_days: int | None = None
     relative_window: int | None = None
+    benchmarks: tuple[str, ...] = ()
+    relative_windows: tuple[int, ...] = ()
 
 
 class TickerStat(Base):
@@ -25,12 +33,30 @@ class TickerStat(Base):
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
 
 
+class AnalysisPayload(Base):
+    """zlib-compressed summary JSON, stored once per SHA-256 of its content."""
+
+    __tablename__ = "analysis_payloads"
+
+    hash = Column(String(64), primary_key=True)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+
 class AnalysisHistory(Base):
     __tablename__ = "analysis_history"
+    __table_args__ = (
+        Index("ix_analysis_history_created_at_id", "created_at", "id"),
+        Index("ix_analysis_history_ticker_created_at_id", "ticker", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     ticker = Column(String(32), nullable=False, index=True)
     lang = Column(String(8), nullable=False, default="ko")
     benchmark = Column(String(32), nullable=True)
-    payload_json = Column(String, nullable=False)
-    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    payload_hash = Column(String(64), ForeignKey("analysis_payloads.hash"), nullable=True)
+    # Legacy inline payload for rows written before analysis_payloads existed.
+    payload_json = Column(String, nullable=True)
+    # Set client-side so stored values share the format of bound query parameters
+    # (SQLite compares DATETIME columns as text; CURRENT_TIMESTAMP has no microseconds).
+    created_at = Column(DateTime, nullable=False, default=utcnow, server_default=func.now())
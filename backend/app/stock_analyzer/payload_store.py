@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import AnalysisPayload
+
+COMPRESSION_LEVEL = 6
+
+
+def serialize_payload(payload: dict) -> bytes:
+    """Compact UTF-8 JSON used both for hashing and storage."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def payload_digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def compress_payload(raw: bytes) -> bytes:
+    return zlib.compress(raw, COMPRESSION_LEVEL)
+
+
+def decompress_payload(data: bytes | None, legacy_json: str | None = None) -> dict | None:
+    """Decode a stored payload, falling back to the legacy inline JSON column."""
+    try:
+        if data is not None:
+            return json.loads(zlib.decompress(data))
+        if legacy_json is not None:
+            return json.loads(legacy_json)
+    except (zlib.error, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return None
+
+
+async def store_payload(session: AsyncSession, raw: bytes) -> str:
+    """Persist ``raw`` once and return its hash; identical payloads share one row."""
+    digest = payload_digest(raw)
+    if await session.get(AnalysisPayload, digest) is not None:
+        return digest
+    try:
+        async with session.begin_nested():
+            session.add(AnalysisPayload(hash=digest, data=compress_payload(raw)))
+    except IntegrityError:
+        # Another writer stored the same content between the lookup and the insert.
+        pass
+    return digest
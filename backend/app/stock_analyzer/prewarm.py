@@ -0,0 +1,162 @@
+"""Background pre-warming of analyses for the most requested tickers.
+
+The scheduler runs inside the FastAPI lifespan. At each scheduled time it reads
+the top ``PREWARM_TOP_N`` tickers from ``ticker_stats`` and refreshes their
+price history, fundamentals and finished summaries one ticker at a time, pacing
+provider traffic to ``PREWARM_RATE_PER_MINUTE``.
+
+Environment variables:
+- ``PREWARM_ENABLED`` (default ``true``)
+- ``PREWARM_ON_STARTUP``: also warm once during worker start-up, before the
+  worker reports ready (default ``false``)
+- ``PREWARM_TOP_N`` (default 20)
+- ``PREWARM_TIMES``: comma-separated ``HH:MM`` UTC run times (default ``21:15``,
+  shortly after the US close)
+- ``PREWARM_INTERVAL_MINUTES``: additionally run every N minutes (default 0, off)
+- ``PREWARM_RATE_PER_MINUTE`` (default 30 tickers per minute)
+- ``PREWARM_LANGS`` (default ``ko,en``)
+- ``PREWARM_MAX_TTL_HOURS``: warmed results live until the next run, capped
+  at this many hours (default 16, i.e. until before the next US open)
+
+Every worker runs the scheduler, but when ``SHARED_CACHE_PATH`` is set only one
+worker per host does the warming: each run first claims the ``prewarm`` lease
+in the shared cache file, and the workers that lose the claim skip the run and
+read the warmed entries from the shared tier. The lease is held for half the
+gap to the next run, so a crashed warmer is replaced at the following run.
+Without a shared cache every worker warms its own in-process cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, time as dt_time, timedelta, timezone
+from typing import List
+
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
+
+from stock_analyzer.db import AsyncSessionLocal
+from stock_analyzer.metrics import PREWARM_RUNS
+from stock_analyzer.models import TickerStat
+from stock_analyzer.services.language import get_language
+from stock_analyzer.services.stock_analyzer.shared_cache import SHARED_CACHE
+
+logger = logging.getLogger("stock_api")
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _parse_times(raw: str) -> List[dt_time]:
+    times = []
+    for item in raw.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            hour, minute = item.split(":")
+            times.append(dt_time(int(hour), int(minute), tzinfo=timezone.utc))
+        except ValueError:
+            logger.warning("Ignoring invalid PREWARM_TIMES entry: %s", item)
+    return times
+
+
+PREWARM_ENABLED = _env_flag("PREWARM_ENABLED", "true")
+PREWARM_ON_STARTUP = _env_flag("PREWARM_ON_STARTUP", "false")
+PREWARM_TOP_N = int(os.getenv("PREWARM_TOP_N", "20"))
+PREWARM_TIMES = _parse_times(os.getenv("PREWARM_TIMES", "21:15"))
+PREWARM_INTERVAL_MINUTES = float(os.getenv("PREWARM_INTERVAL_MINUTES", "0"))
+PREWARM_RATE_PER_MINUTE = float(os.getenv("PREWARM_RATE_PER_MINUTE", "30"))
+PREWARM_LANGS = [
+    code.strip() for code in os.getenv("PREWARM_LANGS", "ko,en").split(",") if code.strip()
+]
+PREWARM_MAX_TTL_SECONDS = float(os.getenv("PREWARM_MAX_TTL_HOURS", "16")) * 3600
+
+PREWARM_LEASE_NAME = "prewarm"
+_LEASE_OWNER = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def next_run_after(now: datetime, last_run: datetime | None = None) -> datetime | None:
+    """Earliest scheduled run strictly after ``now`` (UTC), or None if nothing is scheduled."""
+    candidates = []
+    for run_time in PREWARM_TIMES:
+        candidate = datetime.combine(now.date(), run_time)
+        if candidate <= now:
+            candidate += timedelta(days=1)
+        candidates.append(candidate)
+    if PREWARM_INTERVAL_MINUTES > 0:
+        interval = timedelta(minutes=PREWARM_INTERVAL_MINUTES)
+        candidates.append((last_run or now) + interval)
+    return min(candidates) if candidates else None
+
+
+def claim_prewarm_run(ttl: float | None = None) -> bool:
+    """Whether this worker should do the current run; see the module docstring."""
+    if SHARED_CACHE is None:
+        return True
+    if ttl is None:
+        now = datetime.now(timezone.utc)
+        scheduled = next_run_after(now)
+        ttl = (scheduled - now).total_seconds() if scheduled else PREWARM_MAX_TTL_SECONDS
+    return SHARED_CACHE.try_lease(PREWARM_LEASE_NAME, _LEASE_OWNER, max(ttl / 2, 1.0))
+
+
+async def load_hot_tickers(limit: int = PREWARM_TOP_N) -> List[str]:
+    async with AsyncSessionLocal() as session:
+        rows = (
+            await session.execute(
+                select(TickerStat.ticker).order_by(TickerStat.count.desc()).limit(limit)
+            )
+        ).scalars()
+        return [ticker for ticker in rows if ticker]
+
+
+async def prewarm_once(ttl: float | None = None) -> int:
+    """Refresh the hot tickers once; returns how many were warmed successfully."""
+    from stock_analyzer.services.stock_analyzer.analysis import refresh_analysis
+
+    if not await run_in_threadpool(claim_prewarm_run, ttl):
+        logger.info("Pre-warm run skipped: another worker holds the lease")
+        return 0
+    try:
+        tickers = await load_hot_tickers()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Pre-warm could not read ticker stats: %s", exc)
+        return 0
+    langs = [get_language(code) for code in PREWARM_LANGS]
+    spacing = 60.0 / PREWARM_RATE_PER_MINUTE if PREWARM_RATE_PER_MINUTE > 0 else 0.0
+    warmed = 0
+    loop = asyncio.get_running_loop()
+    for index, ticker in enumerate(tickers):
+        if index and spacing:
+            await asyncio.sleep(spacing)
+        started = loop.time()
+        try:
+            await run_in_threadpool(refresh_analysis, ticker, langs, ttl=ttl)
+        except Exception as exc:  # noqa: BLE001
+            PREWARM_RUNS.inc(result="error")
+            logger.warning("Pre-warm failed for %s: %s", ticker, exc)
+            continue
+        PREWARM_RUNS.inc(result="ok")
+        warmed += 1
+        logger.info("Pre-warmed %s in %.2f s", ticker, loop.time() - started)
+    return warmed
+
+
+async def run_prewarm_scheduler() -> None:
+    last_run: datetime | None = None
+    while True:
+        now = datetime.now(timezone.utc)
+        scheduled = next_run_after(now, last_run)
+        if scheduled is None:
+            return
+        await asyncio.sleep((scheduled - now).total_seconds())
+        last_run = datetime.now(timezone.utc)
+        following = next_run_after(last_run, last_run)
+        ttl = min((following - last_run).total_seconds(), PREWARM_MAX_TTL_SECONDS)
+        warmed = await prewarm_once(ttl=ttl)
+        logger.info("Pre-warm run finished: %d tickers warmed", warmed)
@@ -1,7 +1,17 @@
+from stock_analyzer.routes.analytics.correlation_router import router as correlation_router
 from stock_analyzer.routes.analytics.top_router import router as analytics_router
 from stock_analyzer.routes.analyze.analyze_router import router as analyze_router
 from stock_analyzer.routes.history.history_router import router as history_router
+from stock_analyzer.routes.metrics.metrics_router import router as metrics_router
+from stock_analyzer.routes.series.series_router import router as series_router
 
-all_routers = [analyze_router, analytics_router, history_router]
+all_routers = [
+    analyze_router,
+    analytics_router,
+    correlation_router,
+    history_router,
+    series_router,
+    metrics_router,
+]
 
 __all__ = ["all_routers"]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+MAX_TICKERS = 500
+
+
+@router.get("/correlation")
+def read_correlation(
+    tickers: str = Query(..., description="Comma-separated tickers"),
+    benchmarks: str = Query(
+        "^GSPC", description="Comma-separated benchmarks for the rolling betas"
+    ),
+    period: Literal["3mo", "6mo", "1y", "2y", "5y"] = Query("1y"),
+    window: int = Query(60, ge=10, le=252, description="Rolling beta window in trading days"),
+    threshold: float = Query(
+        0.7, ge=0.0, le=1.0, description="Correlation that links tickers into a cluster"
+    ),
+    matrix: bool = Query(True, description="Include the full correlation matrix"),
+    pairs: int = Query(20, ge=0, le=500, description="Most correlated pairs to list"),
+) -> dict:
+    from stock_analyzer.services.stock_analyzer.correlation import universe_correlations
+
+    symbols = list(
+        dict.fromkeys(item.strip().upper() for item in tickers.split(",") if item.strip())
+    )
+    if len(symbols) < 2:
+        raise HTTPException(status_code=400, detail="At least two tickers are required")
+    if len(symbols) > MAX_TICKERS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_TICKERS} tickers are allowed")
+    benchmark_symbols = [item.strip().upper() for item in benchmarks.split(",") if item.strip()]
+    try:
+        result = universe_correlations(
+            symbols, benchmark_symbols, period=period, window=window, threshold=threshold
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return {
+        "period": period,
+        "window": window,
+        "threshold": threshold,
+        **result.to_dict(matrix=matrix, pairs=pairs),
+    }
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Literal
+
 from fastapi import APIRouter, Query
 
 from stock_analyzer.middleware.stats_middleware import get_top_tickers
@@ -8,5 +10,10 @@ router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
 
 @router.get("/top-tickers")
-def read_top_tickers(limit: int = Query(10, ge=1, le=100)) -> list[dict]:
-    return get_top_tickers(limit)
+async def read_top_tickers(
+    limit: int = Query(10, ge=1, le=100),
+    window: Literal["hour", "day", "week", "all", "decay"] = Query(
+        "all", description="Rolling window, all-time counts, or exponentially decayed score"
+    ),
+) -> list[dict]:
+    return await get_top_tickers(limit, window)
@@ -1,31 +1,164 @@
 from __future__ import annotations
 
 import json
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
 
-from stock_analyzer.database import analyze_stock
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from stock_analyzer.database import analyze_stock, stream_stock_analysis
 from stock_analyzer.models import AnalysisInput, AnalysisHistory
-from stock_analyzer.db import SessionLocal
+from stock_analyzer.db import AsyncSessionLocal
+from stock_analyzer.metrics import ANALYSIS_STAGE_SECONDS
+from stock_analyzer.payload_store import serialize_payload, store_payload
+from stock_analyzer.services.stock_analyzer.cache import RESULT_CACHE_TTL_SECONDS, TTLCache
+
+from .analyze_schema import AnalyzeRequest, AnalyzeResponse
+
+logger = logging.getLogger("stock_api")
+
 
-from .analyze_schema import AnalyzeRequest
+def _split(value: Optional[str]) -> Tuple[str, ...]:
+    return tuple(item.strip() for item in (value or "").split(",") if item.strip())
 
 
-def perform_analysis(payload: AnalyzeRequest) -> dict:
-    input_data = AnalysisInput(
+def _build_input(payload: AnalyzeRequest) -> AnalysisInput:
+    return AnalysisInput(
         ticker=payload.ticker,
         lang=payload.lang,
         benchmark=payload.benchmark,
         backtest_days=payload.backtest_days,
         relative_window=payload.relative_window,
+        benchmarks=_split(payload.benchmarks),
+        relative_windows=tuple(int(item) for item in _split(payload.relative_windows)),
     )
+
+
+RESPONSE_FIELDS = tuple(AnalyzeResponse.model_fields)
+
+
+@dataclass
+class _EncodedResult:
+    """JSON bytes derived from one cached summary dict.
+
+    ``summary`` is the exact object returned by the analysis cache, so an entry is
+    only reused while the analysis layer keeps handing out the same result.
+    """
+
+    summary: dict
+    history_payload: bytes
+    responses: Dict[Optional[Tuple[str, ...]], bytes] = field(default_factory=dict)
+
+
+_ENCODED_CACHE: TTLCache[_EncodedResult] = TTLCache(
+    "analyze_response", ttl=RESULT_CACHE_TTL_SECONDS
+)
+
+
+def parse_fields(raw: str | None) -> Optional[Tuple[str, ...]]:
+    """Validate a comma-separated ``fields=`` value against the response model."""
+    if not raw:
+        return None
+    requested = [name.strip() for name in raw.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(RESPONSE_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    # Canonical (model) order keeps one cache entry per distinct selection.
+    return tuple(name for name in RESPONSE_FIELDS if name in requested) or None
+
+
+def _encode_response(summary: dict, fields: Optional[Tuple[str, ...]]) -> bytes:
+    model = AnalyzeResponse.model_validate(summary)
+    return model.model_dump_json(include=set(fields) if fields else None).encode("utf-8")
+
+
+async def save_history(input_data: AnalysisInput, raw_payload: bytes) -> None:
+    with ANALYSIS_STAGE_SECONDS.time(stage="db_write"):
+        async with AsyncSessionLocal() as session:
+            payload_hash = await store_payload(session, raw_payload)
+            session.add(
+                AnalysisHistory(
+                    ticker=input_data.ticker.strip().upper(),
+                    lang=input_data.lang,
+                    benchmark=input_data.benchmark,
+                    payload_hash=payload_hash,
+                )
+            )
+            await session.commit()
+
+
+def _analyze_encoded(
+    input_data: AnalysisInput, fields: Optional[Tuple[str, ...]]
+) -> Tuple[bytes, bytes]:
+    """Run (or reuse) the analysis; returns ``(history_payload, response_body)``.
+
+    The history payload and each ``fields`` projection are encoded once per cached
+    summary; repeated requests skip model validation and JSON encoding entirely.
+    """
     result = analyze_stock(input_data)
-    payload_json = json.dumps(result, ensure_ascii=False)
-    history_entry = AnalysisHistory(
-        ticker=input_data.ticker,
-        lang=input_data.lang,
-        benchmark=input_data.benchmark,
-        payload_json=payload_json,
+    key = (
+        input_data.ticker.strip().upper(),
+        input_data.lang,
+        input_data.benchmark,
+        input_data.relative_window,
+        input_data.backtest_days,
+        input_data.benchmarks,
+        input_data.relative_windows,
     )
-    with SessionLocal() as session:
-        session.add(history_entry)
-        session.commit()
-    return result
+    entry = _ENCODED_CACHE.get(key)
+    if entry is None or entry.summary is not result:
+        entry = _EncodedResult(result, serialize_payload(result))
+        _ENCODED_CACHE.set(key, entry)
+    body = entry.responses.get(fields)
+    if body is None:
+        body = entry.responses[fields] = _encode_response(result, fields)
+    return entry.history_payload, body
+
+
+async def perform_analysis(
+    payload: AnalyzeRequest, fields: Optional[Tuple[str, ...]] = None
+) -> bytes:
+    """Return the JSON response body; the analysis runs on a worker thread, the
+    history write on the event loop."""
+    input_data = _build_input(payload)
+    history_payload, body = await run_in_threadpool(_analyze_encoded, input_data, fields)
+    await save_history(input_data, history_payload)
+    return body
+
+
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def stream_analysis_events(payload: AnalyzeRequest) -> AsyncIterator[str]:
+    """Render analysis sections as server-sent events, then store the merged summary."""
+    input_data = _build_input(payload)
+    # Validation errors are raised here, before the response starts streaming.
+    sections = stream_stock_analysis(input_data)
+    return _render_events(input_data, sections)
+
+
+async def _render_events(
+    input_data: AnalysisInput, sections: Iterator[tuple[str, dict]]
+) -> AsyncIterator[str]:
+    from stock_analyzer.services.stock_analyzer.analysis import SUMMARY_ORDER
+
+    parts: dict = {}
+    try:
+        async for name, section in iterate_in_threadpool(sections):
+            parts.update(section)
+            yield _sse_event(name, section)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Streaming analysis failed for %s: %s", input_data.ticker, exc)
+        yield _sse_event("error", {"success": False, "detail": str(exc)})
+        return
+    result = {key: parts[key] for key in SUMMARY_ORDER if key in parts}
+    # Every section has been delivered; a failed history write must not cut the stream.
+    try:
+        await save_history(input_data, serialize_payload(result))
+        saved = True
+    except Exception:  # noqa: BLE001
+        logger.exception("Could not save streamed analysis for %s", input_data.ticker)
+        saved = False
+    yield _sse_event("done", {"ticker": result.get("ticker"), "saved": saved})
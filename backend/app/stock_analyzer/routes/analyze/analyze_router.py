@@ -1,13 +1,36 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 
-from .analyze_crud import perform_analysis
+from .analyze_crud import parse_fields, perform_analysis, stream_analysis_events
 from .analyze_schema import AnalyzeRequest, AnalyzeResponse
 
 router = APIRouter(prefix="/analyze", tags=["Analyze"])
 
 
 @router.post("", response_model=AnalyzeResponse)
-def analyze_endpoint(payload: AnalyzeRequest):
-    return perform_analysis(payload)
+async def analyze_endpoint(
+    payload: AnalyzeRequest,
+    fields: str | None = Query(
+        None,
+        description=(
+            "Comma-separated top-level response fields to return, e.g. scorecard,probability"
+        ),
+    ),
+) -> Response:
+    try:
+        selected = parse_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    content = await perform_analysis(payload, selected)
+    return Response(content=content, media_type="application/json")
+
+
+@router.get("/stream")
+def analyze_stream_endpoint(payload: AnalyzeRequest = Depends()) -> StreamingResponse:
+    return StreamingResponse(
+        stream_analysis_events(payload),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
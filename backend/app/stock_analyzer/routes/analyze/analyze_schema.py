@@ -5,6 +5,16 @@ from typing import Any, List, Optional
 from pydantic import BaseModel, Field
 
 
+# Each extra benchmark is a provider download and each list a separate result-cache entry.
+MAX_BENCHMARKS = 10
+MAX_RELATIVE_WINDOWS = 10
+
+
+def _comma_list(item: str, limit: int) -> str:
+    """Pattern for 1..``limit`` comma-separated ``item``s."""
+    return rf"^\s*{item}(\s*,\s*{item}){{0,{limit - 1}}}\s*$"
+
+
 class AnalyzeRequest(BaseModel):
     ticker: str = Field(..., description="분석할 티커")
     lang: str = Field("ko", description="언어 코드 (ko/en)")
@@ -15,6 +25,16 @@ class AnalyzeRequest(BaseModel):
     relative_window: Optional[int] = Field(
         None, ge=20, description="벤치마크와 상대 성과를 비교할 이동 창 길이"
     )
+    benchmarks: Optional[str] = Field(
+        None,
+        pattern=_comma_list(r"[^,\s]{1,32}", MAX_BENCHMARKS),
+        description=f"함께 비교할 추가 벤치마크, 쉼표 구분, 최대 {MAX_BENCHMARKS}개 (예: QQQ,XLK,^KS11)",
+    )
+    relative_windows: Optional[str] = Field(
+        None,
+        pattern=_comma_list(r"\d{1,4}", MAX_RELATIVE_WINDOWS),
+        description=f"함께 비교할 추가 창 길이, 쉼표 구분, 최대 {MAX_RELATIVE_WINDOWS}개 (예: 20,120)",
+    )
 
 
 class Decision(BaseModel):
@@ -95,6 +115,15 @@ class Scorecard(BaseModel):
     category_scores: List[ScoreCategory]
 
 
+class RelativePerformance(BaseModel):
+    benchmark: str
+    window_days: int
+    ticker_return: float
+    benchmark_return: float
+    alpha_pct: float
+    label_key: str
+
+
 class AnalyzeResponse(BaseModel):
     ticker: str
     latest_date: str
@@ -108,3 +137,4 @@ class AnalyzeResponse(BaseModel):
     volume: VolumeInfo
     probability: Probability
     scorecard: Scorecard
+    relative_performance_table: Optional[List[RelativePerformance]] = None
@@ -1,34 +1,127 @@
 from __future__ import annotations
 
-import json
+import base64
+import binascii
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Query
-from sqlalchemy import select
+from fastapi import APIRouter, HTTPException, Query, Response
+from sqlalchemy import and_, or_, select
 
-from stock_analyzer.db import SessionLocal
-from stock_analyzer.models import AnalysisHistory
+from stock_analyzer.db import AsyncSessionLocal
+from stock_analyzer.models import AnalysisHistory, AnalysisPayload
+from stock_analyzer.payload_store import decompress_payload
 
 router = APIRouter(prefix="/history", tags=["History"])
 
+HISTORY_FIELDS = ("id", "ticker", "lang", "benchmark", "created_at", "payload")
+DEFAULT_FIELDS = ("ticker", "lang", "benchmark", "created_at", "payload")
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(row_id: int) -> str:
+    """Cursor for the page after ``row_id``.
+
+    The row's stored ``created_at`` is looked up, not re-parsed.
+    """
+    return base64.urlsafe_b64encode(str(row_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded).decode()
+        # Older cursors were "<created_at>|<id>"; only the id is used.
+        return int(raw.rsplit("|", 1)[-1])
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Naive UTC, matching how ``created_at`` is stored."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _parse_fields(fields: str | None) -> tuple[str, ...]:
+    if not fields:
+        return DEFAULT_FIELDS
+    requested = tuple(dict.fromkeys(item.strip() for item in fields.split(",") if item.strip()))
+    unknown = [name for name in requested if name not in HISTORY_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return requested or DEFAULT_FIELDS
+
 
 @router.get("")
-def list_history(limit: int = Query(20, ge=1, le=200)) -> list[dict]:
-    with SessionLocal() as session:
-        stmt = select(AnalysisHistory).order_by(AnalysisHistory.created_at.desc()).limit(limit)
-        rows = session.execute(stmt).scalars().all()
+async def list_history(
+    response: Response,
+    limit: int = Query(20, ge=1, le=200),
+    cursor: str | None = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    ticker: str | None = Query(None),
+    since: datetime | None = Query(None, description="Only entries created at or after this time"),
+    until: datetime | None = Query(None, description="Only entries created before this time"),
+    fields: str | None = Query(
+        None, description=f"Comma-separated subset of {', '.join(HISTORY_FIELDS)}"
+    ),
+) -> list[dict]:
+    selected = _parse_fields(fields)
+    stmt = select(
+        AnalysisHistory.id,
+        AnalysisHistory.created_at,
+        AnalysisHistory.ticker,
+        AnalysisHistory.lang,
+        AnalysisHistory.benchmark,
+    )
+    if "payload" in selected:
+        stmt = stmt.add_columns(AnalysisPayload.data, AnalysisHistory.payload_json).outerjoin(
+            AnalysisPayload, AnalysisPayload.hash == AnalysisHistory.payload_hash
+        )
+    if ticker:
+        stmt = stmt.where(AnalysisHistory.ticker == ticker.strip().upper())
+    if since:
+        stmt = stmt.where(AnalysisHistory.created_at >= _as_utc(since))
+    if until:
+        stmt = stmt.where(AnalysisHistory.created_at < _as_utc(until))
+    if cursor:
+        cursor_id = decode_cursor(cursor)
+        # Compare against the cursor row's stored value so the boundary is exact
+        # whatever format the database keeps timestamps in.
+        cursor_created_at = (
+            select(AnalysisHistory.created_at)
+            .where(AnalysisHistory.id == cursor_id)
+            .scalar_subquery()
+        )
+        stmt = stmt.where(
+            or_(
+                AnalysisHistory.created_at < cursor_created_at,
+                and_(
+                    AnalysisHistory.created_at == cursor_created_at,
+                    AnalysisHistory.id < cursor_id,
+                ),
+            )
+        )
+    stmt = stmt.order_by(AnalysisHistory.created_at.desc(), AnalysisHistory.id.desc()).limit(
+        limit + 1
+    )
+
+    async with AsyncSessionLocal() as session:
+        rows = (await session.execute(stmt)).all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.id)
+
     history = []
     for row in rows:
-        try:
-            payload = json.loads(row.payload_json)
-        except json.JSONDecodeError:
-            payload = None
-        history.append(
-            {
-                "ticker": row.ticker,
-                "lang": row.lang,
-                "benchmark": row.benchmark,
-                "created_at": row.created_at.isoformat() if row.created_at else None,
-                "payload": payload,
-            }
-        )
+        entry = {}
+        for name in selected:
+            if name == "payload":
+                entry["payload"] = decompress_payload(row.data, row.payload_json)
+            elif name == "created_at":
+                entry["created_at"] = row.created_at.isoformat() if row.created_at else None
+            else:
+                entry[name] = getattr(row, name)
+        history.append(entry)
     return history
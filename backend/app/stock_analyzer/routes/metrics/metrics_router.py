@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from stock_analyzer.metrics import render_latest
+
+router = APIRouter(tags=["Metrics"])
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def read_metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query
+
+from stock_analyzer.services.language import get_language
+
+router = APIRouter(prefix="/series", tags=["Series"])
+
+
+@router.get("/{ticker}")
+def read_series(
+    ticker: str,
+    period: Literal["1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"] = Query("1y"),
+    start: date | None = Query(None),
+    end: date | None = Query(None),
+    points: int = Query(
+        1000, ge=10, le=5000, description="Maximum points after LTTB downsampling"
+    ),
+    lang: str = Query("ko"),
+    scores: bool = Query(False, description="Include the point-in-time scorecard columns"),
+) -> dict:
+    from stock_analyzer.services.stock_analyzer.analysis import load_price_history
+    from stock_analyzer.services.stock_analyzer.series import build_chart_series
+
+    symbol = ticker.strip().upper()
+    if not symbol:
+        raise HTTPException(status_code=400, detail="Ticker is required")
+    try:
+        history = load_price_history(symbol, get_language(lang), period)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    series = build_chart_series(
+        history,
+        start=start.isoformat() if start else None,
+        end=end.isoformat() if end else None,
+        points=points,
+        scores=scores,
+    )
+    return {"ticker": symbol, "period": period, **series}
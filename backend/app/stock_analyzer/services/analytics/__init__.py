@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from .leaderboard import WINDOWS, TickerLeaderboard
+
+__all__ = ["WINDOWS", "TickerLeaderboard"]
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterable, List, Tuple
+
+WINDOW_HOUR = "hour"
+WINDOW_DAY = "day"
+WINDOW_WEEK = "week"
+WINDOW_ALL = "all"
+WINDOW_DECAY = "decay"
+WINDOWS = (WINDOW_HOUR, WINDOW_DAY, WINDOW_WEEK, WINDOW_ALL, WINDOW_DECAY)
+
+# (bucket width in seconds, number of buckets) for each rolling window.
+ROLLING_WINDOWS: Dict[str, Tuple[int, int]] = {
+    WINDOW_HOUR: (60, 60),
+    WINDOW_DAY: (900, 96),
+    WINDOW_WEEK: (3600, 168),
+}
+
+# Rebase the forward-decay landmark before exp() gets anywhere near overflow.
+_MAX_DECAY_EXPONENT = 50.0
+
+
+class _RankedCounts:
+    """Per-ticker totals plus a lazily invalidated max-heap for top-K queries.
+
+    Every change pushes a fresh ``(-value, ticker)`` entry; entries whose value no
+    longer matches ``totals`` are discarded when they surface. A query therefore
+    pops about K live entries (O(K log N)) and the heap is compacted whenever
+    stale entries dominate.
+    """
+
+    def __init__(self) -> None:
+        self.totals: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+
+    def add(self, ticker: str, amount: float) -> None:
+        value = self.totals.get(ticker, 0.0) + amount
+        if value <= 1e-12:
+            self.totals.pop(ticker, None)
+        else:
+            self.totals[ticker] = value
+            heapq.heappush(self._heap, (-value, ticker))
+        if len(self._heap) > 4 * len(self.totals) + 64:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        self._heap = [(-value, ticker) for ticker, value in self.totals.items()]
+        heapq.heapify(self._heap)
+
+    def scale(self, factor: float) -> None:
+        self.totals = {ticker: value * factor for ticker, value in self.totals.items()}
+        self.rebuild()
+
+    def top(self, limit: int) -> List[Tuple[str, float]]:
+        result: List[Tuple[str, float]] = []
+        live: List[Tuple[float, str]] = []
+        seen: set[str] = set()
+        while self._heap and len(result) < limit:
+            entry = heapq.heappop(self._heap)
+            neg_value, ticker = entry
+            if ticker in seen or self.totals.get(ticker) != -neg_value:
+                continue
+            seen.add(ticker)
+            live.append(entry)
+            result.append((ticker, -neg_value))
+        for entry in live:
+            heapq.heappush(self._heap, entry)
+        return result
+
+
+@dataclass
+class _RollingWindow:
+    bucket_seconds: int
+    bucket_count: int
+    buckets: Deque[Tuple[int, Dict[str, int]]] = field(default_factory=deque)
+    ranked: _RankedCounts = field(default_factory=_RankedCounts)
+
+    def expire(self, now: float) -> None:
+        oldest_allowed = int(now // self.bucket_seconds) - self.bucket_count + 1
+        while self.buckets and self.buckets[0][0] < oldest_allowed:
+            _, counts = self.buckets.popleft()
+            for ticker, count in counts.items():
+                self.ranked.add(ticker, -count)
+
+    def record(self, ticker: str, now: float, amount: int) -> None:
+        self.expire(now)
+        index = int(now // self.bucket_seconds)
+        if not self.buckets or self.buckets[-1][0] != index:
+            self.buckets.append((index, {}))
+        counts = self.buckets[-1][1]
+        counts[ticker] = counts.get(ticker, 0) + amount
+        self.ranked.add(ticker, amount)
+
+
+class TickerLeaderboard:
+    """In-memory request counts per ticker over rolling hour/day/week windows.
+
+    Each worker process keeps its own instance: the rolling and ``decay`` windows
+    only count the requests that worker served and restart empty, so with
+    several workers they differ from worker to worker.
+
+    ``all`` holds all-time counts (seeded from and flushed to ``ticker_stats`` by
+    the caller-supplied loader/persister), and ``decay`` ranks tickers by an
+    exponentially decayed count using forward decay, so recording never has to
+    touch other tickers' scores.
+    """
+
+    def __init__(
+        self,
+        *,
+        half_life_seconds: float = 24 * 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._rolling = {
+            name: _RollingWindow(width, count) for name, (width, count) in ROLLING_WINDOWS.items()
+        }
+        self._all = _RankedCounts()
+        self._decay = _RankedCounts()
+        self._decay_rate = math.log(2) / half_life_seconds if half_life_seconds > 0 else 0.0
+        self._landmark = clock()
+        self._pending: Dict[str, int] = {}
+        self.loaded = False
+
+    def load(self, counts: Iterable[Tuple[str, int]]) -> None:
+        """Seed all-time counts, keeping anything recorded before the load."""
+        with self._lock:
+            for ticker, count in counts:
+                if count:
+                    self._all.add(ticker, float(count))
+            self.loaded = True
+
+    def record(self, ticker: str, amount: int = 1) -> None:
+        if not ticker:
+            return
+        with self._lock:
+            now = self._clock()
+            for window in self._rolling.values():
+                window.record(ticker, now, amount)
+            self._all.add(ticker, float(amount))
+            self._record_decay(ticker, now, amount)
+            self._pending[ticker] = self._pending.get(ticker, 0) + amount
+
+    def _record_decay(self, ticker: str, now: float, amount: int) -> None:
+        if not self._decay_rate:
+            self._decay.add(ticker, float(amount))
+            return
+        exponent = self._decay_rate * (now - self._landmark)
+        if exponent > _MAX_DECAY_EXPONENT:
+            self._decay.scale(math.exp(-exponent))
+            self._landmark = now
+            exponent = 0.0
+        self._decay.add(ticker, amount * math.exp(exponent))
+
+    def top(self, limit: int = 10, window: str = WINDOW_ALL) -> List[dict]:
+        if window not in WINDOWS:
+            raise ValueError(f"Unknown window: {window}")
+        with self._lock:
+            now = self._clock()
+            if window in self._rolling:
+                rolling = self._rolling[window]
+                rolling.expire(now)
+                return [
+                    {"ticker": ticker, "count": int(count)}
+                    for ticker, count in rolling.ranked.top(limit)
+                ]
+            if window == WINDOW_ALL:
+                return [
+                    {"ticker": ticker, "count": int(count)}
+                    for ticker, count in self._all.top(limit)
+                ]
+            factor = math.exp(-self._decay_rate * (now - self._landmark))
+            return [
+                {"ticker": ticker, "count": round(score * factor, 4)}
+                for ticker, score in self._decay.top(limit)
+            ]
+
+    def drain_pending(self) -> Dict[str, int]:
+        """Hand over increments recorded since the last drain for persistence."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def restore_pending(self, pending: Dict[str, int]) -> None:
+        """Put back increments whose persistence failed so the next flush retries them."""
+        with self._lock:
+            for ticker, count in pending.items():
+                self._pending[ticker] = self._pending.get(ticker, 0) + count
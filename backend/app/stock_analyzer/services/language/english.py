@@ -105,6 +105,7 @@ MESSAGES = {
     "probability_note": "Probabilities are derived from a weighted blend of the indicators above and should be used with other research.",
     "relative_summary": "Relative to {benchmark} over {window} trading days → {label} (alpha {alpha}).",
     "relative_returns": "Return comparison: ticker {ticker} vs benchmark {benchmark}.",
+    "relative_table_line": "- {benchmark}, {window} days: alpha {alpha} ({ticker} vs {benchmark_return})",
     "relative_label_outperform": "Outperforming benchmark",
     "relative_label_underperform": "Lagging benchmark",
     "relative_label_neutral": "In line with benchmark",
@@ -113,6 +114,20 @@ MESSAGES = {
     "risk_mdd_180": "Max drawdown (180d)",
     "risk_atr": "ATR(14)",
     "risk_stop_loss": "Suggested stop-loss",
+    "risk_mc_var": "{days}d VaR (95%, simulated)",
+    "risk_mc_cvar": "{days}d CVaR (95%, simulated)",
+    "risk_mc_stop_hit": "Chance of hitting the stop-loss within {days}d",
+    "risk_mc_drawdown": "{days}d drawdown, median / 95th percentile",
+    "risk_mc_drawdown_value": "{median} / {tail}",
+    "screen_no_match": "No ticker matched the filters.",
+    "screen_column_ticker": "Ticker",
+    "screen_column_price": "Price",
+    "screen_column_change": "1d",
+    "screen_column_rsi": "RSI",
+    "screen_column_score": "Score",
+    "screen_column_rating": "Rating",
+    "screen_column_signal": "Signal",
+    "screen_column_position": "Channel",
     "risk_metric_line": "- {label}: {value}",
     "risk_level_line": "Risk level: {label}",
     "risk_level_low": "Low",
@@ -132,10 +147,13 @@ MESSAGES = {
   stock-cli analyze --export json           # Save as JSON
   stock-cli interactive                     # Interactive mode
   stock-cli export AAPL --format json       # Export after analysis
+  stock-cli screen -u sp500.txt --filter "rsi<30" --top 20   # Screen a universe
 """,
     "cli.parser.subcommands_help": "Available commands",
     "cli.parser.option.lang": "Language code (ko, en)",
     "cli.parser.option.benchmark": "Benchmark ticker (default SPY)",
+    "cli.parser.option.benchmarks": "Extra comma-separated benchmarks to compare against (e.g. QQQ,XLK,^KS11)",
+    "cli.parser.option.relative_windows": "Extra comma-separated relative-performance windows in trading days (e.g. 20,120)",
     "cli.parser.option.backtest": "Lookback window (days) for simple backtest",
     "cli.parser.analyze.help": "Stock ticker analysis",
     "cli.parser.analyze.description": "Technical analysis using Yahoo Finance data",
@@ -151,6 +169,16 @@ MESSAGES = {
     "cli.parser.export.format": "Export format (required)",
     "cli.parser.export.json_path": "JSON storage path",
     "cli.parser.export.csv_path": "CSV storage path",
+    "cli.parser.screen.help": "Screen a universe of tickers by price-only score",
+    "cli.parser.screen.description": "Download a universe in batches, score every ticker in one vectorized pass, then filter and rank",
+    "cli.parser.screen.tickers": "Ticker symbols to screen (added to --universe)",
+    "cli.parser.screen.universe": "Ticker list file (whitespace/comma separated, # comments); repeatable",
+    "cli.parser.screen.filter": "Filter such as rsi<30, score>70 or position=lower; repeatable",
+    "cli.parser.screen.sort": "Column to rank by (default score)",
+    "cli.parser.screen.top": "Show the N highest (default 20)",
+    "cli.parser.screen.bottom": "Show the N lowest",
+    "cli.parser.screen.period": "Download period (default 1y)",
+    "cli.parser.screen.benchmark": "Benchmark for market momentum (default ^GSPC, ^KS11 for .KS/.KQ)",
     "cli.prompt.user": "\033[38;5;111mYou\033[0m      > ",
     "cli.prompt.assistant": "\033[38;5;213mAssistant\033[0m  > ",
     "cli.prompt.confirm_exit": "Press Enter again if you'd like to exit.",
@@ -161,6 +189,9 @@ MESSAGES = {
     "cli.process.error": "I couldn't load that ticker.",
     "cli.process.error_detail": "Error detail: {error}",
     "cli.process.hint": "Please verify the ticker symbol (e.g., AAPL, TSLA, GOOGL).",
+    "cli.screen.fetching": "Loading price history for {count} tickers...",
+    "cli.screen.summary": "Screened {screened}/{requested} tickers in {seconds}s: {matched} matched the filters, {shown} shown.",
+    "cli.screen.error": "❌ {error}",
     "cli.export.skip": "Skipping the export.",
     "cli.export.default_path": "Default path: {path}",
     "cli.export.path_prompt": "Save path (Enter=default): ",
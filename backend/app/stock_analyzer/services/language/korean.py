@@ -105,6 +105,7 @@ MESSAGES = {
     "probability_note": "상승 확률은 위 보조지표를 가중 평균한 값으로, 추가 리서치와 함께 참고하세요.",
     "relative_summary": "{benchmark} 대비 {window}거래일 성과: {label} (알파 {alpha}).",
     "relative_returns": "수익률 비교: 종목 {ticker}, 벤치마크 {benchmark}.",
+    "relative_table_line": "- {benchmark}, {window}거래일: 알파 {alpha} (종목 {ticker} / 벤치마크 {benchmark_return})",
     "relative_label_outperform": "벤치마크 대비 우위",
     "relative_label_underperform": "벤치마크 대비 열위",
     "relative_label_neutral": "벤치마크와 유사",
@@ -113,6 +114,20 @@ MESSAGES = {
     "risk_mdd_180": "최대 낙폭 (180일)",
     "risk_atr": "ATR(14)",
     "risk_stop_loss": "제안 손절선",
+    "risk_mc_var": "{days}일 VaR (95%, 시뮬레이션)",
+    "risk_mc_cvar": "{days}일 CVaR (95%, 시뮬레이션)",
+    "risk_mc_stop_hit": "{days}일 내 손절선 도달 확률",
+    "risk_mc_drawdown": "{days}일 낙폭 중앙값 / 95퍼센타일",
+    "risk_mc_drawdown_value": "{median} / {tail}",
+    "screen_no_match": "필터 조건에 맞는 종목이 없습니다.",
+    "screen_column_ticker": "티커",
+    "screen_column_price": "가격",
+    "screen_column_change": "1일",
+    "screen_column_rsi": "RSI",
+    "screen_column_score": "점수",
+    "screen_column_rating": "등급",
+    "screen_column_signal": "신호",
+    "screen_column_position": "채널",
     "risk_metric_line": "- {label}: {value}",
     "risk_level_line": "리스크 등급: {label}",
     "risk_level_low": "낮음",
@@ -132,10 +147,13 @@ MESSAGES = {
   stock-cli analyze --export json           # JSON으로 저장
   stock-cli interactive                     # 대화형 모드
   stock-cli export AAPL --format json       # 분석 후 바로 내보내기
+  stock-cli screen -u sp500.txt --filter "rsi<30" --top 20   # 유니버스 스크리닝
 """,
     "cli.parser.subcommands_help": "사용 가능한 명령어",
     "cli.parser.option.lang": "언어 코드 (ko, en)",
     "cli.parser.option.benchmark": "비교할 벤치마크 티커 (기본 SPY)",
+    "cli.parser.option.benchmarks": "함께 비교할 추가 벤치마크, 쉼표 구분 (예: QQQ,XLK,^KS11)",
+    "cli.parser.option.relative_windows": "함께 비교할 추가 상대 성과 기간(거래일), 쉼표 구분 (예: 20,120)",
     "cli.parser.option.backtest": "단순 백테스트 기간(일)",
     "cli.parser.analyze.help": "주식 티커 분석",
     "cli.parser.analyze.description": "Yahoo Finance 데이터를 활용한 기술적 분석",
@@ -151,6 +169,16 @@ MESSAGES = {
     "cli.parser.export.format": "필수 저장 형식",
     "cli.parser.export.json_path": "JSON 저장 경로",
     "cli.parser.export.csv_path": "CSV 저장 경로",
+    "cli.parser.screen.help": "가격 기반 점수로 종목 유니버스 스크리닝",
+    "cli.parser.screen.description": "유니버스를 일괄 다운로드해 한 번에 벡터 연산으로 점수를 매기고 필터링·정렬합니다",
+    "cli.parser.screen.tickers": "스크리닝할 티커 심볼 (--universe에 추가)",
+    "cli.parser.screen.universe": "티커 목록 파일 (공백/쉼표 구분, # 주석), 여러 번 사용 가능",
+    "cli.parser.screen.filter": "rsi<30, score>70, position=lower 같은 필터, 여러 번 사용 가능",
+    "cli.parser.screen.sort": "정렬 기준 열 (기본 score)",
+    "cli.parser.screen.top": "상위 N개 표시 (기본 20)",
+    "cli.parser.screen.bottom": "하위 N개 표시",
+    "cli.parser.screen.period": "다운로드 기간 (기본 1y)",
+    "cli.parser.screen.benchmark": "시장 모멘텀 벤치마크 (기본 ^GSPC, .KS/.KQ는 ^KS11)",
     "cli.prompt.user": "\033[38;5;111mYou\033[0m      > ",
     "cli.prompt.assistant": "\033[38;5;213mAssistant\033[0m  > ",
     "cli.prompt.confirm_exit": "엔터를 한 번 더 누르면 종료할게요.",
@@ -161,6 +189,9 @@ MESSAGES = {
     "cli.process.error": "데이터를 가져오지 못했어요.",
     "cli.process.error_detail": "상세 오류: {error}",
     "cli.process.hint": "티커 심볼이 올바른지 확인해주세요. (예: AAPL, TSLA, 005930.KS)",
+    "cli.screen.fetching": "{count}개 종목의 가격 데이터를 불러오는 중입니다...",
+    "cli.screen.summary": "{requested}개 중 {screened}개 종목을 {seconds}초 만에 스크리닝했습니다: 필터 통과 {matched}개, 표시 {shown}개.",
+    "cli.screen.error": "❌ {error}",
     "cli.export.skip": "저장은 건너뛸게요.",
     "cli.export.default_path": "기본 경로: {path}",
     "cli.export.path_prompt": "저장 경로 (Enter=기본 경로): ",
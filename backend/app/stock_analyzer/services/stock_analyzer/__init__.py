@@ -1,5 +1,13 @@
 from __future__ import annotations
 
-from .analysis import analyze_ticker
-
 __all__ = ["analyze_ticker"]
+
+
+def __getattr__(name: str):
+    # Resolved on first use so importing a light submodule (e.g. ``cache``) does
+    # not pull in pandas/yfinance through ``analysis``.
+    if name == "analyze_ticker":
+        from .analysis import analyze_ticker
+
+        return analyze_ticker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,30 +1,77 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Iterator, Sequence
 
 import pandas as pd
-import yfinance as yf
 
-from .data import fetch_price_history
+from .data import fetch_histories, fetch_price_history, history_matrix
 from .indicators import (
     compute_atr,
     compute_channel_overview,
     compute_macd,
     compute_max_drawdown,
-    compute_relative_strength,
+    compute_relative_performance,
     compute_rsi,
     compute_support_resistance,
     compute_volatility,
     determine_signal,
 )
+from stock_analyzer.metrics import ANALYSES_IN_FLIGHT, ANALYSIS_STAGE_SECONDS, PROVIDER_ERRORS
 from stock_analyzer.services.language import LanguagePack, LANGUAGE_KO
 
+from .cache import (
+    FUNDAMENTALS_CACHE_TTL_SECONDS,
+    PRICE_CACHE_TTL_SECONDS,
+    RESULT_CACHE_TTL_SECONDS,
+    TTLCache,
+)
+from .provider import get_provider
+from .montecarlo import simulate_risk
 from .scoring import build_scorecard, calculate_probability
+from .shared_cache import shared_tier
+from .singleflight import SingleFlight
 from .utils import format_date, normalize_timestamp, safe_float
 
 DEFAULT_BENCHMARK = "SPY"
 DEFAULT_REL_WINDOW = 60
-_BENCHMARK_CACHE: Dict[str, pd.DataFrame] = {}
+DEFAULT_PERIOD = "1y"
+
+_PRICE_CACHE: TTLCache[pd.DataFrame] = TTLCache(
+    "price_history", ttl=PRICE_CACHE_TTL_SECONDS, shared=shared_tier("price_history")
+)
+_BENCHMARK_CACHE: TTLCache[pd.DataFrame] = TTLCache(
+    "benchmark", ttl=PRICE_CACHE_TTL_SECONDS, max_entries=64, shared=shared_tier("benchmark")
+)
+_FUNDAMENTALS_CACHE: TTLCache[tuple] = TTLCache(
+    "fundamentals", ttl=FUNDAMENTALS_CACHE_TTL_SECONDS, shared=shared_tier("fundamentals")
+)
+_RESULT_CACHE: TTLCache[dict] = TTLCache(
+    "analysis", ttl=RESULT_CACHE_TTL_SECONDS, shared=shared_tier("analysis")
+)
+# Concurrent identical requests share one computation / one provider download.
+_ANALYSIS_FLIGHT = SingleFlight("analysis")
+_PRICE_FLIGHT = SingleFlight("price_history")
+_FUNDAMENTALS_FLIGHT = SingleFlight("fundamentals")
+
+
+SUMMARY_ORDER = (
+    "ticker",
+    "latest_date",
+    "latest_close",
+    "macd",
+    "rsi",
+    "decision",
+    "support_resistance",
+    "channels",
+    "moving_averages",
+    "volume",
+    "scorecard",
+    "probability",
+    "risk",
+    "relative_performance",
+    "relative_performance_table",
+    "backtest",
+)
 
 
 def analyze_ticker(
@@ -34,14 +81,179 @@ def analyze_ticker(
     benchmark_symbol: str | None = None,
     relative_window: int = DEFAULT_REL_WINDOW,
     backtest_days: int | None = None,
+    benchmarks: Sequence[str] = (),
+    relative_windows: Sequence[int] = (),
 ) -> dict:
+    """Run the full analysis, reusing a recent result or an identical in-flight call.
+
+    ``benchmarks`` and ``relative_windows`` add a ``relative_performance_table``
+    comparing the ticker with every benchmark (``benchmark_symbol`` included) over
+    every window. Results are cached for ``RESULT_CACHE_TTL_SECONDS`` and shared
+    between callers, so the returned dict must be treated as read-only.
+    """
     lang = lang or LANGUAGE_KO
     benchmark_symbol = (benchmark_symbol or DEFAULT_BENCHMARK).upper()
+    benchmarks, relative_windows = _relative_targets(
+        benchmark_symbol, benchmarks, relative_window, relative_windows
+    )
+    key = (
+        ticker,
+        lang.code,
+        benchmark_symbol,
+        relative_window,
+        backtest_days,
+        benchmarks,
+        relative_windows,
+    )
+    cached = _RESULT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    return _ANALYSIS_FLIGHT.do(
+        key,
+        _analyze_and_cache,
+        key,
+        ticker,
+        lang,
+        benchmark_symbol=benchmark_symbol,
+        relative_window=relative_window,
+        backtest_days=backtest_days,
+        benchmarks=benchmarks,
+        relative_windows=relative_windows,
+    )
+
+
+def _relative_targets(
+    benchmark_symbol: str,
+    benchmarks: Sequence[str],
+    relative_window: int,
+    relative_windows: Sequence[int],
+) -> tuple[tuple[str, ...], tuple[int, ...]]:
+    """Extra benchmarks and windows, upper-cased, de-duplicated and without the primary ones."""
+    extra_benchmarks = (symbol.strip().upper() for symbol in benchmarks if symbol.strip())
+    extra_windows = (int(value) for value in relative_windows)
+    return (
+        tuple(symbol for symbol in dict.fromkeys(extra_benchmarks) if symbol != benchmark_symbol),
+        tuple(window for window in dict.fromkeys(extra_windows) if window != relative_window),
+    )
+
+
+def refresh_analysis(
+    ticker: str,
+    langs: Sequence[LanguagePack],
+    *,
+    benchmark_symbol: str | None = None,
+    relative_window: int = DEFAULT_REL_WINDOW,
+    ttl: float | None = None,
+) -> None:
+    """Re-download ``ticker`` and store fresh results for each language.
+
+    Used by the pre-warming scheduler; ``ttl`` overrides the result cache TTL so
+    warmed entries can outlive ordinary ones.
+    """
+    benchmark_symbol = (benchmark_symbol or DEFAULT_BENCHMARK).upper()
+    _PRICE_CACHE.delete((ticker, DEFAULT_PERIOD))
+    _FUNDAMENTALS_CACHE.delete(ticker)
+    for lang in langs:
+        key = (ticker, lang.code, benchmark_symbol, relative_window, None, (), ())
+        _ANALYSIS_FLIGHT.do(
+            key,
+            _analyze_and_cache,
+            key,
+            ticker,
+            lang,
+            benchmark_symbol=benchmark_symbol,
+            relative_window=relative_window,
+            backtest_days=None,
+            benchmarks=(),
+            relative_windows=(),
+            ttl=ttl,
+        )
+
+
+def _analyze_and_cache(
+    key: tuple,
+    ticker: str,
+    lang: LanguagePack,
+    *,
+    benchmark_symbol: str,
+    relative_window: int,
+    backtest_days: int | None,
+    benchmarks: Sequence[str],
+    relative_windows: Sequence[int],
+    ttl: float | None = None,
+) -> dict:
+    parts: dict = {}
+    for _, section in iter_analysis_sections(
+        ticker,
+        lang,
+        benchmark_symbol=benchmark_symbol,
+        relative_window=relative_window,
+        backtest_days=backtest_days,
+        benchmarks=benchmarks,
+        relative_windows=relative_windows,
+    ):
+        parts.update(section)
+    summary = {name: parts[name] for name in SUMMARY_ORDER if name in parts}
+    _RESULT_CACHE.set(key, summary, ttl)
+    return summary
+
+
+def iter_analysis_sections(
+    ticker: str,
+    lang: LanguagePack | None = None,
+    *,
+    benchmark_symbol: str | None = None,
+    relative_window: int = DEFAULT_REL_WINDOW,
+    backtest_days: int | None = None,
+    benchmarks: Sequence[str] = (),
+    relative_windows: Sequence[int] = (),
+) -> Iterator[tuple[str, dict]]:
+    """Yield ``(section, summary_fragment)`` pairs as soon as each one is computed.
+
+    Price-derived sections come straight after the price download; benchmark
+    sections follow, and the scorecard/probability close the stream once the
+    slower fundamentals and news lookups finish. Merging every fragment yields
+    the same summary that ``analyze_ticker`` returns.
+    """
+    benchmark_symbol = (benchmark_symbol or DEFAULT_BENCHMARK).upper()
     relative_window = max(relative_window, 20)
-    history = fetch_price_history(ticker, lang)
+    benchmarks, relative_windows = _relative_targets(
+        benchmark_symbol,
+        benchmarks,
+        relative_window,
+        [max(window, 20) for window in relative_windows],
+    )
+    with ANALYSES_IN_FLIGHT.track_inprogress():
+        yield from _iter_sections(
+            ticker,
+            lang or LANGUAGE_KO,
+            benchmark_symbol,
+            relative_window,
+            backtest_days,
+            benchmarks,
+            relative_windows,
+        )
+
+
+def _iter_sections(
+    ticker: str,
+    lang: LanguagePack,
+    benchmark_symbol: str,
+    relative_window: int,
+    backtest_days: int | None,
+    benchmarks: tuple[str, ...],
+    relative_windows: tuple[int, ...],
+) -> Iterator[tuple[str, dict]]:
+    with ANALYSIS_STAGE_SECONDS.time(stage="price_history"):
+        try:
+            history = load_price_history(ticker, lang)
+        except Exception:
+            PROVIDER_ERRORS.inc(call="price_history")
+            raise
     close = history["Close"]
-    macd_df = compute_macd(close)
-    rsi_series = compute_rsi(close)
+    with ANALYSIS_STAGE_SECONDS.time(stage="indicators"):
+        macd_df = compute_macd(close)
+        rsi_series = compute_rsi(close)
 
     latest_idx = close.index[-1]
     latest_price = close.iloc[-1]
@@ -50,36 +262,91 @@ def analyze_ticker(
     hist_val = macd_df["hist"].iloc[-1]
     rsi_val = rsi_series.iloc[-1]
 
+    yield "price", {
+        "ticker": ticker,
+        "latest_date": normalize_timestamp(latest_idx),
+        "latest_close": float(latest_price),
+    }
+    yield "macd", {
+        "macd": {
+            "macd": safe_float(macd_val),
+            "signal": safe_float(signal_val),
+            "hist": safe_float(hist_val),
+        }
+    }
+    yield "rsi", {"rsi": safe_float(rsi_val)}
+
     action_key, rationale_key = determine_signal(macd_val, signal_val, rsi_val)
-    action = lang.t(action_key)
-    rationale = lang.t(rationale_key)
+    yield "decision", {
+        "decision": {"action": lang.t(action_key), "rationale": lang.t(rationale_key)}
+    }
+
+    with ANALYSIS_STAGE_SECONDS.time(stage="channels"):
+        support_info = compute_support_resistance(close)
+        channel_set = compute_channel_overview(close)
+    yield "support_resistance", {
+        "support_resistance": {
+            **support_info,
+            "support_date": format_date(support_info["support_date"]),
+            "resistance_date": format_date(support_info["resistance_date"]),
+        }
+        if support_info
+        else {}
+    }
+    yield "channels", {"channels": channel_set}
 
-    support_info = compute_support_resistance(close)
-    channel_set = compute_channel_overview(close)
     sma20 = close.tail(20).mean()
     sma50 = close.tail(50).mean() if len(close) >= 50 else float("nan")
+    yield "moving_averages", {
+        "moving_averages": {
+            "sma20": safe_float(sma20),
+            "sma50": safe_float(sma50),
+        }
+    }
     volume_latest = history["Volume"].iloc[-1] if "Volume" in history else float("nan")
     volume_avg20 = (
         history["Volume"].tail(20).mean() if "Volume" in history else float("nan")
     )
+    yield "volume", {
+        "volume": {
+            "latest": safe_float(volume_latest),
+            "avg20": safe_float(volume_avg20),
+        }
+    }
 
-    benchmark_history = _get_benchmark_history(benchmark_symbol, lang)
-    benchmark_close = (
-        benchmark_history["Close"].copy()
-        if benchmark_history is not None and "Close" in benchmark_history
-        else None
+    with ANALYSIS_STAGE_SECONDS.time(stage="risk"):
+        risk_summary = _build_risk_summary(history, latest_price)
+    if risk_summary:
+        yield "risk", {"risk": risk_summary}
+
+    with ANALYSIS_STAGE_SECONDS.time(stage="benchmark"):
+        benchmark_histories = _get_benchmark_histories((benchmark_symbol, *benchmarks), lang)
+        benchmark_history = benchmark_histories.get(benchmark_symbol)
+        benchmark_close = (
+            benchmark_history["Close"].copy()
+            if benchmark_history is not None and "Close" in benchmark_history
+            else None
+        )
+        # Every (benchmark, window) pair in one pass; the first row for the
+        # primary benchmark is its ``relative_window`` comparison.
+        relative_table = compute_relative_performance(
+            close, history_matrix(benchmark_histories), windows=(relative_window, *relative_windows)
+        ).to_dict("records")
+        relative = next((row for row in relative_table if row["benchmark"] == benchmark_symbol), {})
+    if relative:
+        yield "relative_performance", {"relative_performance": relative}
+    if relative_table and (benchmarks or relative_windows):
+        yield "relative_performance_table", {"relative_performance_table": relative_table}
+    backtest = (
+        run_backtest(close, benchmark_close, backtest_days, benchmark_symbol)
+        if backtest_days
+        else {}
     )
+    if backtest:
+        yield "backtest", {"backtest": backtest}
 
-    ticker_obj = yf.Ticker(ticker)
-    try:
-        info = ticker_obj.info or {}
-    except Exception:  # noqa: BLE001
-        info = {}
-    try:
-        income_stmt = ticker_obj.income_stmt
-    except Exception:  # noqa: BLE001
-        income_stmt = None
-    news = getattr(ticker_obj, "news", [])
+    with ANALYSIS_STAGE_SECONDS.time(stage="fundamentals"):
+        info, income_stmt, news = _load_fundamentals(ticker)
 
     score_context = {
         "close": close,
@@ -92,59 +359,70 @@ def analyze_ticker(
         "news": news,
         "symbol": ticker,
     }
-    scorecard = build_scorecard(score_context)
+    with ANALYSIS_STAGE_SECONDS.time(stage="scorecard"):
+        scorecard = build_scorecard(score_context)
+    yield "scorecard", {"scorecard": scorecard}
+    yield "probability", {"probability": calculate_probability({"scorecard": scorecard})}
 
-    risk_summary = _build_risk_summary(history, latest_price)
-    relative = compute_relative_strength(
-        close, benchmark_close, benchmark_symbol=benchmark_symbol, window=relative_window
-    )
-    backtest = (
-        run_backtest(close, benchmark_close, backtest_days, benchmark_symbol)
-        if backtest_days
-        else {}
+
+def load_price_history(
+    symbol: str, lang: LanguagePack | None = None, period: str = DEFAULT_PERIOD
+) -> pd.DataFrame:
+    """Cached, coalesced ``fetch_price_history``; callers must not mutate the frame."""
+    lang = lang or LANGUAGE_KO
+    key = (symbol, period)
+    cached = _PRICE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    data = _PRICE_FLIGHT.do(
+        (symbol, period, lang.code), fetch_price_history, symbol, lang, period
     )
+    _PRICE_CACHE.set(key, data)
+    return data
 
-    summary = {
-        "ticker": ticker,
-        "latest_date": normalize_timestamp(latest_idx),
-        "latest_close": float(latest_price),
-        "macd": {
-            "macd": safe_float(macd_val),
-            "signal": safe_float(signal_val),
-            "hist": safe_float(hist_val),
-        },
-        "rsi": safe_float(rsi_val),
-        "decision": {"action": action, "rationale": rationale},
-        "support_resistance": {
-            **support_info,
-            "support_date": format_date(support_info["support_date"])
-            if support_info
-            else None,
-            "resistance_date": format_date(support_info["resistance_date"])
-            if support_info
-            else None,
-        }
-        if support_info
-        else {},
-        "channels": channel_set,
-        "moving_averages": {
-            "sma20": safe_float(sma20),
-            "sma50": safe_float(sma50),
-        },
-        "volume": {
-            "latest": safe_float(volume_latest),
-            "avg20": safe_float(volume_avg20),
-        },
-        "scorecard": scorecard,
-    }
-    summary["probability"] = calculate_probability(summary)
-    if risk_summary:
-        summary["risk"] = risk_summary
-    if relative:
-        summary["relative_performance"] = relative
-    if backtest:
-        summary["backtest"] = backtest
-    return summary
+
+def load_price_histories(
+    symbols: Sequence[str], period: str = DEFAULT_PERIOD, *, batch_size: int = 200
+) -> Dict[str, pd.DataFrame]:
+    """``load_price_history`` for many symbols: cached ones are reused, the rest
+    downloaded ``batch_size`` per provider call. Symbols without data are left out."""
+    histories: Dict[str, pd.DataFrame] = {}
+    missing = []
+    for symbol in dict.fromkeys(symbols):
+        cached = _PRICE_CACHE.get((symbol, period))
+        if cached is None:
+            missing.append(symbol)
+        else:
+            histories[symbol] = cached
+    for symbol, data in fetch_histories(missing, period, batch_size=batch_size).items():
+        _PRICE_CACHE.set((symbol, period), data)
+        histories[symbol] = data
+    return {symbol: histories[symbol] for symbol in dict.fromkeys(symbols) if symbol in histories}
+
+
+def _load_fundamentals(ticker: str) -> tuple:
+    cached = _FUNDAMENTALS_CACHE.get(ticker)
+    if cached is not None:
+        return cached
+    data = _FUNDAMENTALS_FLIGHT.do(ticker, _fetch_fundamentals, ticker)
+    _FUNDAMENTALS_CACHE.set(ticker, data)
+    return data
+
+
+def _fetch_fundamentals(ticker: str) -> tuple:
+    ticker_obj = get_provider().Ticker(ticker)
+    try:
+        info = ticker_obj.info or {}
+    except Exception:  # noqa: BLE001
+        PROVIDER_ERRORS.inc(call="info")
+        info = {}
+    try:
+        income_stmt = ticker_obj.income_stmt
+    except Exception:  # noqa: BLE001
+        PROVIDER_ERRORS.inc(call="income_stmt")
+        income_stmt = None
+    news = getattr(ticker_obj, "news", [])
+    return info, income_stmt, news
 
 
 def _get_benchmark_history(symbol: str, lang: LanguagePack) -> pd.DataFrame | None:
@@ -152,13 +430,42 @@ def _get_benchmark_history(symbol: str, lang: LanguagePack) -> pd.DataFrame | No
     if cached is not None:
         return cached
     try:
-        data = fetch_price_history(symbol, lang)
+        data = _PRICE_FLIGHT.do(
+            (symbol, DEFAULT_PERIOD, lang.code), fetch_price_history, symbol, lang
+        )
     except Exception:
+        PROVIDER_ERRORS.inc(call="benchmark_history")
         return None
-    _BENCHMARK_CACHE[symbol] = data
+    _BENCHMARK_CACHE.set(symbol, data)
     return data
 
 
+def _get_benchmark_histories(symbols: Sequence[str], lang: LanguagePack) -> Dict[str, pd.DataFrame]:
+    """``_get_benchmark_history`` for several symbols; uncached ones share one provider call."""
+    histories: Dict[str, pd.DataFrame] = {}
+    missing = []
+    for symbol in dict.fromkeys(symbols):
+        cached = _BENCHMARK_CACHE.get(symbol)
+        if cached is None:
+            missing.append(symbol)
+        else:
+            histories[symbol] = cached
+    if len(missing) == 1:
+        data = _get_benchmark_history(missing[0], lang)
+        if data is not None:
+            histories[missing[0]] = data
+    elif missing:
+        try:
+            downloaded = fetch_histories(missing, DEFAULT_PERIOD)
+        except Exception:
+            PROVIDER_ERRORS.inc(call="benchmark_history")
+            downloaded = {}
+        for symbol, data in downloaded.items():
+            _BENCHMARK_CACHE.set(symbol, data)
+            histories[symbol] = data
+    return {symbol: histories[symbol] for symbol in dict.fromkeys(symbols) if symbol in histories}
+
+
 def _build_risk_summary(history: pd.DataFrame, latest_price: float) -> dict:
     close = history["Close"]
     vol_30 = compute_volatility(close, 30)
@@ -180,6 +487,7 @@ def _build_risk_summary(history: pd.DataFrame, latest_price: float) -> dict:
         "atr": safe_float(atr),
         "stop_loss_price": safe_float(stop_loss),
         "risk_level_key": risk_level_key,
+        "monte_carlo": simulate_risk(close, stop_price=stop_loss),
     }
 
 
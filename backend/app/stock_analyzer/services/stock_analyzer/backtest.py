@@ -0,0 +1,285 @@
+"""Vectorized signal backtests.
+
+``analysis.run_backtest`` only reports buy-and-hold figures. This module replays
+the rules the report actually recommends (``indicators.determine_signal`` and
+the scorecard rating cutoffs) over a whole price history with array
+operations. Signals are evaluated on each close and traded on that close, so a
+position earns the *next* bar's return; costs and slippage are charged on
+every change in exposure.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .indicators import MACD_SPANS, RSI_BANDS, compute_macd, compute_rsi
+from .scoring import RATING_CUTOFFS, RATING_FLOOR
+
+TRADING_DAYS = 252
+
+# ``determine_signal`` outcomes in rule order; the index is the code used below.
+ACTION_KEYS = (
+    "action_insufficient",
+    "action_sell_alert",
+    "action_buy_opportunity",
+    "action_bullish",
+    "action_bearish",
+    "action_neutral",
+)
+# Target exposure per action; NaN keeps the previous position.
+SIGNAL_TARGETS: Dict[str, float] = {
+    "action_insufficient": 0.0,
+    "action_sell_alert": 0.0,
+    "action_buy_opportunity": 1.0,
+    "action_bullish": 1.0,
+    "action_bearish": 0.0,
+    "action_neutral": np.nan,
+}
+RATING_TARGETS: Dict[str, float] = {
+    "rating_strong_buy": 1.0,
+    "rating_buy": 1.0,
+    "rating_neutral": np.nan,
+    "rating_sell": 0.0,
+}
+
+
+@dataclass
+class BacktestResult:
+    equity: pd.Series
+    positions: pd.Series
+    returns: pd.Series
+    stats: Dict[str, float | int | None] = field(default_factory=dict)
+
+
+def signal_codes(
+    macd: np.ndarray,
+    signal: np.ndarray,
+    rsi: np.ndarray,
+    *,
+    overbought: float = RSI_BANDS[0],
+    oversold: float = RSI_BANDS[1],
+) -> np.ndarray:
+    """``determine_signal`` for every bar at once, as indexes into ``ACTION_KEYS``."""
+    macd, signal, rsi = (np.asarray(values, dtype=float) for values in (macd, signal, rsi))
+    missing = np.isnan(macd) | np.isnan(signal) | np.isnan(rsi)
+    return np.select(
+        [missing, rsi >= overbought, rsi <= oversold, macd > signal, macd < signal],
+        [0, 1, 2, 3, 4],
+        default=5,
+    )
+
+
+def rating_codes(
+    scores: np.ndarray, cutoffs: Sequence[tuple[str, float]] = RATING_CUTOFFS
+) -> np.ndarray:
+    """``_rating_label`` for 0..1 scores, as indexes into ``cutoffs`` (``len(cutoffs)`` = sell)."""
+    scores = np.asarray(scores, dtype=float)
+    conditions = [scores >= threshold for _, threshold in cutoffs]
+    return np.select(conditions, np.arange(len(cutoffs)), default=len(cutoffs))
+
+
+def targets_from_codes(
+    codes: np.ndarray, labels: Sequence[str], targets: Mapping[str, float]
+) -> np.ndarray:
+    table = np.array([targets.get(label, 0.0) for label in labels], dtype=float)
+    return table[codes]
+
+
+def signal_targets(
+    close: pd.Series,
+    *,
+    macd_df: pd.DataFrame | None = None,
+    rsi_series: pd.Series | None = None,
+    overbought: float = RSI_BANDS[0],
+    oversold: float = RSI_BANDS[1],
+    targets: Mapping[str, float] = SIGNAL_TARGETS,
+) -> pd.Series:
+    """Target exposure per bar from the MACD/RSI rules (NaN = hold)."""
+    macd_df = compute_macd(close) if macd_df is None else macd_df
+    rsi_series = compute_rsi(close) if rsi_series is None else rsi_series
+    codes = signal_codes(
+        macd_df["macd"].to_numpy(),
+        macd_df["signal"].to_numpy(),
+        rsi_series.to_numpy(),
+        overbought=overbought,
+        oversold=oversold,
+    )
+    return pd.Series(targets_from_codes(codes, ACTION_KEYS, targets), index=close.index)
+
+
+def rating_targets(
+    scores: pd.Series,
+    *,
+    cutoffs: Sequence[tuple[str, float]] = RATING_CUTOFFS,
+    targets: Mapping[str, float] = RATING_TARGETS,
+) -> pd.Series:
+    """Target exposure per bar from 0..1 scorecard totals (NaN = hold)."""
+    codes = rating_codes(scores.to_numpy(), cutoffs)
+    labels = [label for label, _ in cutoffs] + [RATING_FLOOR]
+    return pd.Series(targets_from_codes(codes, labels, targets), index=scores.index)
+
+
+def hold_forward(targets: np.ndarray) -> np.ndarray:
+    """Forward-fill NaN targets along axis 0; leading NaNs become flat."""
+    targets = np.asarray(targets, dtype=float)
+    valid = ~np.isnan(targets)
+    rows = np.arange(len(targets)).reshape((-1,) + (1,) * (targets.ndim - 1))
+    last = np.maximum.accumulate(np.where(valid, rows, 0), axis=0)
+    filled = np.take_along_axis(targets, np.broadcast_to(last, targets.shape), axis=0)
+    seen = np.logical_or.accumulate(valid, axis=0)
+    return np.where(seen, filled, 0.0)
+
+
+def simulate(
+    close: np.ndarray,
+    positions: np.ndarray,
+    *,
+    cost_bps: float = 5.0,
+    slippage_bps: float = 5.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-bar net strategy returns and traded exposure.
+
+    ``close`` and ``positions`` are (bars,) or (bars, assets) arrays; the
+    position decided on bar ``t`` earns the return from ``t`` to ``t + 1``.
+    """
+    close = np.asarray(close, dtype=float)
+    positions = np.nan_to_num(np.asarray(positions, dtype=float))
+    asset_returns = np.zeros_like(close)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        asset_returns[1:] = close[1:] / close[:-1] - 1
+    asset_returns = np.nan_to_num(asset_returns, nan=0.0, posinf=0.0, neginf=0.0)
+    held = np.zeros_like(positions)
+    held[1:] = positions[:-1]
+    traded = np.abs(np.diff(positions, axis=0, prepend=np.zeros_like(positions[:1])))
+    cost_rate = (cost_bps + slippage_bps) / 10_000
+    return held * asset_returns - traded * cost_rate, traded
+
+
+def performance_stats(
+    returns: np.ndarray,
+    traded: np.ndarray,
+    positions: np.ndarray,
+    periods_per_year: int = TRADING_DAYS,
+) -> Dict[str, np.ndarray]:
+    """Summary statistics along axis 0 (works for one asset or a matrix of them)."""
+    returns = np.asarray(returns, dtype=float)
+    bars = len(returns)
+    if not bars:
+        # Nothing was traded; every ratio is undefined rather than zero.
+        missing = np.full(returns.shape[1:], np.nan)
+        return {
+            "total_return": missing,
+            "cagr": missing,
+            "annual_volatility": missing,
+            "sharpe": missing,
+            "max_drawdown": missing,
+            "turnover": np.zeros(returns.shape[1:]),
+            "trades": np.zeros(returns.shape[1:], dtype=int),
+            "exposure": missing,
+        }
+    equity = np.cumprod(1 + returns, axis=0)
+    years = max(bars - 1, 1) / periods_per_year
+    total = equity[-1] - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cagr = np.where(equity[-1] > 0, equity[-1] ** (1 / years) - 1, -1.0)
+        std = returns.std(axis=0, ddof=1) if bars > 1 else np.zeros(returns.shape[1:])
+        sharpe = np.where(std > 0, returns.mean(axis=0) / std * np.sqrt(periods_per_year), np.nan)
+        drawdown = 1 - equity / np.maximum.accumulate(equity, axis=0)
+    return {
+        "total_return": total,
+        "cagr": cagr,
+        "annual_volatility": std * np.sqrt(periods_per_year),
+        "sharpe": sharpe,
+        "max_drawdown": drawdown.max(axis=0),
+        "turnover": traded.sum(axis=0) / years,
+        "trades": np.count_nonzero(traded, axis=0),
+        "exposure": np.abs(positions).mean(axis=0),
+    }
+
+
+def run_signal_backtest(
+    close: pd.Series,
+    targets: pd.Series,
+    *,
+    position_size: float = 1.0,
+    vol_target: float | None = None,
+    vol_window: int = 20,
+    max_leverage: float = 1.0,
+    cost_bps: float = 5.0,
+    slippage_bps: float = 5.0,
+    initial_capital: float = 1.0,
+) -> BacktestResult:
+    """Trade ``targets`` (exposure per bar, NaN = hold) on ``close``.
+
+    Exposure is ``position_size`` times the target, or, with ``vol_target``,
+    scaled so trailing annualized volatility matches it (capped at
+    ``max_leverage``). ``cost_bps`` and ``slippage_bps`` are charged per unit
+    of exposure traded.
+    """
+    close = close.astype(float)
+    targets = targets.reindex(close.index)
+    exposure = hold_forward(targets.to_numpy()) * position_size
+    if vol_target:
+        realized = close.pct_change().rolling(vol_window).std(ddof=0).to_numpy()
+        realized = realized * np.sqrt(TRADING_DAYS)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(realized > 0, vol_target / realized, 0.0)
+        exposure = exposure * np.clip(np.nan_to_num(scale), 0.0, max_leverage)
+    values = close.to_numpy()
+    returns, traded = simulate(values, exposure, cost_bps=cost_bps, slippage_bps=slippage_bps)
+    stats = {
+        key: _scalar(value)
+        for key, value in performance_stats(returns, traded, exposure).items()
+    }
+    valid = values[~np.isnan(values)]
+    stats["buy_hold_return"] = None
+    if len(valid) > 1 and valid[0] > 0:
+        stats["buy_hold_return"] = _scalar(valid[-1] / valid[0] - 1)
+    stats["costs"] = _scalar(traded.sum() * (cost_bps + slippage_bps) / 10_000)
+    return BacktestResult(
+        equity=pd.Series(initial_capital * np.cumprod(1 + returns), index=close.index),
+        positions=pd.Series(exposure, index=close.index),
+        returns=pd.Series(returns, index=close.index),
+        stats=stats,
+    )
+
+
+def backtest_signal_rules(
+    close: pd.Series,
+    *,
+    macd_spans: tuple[int, int, int] = MACD_SPANS,
+    overbought: float = RSI_BANDS[0],
+    oversold: float = RSI_BANDS[1],
+    **options,
+) -> BacktestResult:
+    """Backtest ``determine_signal`` over the full history of ``close``."""
+    targets = signal_targets(
+        close, macd_df=compute_macd(close, *macd_spans), overbought=overbought, oversold=oversold
+    )
+    return run_signal_backtest(close, targets, **options)
+
+
+def backtest_rating(
+    close: pd.Series,
+    scores: pd.Series,
+    *,
+    cutoffs: Sequence[tuple[str, float]] = RATING_CUTOFFS,
+    **options,
+) -> BacktestResult:
+    """Backtest the scorecard rating given a 0..1 total score per bar.
+
+    ``scoring.build_scorecard_series(history)["total"]`` gives the point-in-time
+    scores for a price history.
+    """
+    return run_signal_backtest(close, rating_targets(scores, cutoffs=cutoffs), **options)
+
+
+def _scalar(value) -> float | int | None:
+    value = np.asarray(value).item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
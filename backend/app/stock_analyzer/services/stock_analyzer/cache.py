@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+from stock_analyzer.metrics import CACHE_REQUESTS
+
+if TYPE_CHECKING:
+    from .shared_cache import SharedTier
+
+V = TypeVar("V")
+
+PRICE_CACHE_TTL_SECONDS = float(os.getenv("PRICE_CACHE_TTL_SECONDS", "900"))
+FUNDAMENTALS_CACHE_TTL_SECONDS = float(os.getenv("FUNDAMENTALS_CACHE_TTL_SECONDS", "3600"))
+RESULT_CACHE_TTL_SECONDS = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "300"))
+CORRELATION_CACHE_TTL_SECONDS = float(os.getenv("CORRELATION_CACHE_TTL_SECONDS", "21600"))
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL.
+
+    With a ``shared`` tier, local misses fall through to the cross-worker store
+    and writes go to both, so one worker's download serves every worker.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl: float,
+        max_entries: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+        shared: "SharedTier | None" = None,
+    ) -> None:
+        self.name = name
+        self.shared = shared
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        CACHE_REQUESTS.inc(cache=self.name, result="hit" if entry is not None else "miss")
+        if entry is not None:
+            return entry[1]
+        if self.shared is not None:
+            shared_entry = self.shared.get(key)
+            if shared_entry is not None:
+                value, remaining = shared_entry
+                self._store(key, value, remaining)
+                return value
+        return None
+
+    def set(self, key: Hashable, value: V, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._store(key, value, ttl)
+        if self.shared is not None:
+            self.shared.set(key, value, ttl)
+
+    def _store(self, key: Hashable, value: V, ttl: float) -> None:
+        expires_at = self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], V], ttl: float | None = None) -> V:
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value, ttl)
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.shared is not None:
+            self.shared.delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+import time
 from dataclasses import dataclass
 from getpass import getpass
 from typing import Iterable, List, Sequence
@@ -15,15 +16,25 @@ from stock_analyzer.services.exporters import (
 )
 from stock_analyzer.services.language import LanguagePack, get_language
 
-from .analysis import analyze_ticker
-from .report import render_cli_report
+from .analysis import analyze_ticker, load_price_histories
+from .report import render_cli_report, render_screen_table
+from .screener import (
+    apply_filters,
+    export_table,
+    parse_filter,
+    rank_table,
+    read_universe,
+    screen_histories,
+)
+from .scoring import momentum_benchmark_symbol
 from .banner import show_welcome_message, show_interactive_help
 from .streaming import stream_print, print_instant
 from .menu import select_export_format
 
-COMMANDS = {"analyze", "interactive", "i", "export"}
+COMMANDS = {"analyze", "interactive", "i", "export", "screen"}
 DEFAULT_BENCHMARK = "SPY"
 DEFAULT_REL_WINDOW = 60
+DEFAULT_SCREEN_TOP = 20
 
 
 @dataclass
@@ -88,10 +99,27 @@ def _extract_int_option(argv: Sequence[str] | None, name: str) -> int | None:
         return None
 
 
+def _split_option(value: str | None) -> list[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def _window_list(value: str) -> list[int]:
+    """argparse ``type`` for ``--relative-windows``: comma-separated positive bar counts."""
+    try:
+        windows = [int(item) for item in _split_option(value)]
+    except ValueError:
+        windows = []
+    if not windows or min(windows) <= 0:
+        raise argparse.ArgumentTypeError(
+            f"expected comma-separated positive integers, got {value!r}"
+        )
+    return windows
+
+
 def _strip_known_global_options(argv: Sequence[str] | None) -> list[str]:
     if not argv:
         return []
-    known = {"--lang", "--benchmark", "--backtest"}
+    known = {"--lang", "--benchmark", "--benchmarks", "--relative-windows", "--backtest"}
     result: list[str] = []
     skip_next = False
     for idx, value in enumerate(argv):
@@ -119,6 +147,15 @@ def _add_analysis_options(parser: argparse.ArgumentParser, lang: LanguagePack) -
         "--benchmark",
         help=lang.t("cli.parser.option.benchmark"),
     )
+    parser.add_argument(
+        "--benchmarks",
+        help=lang.t("cli.parser.option.benchmarks"),
+    )
+    parser.add_argument(
+        "--relative-windows",
+        type=_window_list,
+        help=lang.t("cli.parser.option.relative_windows"),
+    )
     parser.add_argument(
         "--backtest",
         type=int,
@@ -190,6 +227,41 @@ def build_parser(context: AppContext) -> argparse.ArgumentParser:
     export_parser.add_argument("--csv-path", help=lang.t("cli.parser.export.csv_path"))
     _add_analysis_options(export_parser, lang)
 
+    screen_parser = subparsers.add_parser(
+        "screen",
+        help=lang.t("cli.parser.screen.help"),
+        description=lang.t("cli.parser.screen.description"),
+    )
+    screen_parser.add_argument("tickers", nargs="*", help=lang.t("cli.parser.screen.tickers"))
+    screen_parser.add_argument(
+        "--universe",
+        "-u",
+        action="append",
+        default=[],
+        help=lang.t("cli.parser.screen.universe"),
+    )
+    screen_parser.add_argument(
+        "--filter",
+        dest="filters",
+        action="append",
+        default=[],
+        help=lang.t("cli.parser.screen.filter"),
+    )
+    screen_parser.add_argument("--sort", default="score", help=lang.t("cli.parser.screen.sort"))
+    screen_parser.add_argument("--top", type=int, help=lang.t("cli.parser.screen.top"))
+    screen_parser.add_argument("--bottom", type=int, help=lang.t("cli.parser.screen.bottom"))
+    screen_parser.add_argument("--period", default="1y", help=lang.t("cli.parser.screen.period"))
+    screen_parser.add_argument("--benchmark", help=lang.t("cli.parser.screen.benchmark"))
+    screen_parser.add_argument(
+        "--export",
+        dest="exports",
+        action="append",
+        choices=["json", "csv"],
+        help=lang.t("cli.parser.analyze.export"),
+    )
+    screen_parser.add_argument("--json-path", help=lang.t("cli.parser.analyze.json_path"))
+    screen_parser.add_argument("--csv-path", help=lang.t("cli.parser.analyze.csv_path"))
+
     for subparser in [analyze_parser, export_parser]:
         subparser.add_argument("--mysql-host", default="localhost")
         subparser.add_argument("--mysql-port", type=int, default=3306)
@@ -419,6 +491,8 @@ def process_ticker(
             benchmark_symbol=context.benchmark,
             relative_window=context.relative_window,
             backtest_days=getattr(args, "backtest", None),
+            benchmarks=_split_option(getattr(args, "benchmarks", None)),
+            relative_windows=getattr(args, "relative_windows", None) or [],
         )
         assistant_stream(context, lang.t("cli.process.analyzing"))
         print_instant()
@@ -441,6 +515,70 @@ def process_ticker(
         handle_interactive_export_flow(summary, context)
 
 
+def run_screen(args: argparse.Namespace, context: AppContext) -> None:
+    lang = context.lang
+    try:
+        filters = [parse_filter(expression) for expression in args.filters]
+        listed = [t.upper() for t in args.tickers if t]
+        tickers = list(dict.fromkeys(read_universe(args.universe) + listed))
+    except (OSError, ValueError) as exc:
+        print(lang.t("cli.screen.error", error=exc))
+        return
+    if not tickers:
+        print(context.lang.t("cli.error.ticker_required"))
+        return
+
+    started = time.perf_counter()
+    assistant_stream(context, lang.t("cli.screen.fetching", count=len(tickers)))
+    if args.benchmark:
+        benchmark_for = {ticker: args.benchmark.upper() for ticker in tickers}
+    else:
+        benchmark_for = {ticker: momentum_benchmark_symbol(ticker) for ticker in tickers}
+    all_benchmarks = list(dict.fromkeys(benchmark_for.values()))
+    benchmark_symbols = [symbol for symbol in all_benchmarks if symbol not in tickers]
+    histories = load_price_histories(tickers + benchmark_symbols, args.period)
+    closes = {
+        symbol: histories[symbol]["Close"] for symbol in all_benchmarks if symbol in histories
+    }
+    for symbol in benchmark_symbols:
+        histories.pop(symbol, None)
+    table = screen_histories(
+        histories,
+        benchmark={ticker: closes.get(symbol) for ticker, symbol in benchmark_for.items()},
+    )
+    try:
+        matched = apply_filters(table, filters) if not table.empty else table
+        top = args.top if args.top is not None or args.bottom is not None else DEFAULT_SCREEN_TOP
+        ranked = matched
+        if not matched.empty:
+            ranked = rank_table(matched, args.sort, top=top, bottom=args.bottom)
+    except ValueError as exc:
+        print(lang.t("cli.screen.error", error=exc))
+        return
+    print_instant()
+    render_screen_table(ranked, lang)
+    print_instant()
+    print(
+        lang.t(
+            "cli.screen.summary",
+            screened=len(table),
+            requested=len(tickers),
+            matched=len(matched),
+            shown=len(ranked),
+            seconds=f"{time.perf_counter() - started:.1f}",
+        )
+    )
+
+    for fmt in args.exports or []:
+        default_path = f"exports/screen_{time.strftime('%Y%m%d')}.{fmt}"
+        path = (args.json_path if fmt == "json" else args.csv_path) or default_path
+        try:
+            export_table(ranked, path)
+            print(lang.t("configured_export_success", label=fmt.upper()))
+        except Exception as exc:  # noqa: BLE001
+            print(lang.t("configured_export_error", label=fmt.upper(), error=exc))
+
+
 def interactive_loop(context: AppContext, args: argparse.Namespace) -> None:
     lang = context.lang
     exit_inputs = _command_list(context, "cli.interactive.exit_inputs")
@@ -500,6 +638,8 @@ def main(argv: list[str] | None = None) -> None:
     lang_code = _extract_option(argv, "--lang")
     benchmark_override = _extract_option(argv, "--benchmark")
     backtest_override = _extract_int_option(argv, "--backtest")
+    benchmarks_override = _extract_option(argv, "--benchmarks")
+    windows_override = _extract_option(argv, "--relative-windows")
     context = _build_context(lang_code, benchmark=benchmark_override)
 
     try:
@@ -510,6 +650,12 @@ def main(argv: list[str] | None = None) -> None:
 
         command_probe = _strip_known_global_options(argv)
         if not command_probe or command_probe[0] not in COMMANDS:
+            relative_windows: list[int] = []
+            try:
+                if windows_override is not None:
+                    relative_windows = _window_list(windows_override)
+            except argparse.ArgumentTypeError as exc:
+                build_parser(context).error(f"argument --relative-windows: {exc}")
             args = argparse.Namespace(
                 command="interactive",
                 lang=context.lang.code,
@@ -518,6 +664,8 @@ def main(argv: list[str] | None = None) -> None:
                 csv_path=None,
                 benchmark=None,
                 backtest=backtest_override,
+                benchmarks=benchmarks_override,
+                relative_windows=relative_windows,
             )
             interactive_loop(context, args)
             return
@@ -542,6 +690,10 @@ def main(argv: list[str] | None = None) -> None:
                 interactive_loop(context, args)
             return
 
+        if args.command == "screen":
+            run_screen(args, context)
+            return
+
         if args.command == "export":
             tickers = [t.upper() for t in args.tickers if t]
             if not tickers:
@@ -0,0 +1,384 @@
+"""Cross-sectional return correlations, rolling betas and clusters for a universe.
+
+``compute_relative_strength`` compares one ticker with one benchmark. Here the
+daily returns of a whole universe are aligned into one (date x ticker) matrix:
+pairwise correlations come from blocked matrix products of the zero-filled
+returns and their validity masks (pairwise-complete, like ``DataFrame.corr``,
+with only ``block`` columns of products live at a time), rolling betas against
+several benchmarks from windowed cumulative sums, and clusters from the
+correlation matrix. ``GET /analytics/correlation`` serves cached results:
+
+    PYTHONPATH=backend/app python -m stock_analyzer.services.stock_analyzer.correlation \\
+        --synthetic 2000 --benchmarks SYN0000,SYN0001 --window 60 --threshold 0.6
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .cache import CORRELATION_CACHE_TTL_SECONDS, TTLCache
+from .shared_cache import shared_tier
+
+DEFAULT_WINDOW = 60
+DEFAULT_BLOCK = 512
+DEFAULT_THRESHOLD = 0.7
+MIN_PERIODS = 20
+
+# Keys carry the last bar's date, so a new bar starts a new entry.
+_CORRELATION_CACHE: TTLCache["CorrelationResult"] = TTLCache(
+    "correlation",
+    ttl=CORRELATION_CACHE_TTL_SECONDS,
+    max_entries=32,
+    shared=shared_tier("correlation"),
+)
+
+
+@dataclass
+class CorrelationResult:
+    date: pd.Timestamp | None
+    correlation: pd.DataFrame
+    betas: pd.DataFrame
+    clusters: List[List[str]]
+    observations: int
+    missing: List[str] = field(default_factory=list)
+
+    def top_pairs(self, count: int = 20) -> List[dict]:
+        """The ``count`` most correlated distinct pairs, highest first."""
+        values = self.correlation.to_numpy()
+        rows, cols = np.triu_indices(len(values), k=1)
+        pair_values = values[rows, cols]
+        valid = np.flatnonzero(~np.isnan(pair_values))
+        count = min(count, len(valid))
+        if not count:
+            return []
+        best = valid[np.argpartition(-pair_values[valid], count - 1)[:count]]
+        best = best[np.argsort(-pair_values[best], kind="stable")]
+        tickers = self.correlation.index
+        return [
+            {
+                "a": tickers[rows[index]],
+                "b": tickers[cols[index]],
+                "correlation": float(pair_values[index]),
+            }
+            for index in best
+        ]
+
+    def to_dict(self, *, matrix: bool = True, pairs: int = 20) -> dict:
+        payload = {
+            "date": self.date.date().isoformat() if self.date is not None else None,
+            "observations": self.observations,
+            "tickers": list(self.correlation.index),
+            "missing": self.missing,
+            "betas": {
+                ticker: {benchmark: _finite(value) for benchmark, value in row.items()}
+                for ticker, row in self.betas.iterrows()
+            },
+            "clusters": self.clusters,
+            "top_pairs": self.top_pairs(pairs),
+        }
+        if matrix:
+            payload["correlation"] = [
+                [_finite(value) for value in row] for row in self.correlation.to_numpy()
+            ]
+        return payload
+
+
+def _finite(value) -> float | None:
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def return_matrix(close: pd.DataFrame) -> pd.DataFrame:
+    """Daily simple returns; NaN where either close is missing (gaps are not bridged)."""
+    close = close.sort_index().astype(float)
+    return (close / close.shift(1) - 1).iloc[1:]
+
+
+def correlation_matrix(
+    returns: pd.DataFrame, *, min_periods: int = MIN_PERIODS, block: int = DEFAULT_BLOCK
+) -> pd.DataFrame:
+    """Pairwise-complete Pearson correlations of the columns of ``returns``.
+
+    Each pair uses the dates both columns have; pairs with fewer than
+    ``min_periods`` of them are NaN.
+    """
+    values = returns.to_numpy(dtype=float)
+    mask = ~np.isnan(values)
+    x = np.where(mask, values, 0.0)
+    m = mask.astype(float)
+    x2 = x * x
+    width = values.shape[1]
+    out = np.empty((width, width))
+    for i in range(0, width, block):
+        xi, mi, x2i = x[:, i : i + block], m[:, i : i + block], x2[:, i : i + block]
+        for j in range(i, width, block):
+            xj, mj, x2j = x[:, j : j + block], m[:, j : j + block], x2[:, j : j + block]
+            count = mi.T @ mj
+            sx, sy = xi.T @ mj, mi.T @ xj
+            cov = count * (xi.T @ xj) - sx * sy
+            var = (count * (x2i.T @ mj) - sx**2) * (count * (mi.T @ x2j) - sy**2)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                corr = np.where((count >= min_periods) & (var > 0), cov / np.sqrt(var), np.nan)
+            corr = np.clip(corr, -1.0, 1.0)
+            out[i : i + block, j : j + block] = corr
+            out[j : j + block, i : i + block] = corr.T
+    return pd.DataFrame(out, index=returns.columns, columns=returns.columns)
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    total = np.cumsum(values, axis=0)
+    total[window:] = total[window:] - total[:-window]
+    return total
+
+
+def rolling_betas(
+    returns: pd.DataFrame,
+    benchmarks: pd.DataFrame,
+    *,
+    window: int = DEFAULT_WINDOW,
+    min_periods: int = MIN_PERIODS,
+    block: int = DEFAULT_BLOCK,
+) -> Dict[str, pd.DataFrame]:
+    """Rolling ``window``-day beta of every ticker to every benchmark column.
+
+    Returns one (date x ticker) frame per benchmark; each window uses the days
+    both the ticker and the benchmark have a return, and needs ``min_periods``.
+    """
+    benchmarks = benchmarks.reindex(returns.index)
+    values = returns.to_numpy(dtype=float)
+    result: Dict[str, pd.DataFrame] = {}
+    for name in benchmarks.columns:
+        bench = benchmarks[name].to_numpy(dtype=float)[:, None]
+        betas = np.empty_like(values)
+        for start in range(0, values.shape[1], block):
+            chunk = values[:, start : start + block]
+            both = ~np.isnan(chunk) & ~np.isnan(bench)
+            x = np.where(both, chunk, 0.0)
+            b = np.where(both, bench, 0.0)
+            n = _rolling_sum(both.astype(float), window)
+            sx, sb = _rolling_sum(x, window), _rolling_sum(b, window)
+            cov = n * _rolling_sum(x * b, window) - sx * sb
+            var = n * _rolling_sum(b * b, window) - sb**2
+            defined = (n >= min_periods) & (var > 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                betas[:, start : start + block] = np.where(defined, cov / var, np.nan)
+        result[name] = pd.DataFrame(betas, index=returns.index, columns=returns.columns)
+    return result
+
+
+def cluster_tickers(
+    correlation: pd.DataFrame, *, threshold: float = DEFAULT_THRESHOLD, min_size: int = 2
+) -> List[List[str]]:
+    """Group tickers that move together.
+
+    The ticker linked (correlation >= ``threshold``) to the most others leads
+    the first cluster and takes every unassigned ticker linked to it, ordered by
+    correlation; the next best-connected unassigned ticker leads the next one.
+    Groups smaller than ``min_size`` are dropped.
+    """
+    values = correlation.to_numpy(dtype=float)
+    with np.errstate(invalid="ignore"):
+        linked = values >= threshold
+    np.fill_diagonal(linked, False)
+    degree = linked.sum(axis=1)
+    free = np.ones(len(values), dtype=bool)
+    tickers = correlation.index
+    clusters: List[List[str]] = []
+    for leader in np.argsort(-degree, kind="stable"):
+        if degree[leader] == 0:
+            break
+        if not free[leader]:
+            continue
+        members = np.flatnonzero(linked[leader] & free)
+        members = members[np.argsort(-values[leader, members], kind="stable")]
+        group = np.concatenate([[leader], members])
+        if len(group) >= min_size:
+            clusters.append([tickers[index] for index in group])
+            free[group] = False
+    return clusters
+
+
+def compute_correlations(
+    close: pd.DataFrame,
+    benchmarks: pd.DataFrame | None = None,
+    *,
+    window: int = DEFAULT_WINDOW,
+    lookback: int | None = None,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_periods: int = MIN_PERIODS,
+    block: int = DEFAULT_BLOCK,
+) -> CorrelationResult:
+    """Correlation matrix, latest rolling betas and clusters for a (date x ticker) close matrix.
+
+    Correlations use the last ``lookback`` daily returns (all by default);
+    ``benchmarks`` is a (date x benchmark) close matrix for the betas.
+    """
+    returns = return_matrix(close)
+    if lookback:
+        returns = returns.tail(lookback)
+    correlation = correlation_matrix(returns, min_periods=min_periods, block=block)
+    betas = pd.DataFrame(index=returns.columns)
+    if benchmarks is not None and not benchmarks.empty:
+        bench_close = benchmarks.reindex(close.index.union(benchmarks.index))
+        bench_returns = return_matrix(bench_close).reindex(returns.index)
+        rolling = rolling_betas(
+            returns, bench_returns, window=window, min_periods=min_periods, block=block
+        )
+        betas = pd.DataFrame(
+            {name: frame.iloc[-1] for name, frame in rolling.items()}, index=returns.columns
+        )
+    return CorrelationResult(
+        date=returns.index[-1] if len(returns) else None,
+        correlation=correlation,
+        betas=betas,
+        clusters=cluster_tickers(correlation, threshold=threshold),
+        observations=len(returns),
+    )
+
+
+def universe_correlations(
+    tickers: Sequence[str],
+    benchmarks: Sequence[str] = (),
+    *,
+    period: str = "1y",
+    window: int = DEFAULT_WINDOW,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_periods: int = MIN_PERIODS,
+) -> CorrelationResult:
+    """``compute_correlations`` for downloaded tickers.
+
+    Results are cached per universe, parameters and last date.
+    """
+    from .analysis import load_price_histories
+    from .data import history_matrix
+
+    tickers = list(dict.fromkeys(symbol.upper() for symbol in tickers))
+    benchmarks = list(dict.fromkeys(symbol.upper() for symbol in benchmarks))
+    extra = [symbol for symbol in benchmarks if symbol not in tickers]
+    histories = load_price_histories(tickers + extra, period)
+    close = history_matrix({symbol: histories[symbol] for symbol in tickers if symbol in histories})
+    if close.empty:
+        raise ValueError("No price history for the requested tickers")
+    bench_close = history_matrix(
+        {symbol: histories[symbol] for symbol in benchmarks if symbol in histories}
+    )
+
+    universe = hashlib.sha1(",".join(sorted(close.columns)).encode()).hexdigest()
+    key = (
+        universe,
+        tuple(bench_close.columns),
+        period,
+        window,
+        threshold,
+        min_periods,
+        close.index[-1].isoformat(),
+    )
+    cached = _CORRELATION_CACHE.get(key)
+    if cached is not None:
+        return cached
+    result = compute_correlations(
+        close, bench_close, window=window, threshold=threshold, min_periods=min_periods
+    )
+    result.missing = [symbol for symbol in tickers + benchmarks if symbol not in histories]
+    _CORRELATION_CACHE.set(key, result)
+    return result
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Pairwise correlations, rolling betas and clusters for a universe."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--synthetic", type=int, help="use this many synthetic tickers")
+    source.add_argument("--tickers", help="comma-separated tickers to download")
+    source.add_argument(
+        "--universe", action="append", help="ticker list file (see the screen command)"
+    )
+    parser.add_argument(
+        "--benchmarks", default="", help="comma-separated benchmark tickers for the betas"
+    )
+    parser.add_argument("--years", type=float, default=1, help="history length for --synthetic")
+    parser.add_argument("--period", default="1y", help="download period")
+    parser.add_argument(
+        "--window", type=int, default=DEFAULT_WINDOW, help="rolling beta window in days"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="cluster correlation threshold"
+    )
+    parser.add_argument("--min-periods", type=int, default=MIN_PERIODS)
+    parser.add_argument(
+        "--block", type=int, default=DEFAULT_BLOCK, help="tickers per matrix-product block"
+    )
+    parser.add_argument("--pairs", type=int, default=10, help="most correlated pairs to print")
+    parser.add_argument("--output", help="write the correlation matrix to this CSV file")
+    args = parser.parse_args(argv)
+
+    benchmarks = [item.strip().upper() for item in args.benchmarks.split(",") if item.strip()]
+    started = time.perf_counter()
+    if args.synthetic:
+        from .data import history_matrix
+        from .synthetic import SyntheticConfig, generate_history, synthetic_symbols
+
+        config = SyntheticConfig(years=args.years)
+        symbols = synthetic_symbols(args.synthetic)
+        histories = {
+            symbol: generate_history(symbol, config=config)
+            for symbol in dict.fromkeys(symbols + benchmarks)
+        }
+        loaded = time.perf_counter()
+        result = compute_correlations(
+            history_matrix({symbol: histories[symbol] for symbol in symbols}),
+            history_matrix({symbol: histories[symbol] for symbol in benchmarks}),
+            window=args.window,
+            threshold=args.threshold,
+            min_periods=args.min_periods,
+            block=args.block,
+        )
+    else:
+        if args.universe:
+            from .screener import read_universe
+
+            symbols = read_universe(args.universe)
+        else:
+            symbols = [item.strip().upper() for item in args.tickers.split(",") if item.strip()]
+        loaded = started
+        try:
+            result = universe_correlations(
+                symbols,
+                benchmarks,
+                period=args.period,
+                window=args.window,
+                threshold=args.threshold,
+                min_periods=args.min_periods,
+            )
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+    finished = time.perf_counter()
+
+    last = result.date.date() if result.date is not None else "-"
+    print(f"{len(result.correlation)} tickers, {result.observations} returns up to {last}")
+    for pair in result.top_pairs(args.pairs):
+        print(f"  {pair['a']:<10} {pair['b']:<10} {pair['correlation']:.3f}")
+    if not result.betas.empty:
+        print(f"Latest {args.window}-day betas (mean / min / max):")
+        for name in result.betas:
+            column = result.betas[name]
+            print(f"  {name:<10} {column.mean():.3f} / {column.min():.3f} / {column.max():.3f}")
+    sizes = [len(cluster) for cluster in result.clusters]
+    print(f"{len(sizes)} clusters at correlation >= {args.threshold} (largest: {sizes[:5]})")
+    if result.missing:
+        print(f"No data: {', '.join(result.missing)}")
+    print(f"computed in {finished - loaded:.2f} s")
+    if args.output:
+        result.correlation.to_csv(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+from typing import Dict, Mapping, Sequence
+
 import pandas as pd
-import yfinance as yf
 
 from stock_analyzer.services.language import LanguagePack, LANGUAGE_KO
 
+from .provider import get_provider
+
 
-def fetch_price_history(ticker: str, lang: LanguagePack | None = None) -> pd.DataFrame:
-    """Download up to one year of daily candles for the ticker."""
+def fetch_price_history(
+    ticker: str, lang: LanguagePack | None = None, period: str = "1y"
+) -> pd.DataFrame:
+    """Download daily candles for the ticker (one year unless ``period`` says otherwise)."""
     lang = lang or LANGUAGE_KO
-    data = yf.download(
+    data = get_provider().download(
         ticker,
-        period="1y",
+        period=period,
         interval="1d",
         auto_adjust=True,
         progress=False,
@@ -27,3 +32,56 @@ def fetch_price_history(ticker: str, lang: LanguagePack | None = None) -> pd.Dat
     if "Close" not in data:
         raise ValueError(lang.t("error_no_close"))
     return data
+
+
+def fetch_histories(
+    tickers: Sequence[str], period: str = "1y", *, batch_size: int = 200
+) -> Dict[str, pd.DataFrame]:
+    """Daily candles for many tickers, downloaded ``batch_size`` tickers per provider call.
+
+    Tickers without any close are left out; each frame keeps only its own dates.
+    """
+    histories: Dict[str, pd.DataFrame] = {}
+    symbols = list(dict.fromkeys(tickers))
+    for start in range(0, len(symbols), batch_size):
+        batch = symbols[start : start + batch_size]
+        data = get_provider().download(
+            batch if len(batch) > 1 else batch[0],
+            period=period,
+            interval="1d",
+            auto_adjust=True,
+            progress=False,
+        )
+        if data.empty:
+            continue
+        for symbol in batch:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values("Ticker"):
+                    continue
+                frame = data.xs(symbol, axis=1, level="Ticker")
+            else:
+                frame = data
+            if "Close" not in frame:
+                continue
+            frame = frame.loc[frame["Close"].notna()]
+            if not frame.empty:
+                histories[symbol] = frame
+    return histories
+
+
+def fetch_close_matrix(
+    tickers: Sequence[str], period: str = "1y", *, batch_size: int = 200
+) -> pd.DataFrame:
+    """Closing prices as a (date x ticker) frame; dates missing for one ticker are NaN."""
+    return history_matrix(fetch_histories(tickers, period, batch_size=batch_size))
+
+
+def history_matrix(histories: Mapping[str, pd.DataFrame], column: str = "Close") -> pd.DataFrame:
+    """One OHLCV column of many histories as a (date x ticker) frame.
+
+    Cells are NaN where a ticker has no bar.
+    """
+    columns = {symbol: frame[column] for symbol, frame in histories.items() if column in frame}
+    if not columns:
+        return pd.DataFrame()
+    return pd.DataFrame(columns).sort_index()
@@ -0,0 +1,445 @@
+"""Walk-forward evaluation of the scorecard's predictive power.
+
+For every ticker of a universe the point-in-time scorecard
+(``scoring.build_scorecard_series``, price-derived indicators only, so nothing
+looks ahead) is lined up with forward 5/20/60-bar returns. Per date, each
+indicator's and the total's cross-sectional rank correlation with the forward
+return is its information coefficient (IC). The evaluation reports:
+
+* IC summary per indicator and horizon (mean, std, IC/std, t-stat);
+* per-fold ICs over contiguous date blocks and how stable their sign is;
+* hit rate and mean forward return per rating bucket;
+* walk-forward weights: for each fold, weights proportional to the positive
+  in-sample IC of earlier folds (with an embargo of one horizon), and the
+  out-of-sample IC of the reweighted total next to the current weights.
+
+Tickers are scored in parallel on a process pool:
+
+    PYTHONPATH=backend/app python -m stock_analyzer.services.stock_analyzer.evaluation \\
+        --synthetic 300 --years 10 --folds 5 --output evaluation.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .backtest import rating_codes
+from .scoring import (
+    INDICATORS,
+    RATING_CUTOFFS,
+    RATING_FLOOR,
+    SERIES_CALCULATORS,
+    build_scorecard_series,
+)
+
+DEFAULT_HORIZONS = (5, 20, 60)
+DEFAULT_FOLDS = 5
+# Dates with fewer scored tickers than this get no IC.
+MIN_TICKERS = 5
+
+# Set in each worker by ``_init_worker``.
+_LOADER: Callable[[str], pd.DataFrame] | None = None
+_BENCHMARK: pd.Series | None = None
+
+
+@dataclass
+class Evaluation:
+    ic: pd.DataFrame
+    folds: pd.DataFrame
+    stability: pd.DataFrame
+    buckets: pd.DataFrame
+    walk_forward: pd.DataFrame
+    weights: pd.DataFrame
+
+    def to_dict(self) -> dict:
+        return {
+            name: json.loads(getattr(self, name).to_json(orient="records", date_format="iso"))
+            for name in ("ic", "folds", "stability", "buckets", "walk_forward", "weights")
+        }
+
+
+def ticker_observations(
+    history: pd.DataFrame,
+    horizons: Sequence[int] = DEFAULT_HORIZONS,
+    benchmark: pd.Series | None = None,
+) -> pd.DataFrame:
+    """Per-bar indicator scores, ``total`` and ``fwd_<h>`` forward returns (float32)."""
+    scores = build_scorecard_series(history, benchmark=benchmark)
+    close = history["Close"].reindex(scores.index).astype(float)
+    for horizon in horizons:
+        scores[f"fwd_{horizon}"] = close.shift(-horizon) / close - 1
+    return scores.astype("float32")
+
+
+def _init_worker(loader: Callable[[str], pd.DataFrame] | None, benchmark: pd.Series | None) -> None:
+    global _LOADER, _BENCHMARK
+    _LOADER, _BENCHMARK = loader, benchmark
+
+
+def _observe(
+    task: Tuple[str, pd.DataFrame | None, Tuple[int, ...]]
+) -> Tuple[str, pd.DataFrame | None]:
+    symbol, history, horizons = task
+    try:
+        if history is None:
+            history = _LOADER(symbol)
+        return symbol, ticker_observations(history, horizons, _BENCHMARK)
+    except (KeyError, ValueError, OSError):
+        return symbol, None
+
+
+def build_panel(
+    universe: Mapping[str, pd.DataFrame] | Sequence[str],
+    *,
+    load: Callable[[str], pd.DataFrame] | None = None,
+    horizons: Sequence[int] = DEFAULT_HORIZONS,
+    benchmark: pd.Series | None = None,
+    workers: int | None = None,
+) -> Dict[str, pd.DataFrame]:
+    """Score every ticker in parallel; returns one (date x ticker) frame per column.
+
+    ``universe`` is either ``{symbol: history}`` or symbols for ``load`` (a
+    picklable callable, e.g. ``partial(synthetic.read_history, directory)``),
+    which then runs inside the workers so histories never cross processes.
+    """
+    horizons = tuple(horizons)
+    if isinstance(universe, Mapping):
+        tasks = [(symbol, frame, horizons) for symbol, frame in universe.items()]
+    else:
+        if load is None:
+            raise ValueError("load is required when the universe is a list of symbols")
+        tasks = [(symbol, None, horizons) for symbol in universe]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) < 2:
+        _init_worker(load, benchmark)
+        results = [_observe(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(load, benchmark)
+        ) as pool:
+            results = list(pool.map(_observe, tasks, chunksize=chunksize))
+    frames = {symbol: frame for symbol, frame in results if frame is not None and not frame.empty}
+    if not frames:
+        return {}
+    columns = next(iter(frames.values())).columns
+    return {
+        column: pd.DataFrame(
+            {symbol: frame[column] for symbol, frame in frames.items()}
+        ).sort_index()
+        for column in columns
+    }
+
+
+def daily_ic(
+    scores: pd.DataFrame, forward: pd.DataFrame, min_tickers: int = MIN_TICKERS
+) -> pd.Series:
+    """Cross-sectional Spearman correlation between ``scores`` and ``forward`` for each date."""
+    mask = scores.notna() & forward.notna()
+    x = scores.where(mask).rank(axis=1)
+    y = forward.where(mask).rank(axis=1)
+    x = x.sub(x.mean(axis=1), axis=0)
+    y = y.sub(y.mean(axis=1), axis=0)
+    denominator = np.sqrt((x * x).sum(axis=1) * (y * y).sum(axis=1))
+    ic = (x * y).sum(axis=1) / denominator.where(denominator > 0)
+    return ic.where(mask.sum(axis=1) >= min_tickers)
+
+
+def _varies(frame: pd.DataFrame) -> bool:
+    values = frame.to_numpy(dtype=float)
+    return bool(np.isfinite(values).any() and np.nanmax(values) > np.nanmin(values))
+
+
+def _summary(ic: pd.Series) -> Dict[str, float]:
+    values = ic.dropna()
+    std = float(values.std(ddof=1)) if len(values) > 1 else float("nan")
+    mean = float(values.mean()) if len(values) else float("nan")
+    return {
+        "mean_ic": mean,
+        "ic_std": std,
+        "icir": mean / std if std and std > 0 else float("nan"),
+        "t_stat": mean / std * np.sqrt(len(values)) if std and std > 0 else float("nan"),
+        "positive_share": float((values > 0).mean()) if len(values) else float("nan"),
+        "days": len(values),
+    }
+
+
+def _weighted_total(
+    panel: Mapping[str, pd.DataFrame], weights: Mapping[str, float]
+) -> pd.DataFrame:
+    total = sum(panel[key] * weight for key, weight in weights.items())
+    return total / (sum(weights.values()) or 1.0)
+
+
+def _ic_weights(ic_means: Mapping[str, float], current: Mapping[str, float]) -> Dict[str, float]:
+    """Weights proportional to positive IC, rescaled to the current weights' sum."""
+    positive = {
+        key: max(value, 0.0) if np.isfinite(value) else 0.0 for key, value in ic_means.items()
+    }
+    scale = sum(positive.values())
+    if scale <= 0:
+        return dict(current)
+    budget = sum(current.values())
+    return {key: value / scale * budget for key, value in positive.items()}
+
+
+def evaluate_panel(
+    panel: Mapping[str, pd.DataFrame],
+    *,
+    horizons: Sequence[int] = DEFAULT_HORIZONS,
+    folds: int = DEFAULT_FOLDS,
+    primary_horizon: int | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    min_tickers: int = MIN_TICKERS,
+) -> Evaluation:
+    """IC, fold stability, rating buckets and walk-forward weights for a ``build_panel`` result."""
+    horizons = tuple(horizons)
+    primary = primary_horizon or (20 if 20 in horizons else horizons[0])
+    dates = panel["total"].index
+    if start:
+        dates = dates[dates >= pd.Timestamp(start)]
+    if end:
+        dates = dates[dates <= pd.Timestamp(end)]
+    panel = {key: frame.loc[dates] for key, frame in panel.items()}
+    # Indicators with a per-bar series; constant ones carry no ranking information.
+    keys = [
+        definition.key
+        for definition in INDICATORS
+        if definition.key in SERIES_CALCULATORS and _varies(panel[definition.key])
+    ]
+    current = {
+        definition.key: definition.weight for definition in INDICATORS if definition.key in keys
+    }
+
+    ics = {
+        (key, horizon): daily_ic(panel[key], panel[f"fwd_{horizon}"], min_tickers)
+        for key in [*keys, "total"]
+        for horizon in horizons
+    }
+    ic_table = pd.DataFrame(
+        [
+            {"indicator": key, "horizon": horizon, **_summary(series)}
+            for (key, horizon), series in ics.items()
+        ]
+    )
+
+    bounds = np.array_split(np.arange(len(dates)), max(1, min(folds, len(dates))))
+    fold_rows = []
+    for number, positions in enumerate(bounds, start=1):
+        if not len(positions):
+            continue
+        for (key, horizon), series in ics.items():
+            values = series.iloc[positions].dropna()
+            fold_rows.append(
+                {
+                    "fold": number,
+                    "start": dates[positions[0]],
+                    "end": dates[positions[-1]],
+                    "indicator": key,
+                    "horizon": horizon,
+                    "mean_ic": float(values.mean()) if len(values) else float("nan"),
+                    "days": len(values),
+                }
+            )
+    fold_table = pd.DataFrame(fold_rows)
+    stability = (
+        fold_table.groupby(["indicator", "horizon"], sort=False)["mean_ic"]
+        .agg(
+            fold_mean="mean",
+            fold_std="std",
+            fold_min="min",
+            fold_max="max",
+            same_sign_share=lambda values: float(
+                (np.sign(values.dropna()) == np.sign(values.mean())).mean()
+            )
+            if values.notna().any()
+            else float("nan"),
+        )
+        .reset_index()
+    )
+
+    labels = [label for label, _ in RATING_CUTOFFS] + [RATING_FLOOR]
+    totals = panel["total"].to_numpy(dtype=float)
+    codes = rating_codes(totals)
+    bucket_rows = []
+    for horizon in horizons:
+        forward = panel[f"fwd_{horizon}"].to_numpy(dtype=float)
+        valid = ~np.isnan(forward) & ~np.isnan(totals)
+        for code, label in enumerate(labels):
+            selected = forward[valid & (codes == code)]
+            bucket_rows.append(
+                {
+                    "rating": label,
+                    "horizon": horizon,
+                    "observations": int(selected.size),
+                    "mean_return": float(selected.mean()) if selected.size else float("nan"),
+                    "median_return": float(np.median(selected)) if selected.size else float("nan"),
+                    "hit_rate": float((selected > 0).mean()) if selected.size else float("nan"),
+                }
+            )
+
+    forward = panel[f"fwd_{primary}"]
+    walk_rows = []
+    for number, positions in enumerate(bounds, start=1):
+        # In-sample: earlier folds, minus the last ``primary`` dates whose forward
+        # returns reach into this fold.
+        in_sample = np.arange(0, max(0, positions[0] - primary)) if len(positions) else []
+        if number == 1 or not len(in_sample):
+            continue
+        fitted = _ic_weights(
+            {key: float(ics[(key, primary)].iloc[in_sample].mean()) for key in keys}, current
+        )
+        fold_dates = dates[positions]
+        fold_forward = forward.loc[fold_dates]
+        current_total = _weighted_total(panel, current).loc[fold_dates]
+        fitted_total = _weighted_total(panel, fitted).loc[fold_dates]
+        current_ic = daily_ic(current_total, fold_forward, min_tickers)
+        fitted_ic = daily_ic(fitted_total, fold_forward, min_tickers)
+        walk_rows.append(
+            {
+                "fold": number,
+                "start": fold_dates[0],
+                "end": fold_dates[-1],
+                "horizon": primary,
+                "current_ic": float(current_ic.mean()),
+                "reweighted_ic": float(fitted_ic.mean()),
+                **{f"weight_{key}": round(value, 3) for key, value in fitted.items()},
+            }
+        )
+
+    suggested = _ic_weights({key: float(ics[(key, primary)].mean()) for key in keys}, current)
+    weights = pd.DataFrame(
+        [
+            {
+                "indicator": key,
+                "current_weight": current[key],
+                "suggested_weight": round(suggested[key], 3),
+                f"mean_ic_{primary}": float(ics[(key, primary)].mean()),
+            }
+            for key in keys
+        ]
+    )
+    return Evaluation(
+        ic=ic_table,
+        folds=fold_table,
+        stability=stability,
+        buckets=pd.DataFrame(bucket_rows),
+        walk_forward=pd.DataFrame(walk_rows),
+        weights=weights,
+    )
+
+
+def evaluate(
+    universe: Mapping[str, pd.DataFrame] | Sequence[str],
+    *,
+    load: Callable[[str], pd.DataFrame] | None = None,
+    horizons: Sequence[int] = DEFAULT_HORIZONS,
+    benchmark: pd.Series | None = None,
+    workers: int | None = None,
+    **options,
+) -> Evaluation:
+    """``build_panel`` followed by ``evaluate_panel`` (``options`` go to the latter)."""
+    panel = build_panel(
+        universe, load=load, horizons=horizons, benchmark=benchmark, workers=workers
+    )
+    if not panel:
+        raise ValueError("No ticker in the universe could be scored")
+    return evaluate_panel(panel, horizons=horizons, **options)
+
+
+def _print_table(title: str, frame: pd.DataFrame) -> None:
+    print(f"\n{title}")
+    if frame.empty:
+        print("  (no data)")
+        return
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(frame.to_string(index=False, float_format=lambda value: f"{value:.4f}"))
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Walk-forward evaluation of scorecard predictive power."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--synthetic", type=int, help="use this many synthetic tickers")
+    source.add_argument(
+        "--data", help="directory written by the synthetic generator (prices/*.csv.gz)"
+    )
+    source.add_argument("--tickers", help="comma-separated tickers to download")
+    parser.add_argument("--years", type=float, default=10, help="history length for --synthetic")
+    parser.add_argument("--period", default="10y", help="download period for --tickers")
+    parser.add_argument(
+        "--benchmark", help="symbol whose closes drive the market-momentum indicator"
+    )
+    parser.add_argument("--horizons", default=",".join(map(str, DEFAULT_HORIZONS)))
+    parser.add_argument("--folds", type=int, default=DEFAULT_FOLDS)
+    parser.add_argument("--start")
+    parser.add_argument("--end")
+    parser.add_argument("--min-tickers", type=int, default=MIN_TICKERS)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", help="write all tables to this JSON file")
+    args = parser.parse_args(argv)
+
+    horizons = tuple(int(value) for value in args.horizons.split(",") if value.strip())
+    load = None
+    if args.synthetic:
+        from .synthetic import SyntheticConfig, generate_history, synthetic_symbols
+
+        universe = synthetic_symbols(args.synthetic)
+        load = partial(generate_history, config=SyntheticConfig(years=args.years))
+    elif args.data:
+        from .synthetic import dataset_symbols, read_history
+
+        universe = dataset_symbols(args.data)
+        load = partial(read_history, args.data)
+    else:
+        from .data import fetch_histories
+
+        symbols = [item.strip().upper() for item in args.tickers.split(",") if item.strip()]
+        universe = fetch_histories(symbols, args.period)
+    benchmark = None
+    if args.benchmark:
+        if load is not None:
+            benchmark = load(args.benchmark)["Close"]
+        else:
+            from .data import fetch_close_matrix
+
+            closes = fetch_close_matrix([args.benchmark], args.period)
+            benchmark = closes.iloc[:, 0] if not closes.empty else None
+
+    started = time.perf_counter()
+    result = evaluate(
+        universe,
+        load=load,
+        horizons=horizons,
+        benchmark=benchmark,
+        workers=args.workers,
+        folds=args.folds,
+        start=args.start,
+        end=args.end,
+        min_tickers=args.min_tickers,
+    )
+    _print_table("Information coefficient", result.ic)
+    _print_table("Stability across folds", result.stability)
+    _print_table("Rating buckets", result.buckets)
+    _print_table("Walk-forward reweighting", result.walk_forward)
+    _print_table("Weights", result.weights)
+    print(f"\n{len(universe)} tickers evaluated in {time.perf_counter() - started:.1f} s")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(result.to_dict(), handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,44 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 import numpy as np
 import pandas as pd
 
 
-def compute_macd(close: pd.Series) -> pd.DataFrame:
-    ema12 = close.ewm(span=12, adjust=False).mean()
-    ema26 = close.ewm(span=26, adjust=False).mean()
-    macd = ema12 - ema26
-    signal = macd.ewm(span=9, adjust=False).mean()
-    hist = macd - signal
-    return pd.DataFrame({"macd": macd, "signal": signal, "hist": hist})
+MACD_SPANS = (12, 26, 9)
+RSI_BANDS = (70, 30)
+# Alpha within +/- this band counts as in line with the benchmark.
+RELATIVE_NEUTRAL_BAND = 0.03
+RELATIVE_COLUMNS = [
+    "benchmark",
+    "window_days",
+    "ticker_return",
+    "benchmark_return",
+    "alpha_pct",
+    "label_key",
+]
+
+
+def macd_lines(
+    close, fast: int = MACD_SPANS[0], slow: int = MACD_SPANS[1], signal: int = MACD_SPANS[2]
+):
+    """MACD and signal lines; ``close`` may be a Series or a (date x ticker) frame."""
+    ema_fast = close.ewm(span=fast, adjust=False).mean()
+    ema_slow = close.ewm(span=slow, adjust=False).mean()
+    macd = ema_fast - ema_slow
+    return macd, macd.ewm(span=signal, adjust=False).mean()
+
+
+def compute_macd(
+    close: pd.Series,
+    fast: int = MACD_SPANS[0],
+    slow: int = MACD_SPANS[1],
+    signal: int = MACD_SPANS[2],
+) -> pd.DataFrame:
+    macd, signal_line = macd_lines(close, fast, slow, signal)
+    hist = macd - signal_line
+    return pd.DataFrame({"macd": macd, "signal": signal_line, "hist": hist})
 
 
 def compute_rsi(close: pd.Series, period: int = 14) -> pd.Series:
@@ -24,14 +52,20 @@ def compute_rsi(close: pd.Series, period: int = 14) -> pd.Series:
     return rsi
 
 
-def determine_signal(macd: float, signal: float, rsi: float) -> tuple[str, str]:
+def determine_signal(
+    macd: float,
+    signal: float,
+    rsi: float,
+    overbought: float = RSI_BANDS[0],
+    oversold: float = RSI_BANDS[1],
+) -> tuple[str, str]:
     """Return action/reason keys for downstream localization."""
     if pd.isna(macd) or pd.isna(signal) or pd.isna(rsi):
         return ("action_insufficient", "reason_insufficient")
 
-    if rsi >= 70:
+    if rsi >= overbought:
         return ("action_sell_alert", "reason_rsi_overbought")
-    if rsi <= 30:
+    if rsi <= oversold:
         return ("action_buy_opportunity", "reason_rsi_oversold")
 
     # Favor MACD crossovers when RSI is in a neutral band.
@@ -161,36 +195,53 @@ def compute_relative_strength(
 ) -> dict:
     if benchmark_close is None or benchmark_close.empty:
         return {}
-    joined = pd.concat(
-        {"asset": close.astype(float), "benchmark": benchmark_close.astype(float)},
-        axis=1,
-        join="inner",
-    ).dropna()
-    if len(joined) < window + 1:
-        window = len(joined) - 1
-    if window <= 1:
-        return {}
-    segment = joined.tail(window + 1)
-    asset_start = segment["asset"].iloc[0]
-    asset_end = segment["asset"].iloc[-1]
-    bench_start = segment["benchmark"].iloc[0]
-    bench_end = segment["benchmark"].iloc[-1]
-    if asset_start <= 0 or bench_start <= 0:
-        return {}
-    asset_return = asset_end / asset_start - 1
-    bench_return = bench_end / bench_start - 1
+    table = compute_relative_performance(
+        close, benchmark_close.to_frame(benchmark_symbol), windows=(window,)
+    )
+    return table.to_dict("records")[0] if len(table) else {}
+
+
+def compute_relative_performance(
+    close: pd.Series, benchmarks: pd.DataFrame | None, *, windows: Sequence[int] = (60,)
+) -> pd.DataFrame:
+    """Relative strength against every column of a (date x benchmark) close matrix for every window.
+
+    The matrix is aligned to ``close`` once and all pairs are computed together;
+    each benchmark is compared over the dates both have a close, and a window
+    longer than that shrinks to fit. One row per (benchmark, window) with the
+    ``compute_relative_strength`` fields; pairs without enough history are left out.
+    """
+    if benchmarks is None or benchmarks.empty or not len(close) or not windows:
+        return pd.DataFrame(columns=RELATIVE_COLUMNS)
+    asset = close.to_numpy(dtype=float)
+    bench = benchmarks.reindex(close.index).to_numpy(dtype=float)
+    shared = ~np.isnan(bench) & ~np.isnan(asset)[:, None]
+    # A stable sort moves each benchmark's shared dates to the bottom, in date order.
+    order = np.argsort(shared, axis=0, kind="stable")
+    columns = np.arange(bench.shape[1])[:, None]
+    window = np.minimum(np.asarray(windows, dtype=int)[None, :], shared.sum(axis=0)[:, None] - 1)
+    start = order[len(asset) - 1 - np.maximum(window, 0), columns]
+    end = order[-1][:, None]
+    asset_start, bench_start = asset[start], bench[start, columns]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        asset_return = asset[end] / asset_start - 1
+        bench_return = bench[end, columns] / bench_start - 1
     alpha = asset_return - bench_return
-    if alpha > 0.03:
-        label_key = "relative_label_outperform"
-    elif alpha < -0.03:
-        label_key = "relative_label_underperform"
-    else:
-        label_key = "relative_label_neutral"
-    return {
-        "benchmark": benchmark_symbol,
-        "window_days": window,
-        "ticker_return": float(asset_return),
-        "benchmark_return": float(bench_return),
-        "alpha_pct": float(alpha),
-        "label_key": label_key,
-    }
+    valid = ((window > 1) & (asset_start > 0) & (bench_start > 0)).ravel()
+    labels = np.select(
+        [alpha > RELATIVE_NEUTRAL_BAND, alpha < -RELATIVE_NEUTRAL_BAND],
+        ["relative_label_outperform", "relative_label_underperform"],
+        "relative_label_neutral",
+    )
+    table = pd.DataFrame(
+        {
+            "benchmark": np.repeat(benchmarks.columns.to_numpy(dtype=object), window.shape[1]),
+            "window_days": window.ravel(),
+            "ticker_return": asset_return.ravel(),
+            "benchmark_return": bench_return.ravel(),
+            "alpha_pct": alpha.ravel(),
+            "label_key": labels.ravel(),
+        },
+        columns=RELATIVE_COLUMNS,
+    )
+    return table[valid].drop_duplicates(["benchmark", "window_days"]).reset_index(drop=True)
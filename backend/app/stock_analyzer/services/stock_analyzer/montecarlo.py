@@ -0,0 +1,191 @@
+"""Monte Carlo risk from bootstrapped daily returns.
+
+A ticker's daily log returns are resampled, in contiguous blocks to keep
+volatility clustering, into forward price paths with one fancy-indexing
+operation per chunk. Each chunk is reduced to per-path terminal return, max
+drawdown and stop-loss hit before the next is drawn, so memory stays at
+``chunk_size x horizon`` however many paths are requested:
+
+    PYTHONPATH=backend/app python -m stock_analyzer.services.stock_analyzer.montecarlo \\
+        --synthetic SYN0001 --paths 100000 --horizon 60 --block 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PATHS = 2_000
+DEFAULT_HORIZON = 20
+DEFAULT_BLOCK = 5
+DEFAULT_LOOKBACK = 252
+CONFIDENCE_LEVELS = (0.95, 0.99)
+CHUNK_SIZE = 10_000
+MIN_RETURNS = 20
+
+
+def bootstrap_paths(
+    log_returns: np.ndarray,
+    paths: int,
+    horizon: int,
+    *,
+    block: int = 1,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """(paths x horizon) log returns drawn from ``log_returns``.
+
+    Draws come in blocks of ``block`` consecutive days.
+    """
+    log_returns = np.asarray(log_returns, dtype=float)
+    block = max(1, min(block, len(log_returns)))
+    blocks = -(-horizon // block)
+    starts = rng.integers(0, len(log_returns) - block + 1, size=(paths, blocks))
+    index = (starts[:, :, None] + np.arange(block)).reshape(paths, blocks * block)[:, :horizon]
+    return log_returns[index]
+
+
+def path_statistics(
+    log_paths: np.ndarray, stop_level: float | None = None
+) -> Dict[str, np.ndarray]:
+    """Terminal return, max drawdown and (with ``stop_level``, a log return) stop hit per path."""
+    cumulative = np.cumsum(log_paths, axis=1)
+    peak = np.maximum.accumulate(np.maximum(cumulative, 0.0), axis=1)
+    statistics = {
+        "terminal": np.expm1(cumulative[:, -1]),
+        "drawdown": -np.expm1((cumulative - peak).min(axis=1)),
+    }
+    if stop_level is not None:
+        statistics["stop_hit"] = cumulative.min(axis=1) <= stop_level
+    return statistics
+
+
+def simulate_risk(
+    close: pd.Series,
+    *,
+    horizon: int = DEFAULT_HORIZON,
+    paths: int = DEFAULT_PATHS,
+    block: int = DEFAULT_BLOCK,
+    lookback: int | None = DEFAULT_LOOKBACK,
+    stop_price: float | None = None,
+    confidence: Sequence[float] = CONFIDENCE_LEVELS,
+    chunk_size: int = CHUNK_SIZE,
+    seed: int | None = 0,
+) -> dict:
+    """Forward risk over ``horizon`` trading days from ``paths`` bootstrapped paths.
+
+    Returns VaR/CVaR of the horizon return at each ``confidence`` level (as
+    positive losses), the probability of closing at or below ``stop_price``
+    on any day, and the distribution of max drawdowns. ``lookback`` limits the
+    sampled returns to the most recent bars. The result only depends on
+    ``seed``, not on ``chunk_size``. Empty when there are too few returns.
+    """
+    if horizon < 1 or paths < 1 or chunk_size < 1:
+        raise ValueError("horizon, paths and chunk_size must be positive")
+    close = close.dropna()
+    close = close[close > 0]
+    if lookback:
+        close = close.tail(lookback + 1)
+    log_returns = np.diff(np.log(close.to_numpy(dtype=float)))
+    if len(log_returns) < MIN_RETURNS:
+        return {}
+    latest = float(close.iloc[-1])
+    stop_level = None
+    if stop_price is not None and 0 < stop_price < latest:
+        stop_level = float(np.log(stop_price / latest))
+
+    rng = np.random.default_rng(seed)
+    terminal = np.empty(paths)
+    drawdown = np.empty(paths)
+    stop_hits = 0
+    for start in range(0, paths, chunk_size):
+        count = min(chunk_size, paths - start)
+        log_paths = bootstrap_paths(log_returns, count, horizon, block=block, rng=rng)
+        chunk = path_statistics(log_paths, stop_level)
+        terminal[start : start + count] = chunk["terminal"]
+        drawdown[start : start + count] = chunk["drawdown"]
+        if stop_level is not None:
+            stop_hits += int(chunk["stop_hit"].sum())
+
+    summary = {
+        "paths": paths,
+        "horizon_days": horizon,
+        "block_days": min(block, len(log_returns)),
+        "expected_return": float(terminal.mean()),
+    }
+    for level in confidence:
+        cutoff = np.quantile(terminal, 1 - level)
+        suffix = f"{round(level * 100):d}"
+        summary[f"var_{suffix}"] = float(-cutoff)
+        summary[f"cvar_{suffix}"] = float(-terminal[terminal <= cutoff].mean())
+    summary["stop_hit_probability"] = stop_hits / paths if stop_level is not None else None
+    summary["drawdown_mean"] = float(drawdown.mean())
+    for percentile in (50, 95, 99):
+        summary[f"drawdown_p{percentile}"] = float(np.percentile(drawdown, percentile))
+    return summary
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo VaR/CVaR, stop-loss and drawdown risk for one ticker."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--synthetic", help="synthetic ticker symbol, e.g. SYN0001")
+    source.add_argument("--ticker", help="ticker to download")
+    parser.add_argument("--years", type=float, default=2, help="history length for --synthetic")
+    parser.add_argument("--period", default="1y", help="download period for --ticker")
+    parser.add_argument("--paths", type=int, default=DEFAULT_PATHS)
+    parser.add_argument("--horizon", type=int, default=DEFAULT_HORIZON)
+    parser.add_argument("--block", type=int, default=DEFAULT_BLOCK)
+    parser.add_argument("--lookback", type=int, default=DEFAULT_LOOKBACK)
+    parser.add_argument(
+        "--stop-price", type=float, help="defaults to the report's 2 x ATR stop-loss"
+    )
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    from .indicators import compute_atr
+
+    if args.synthetic:
+        from .synthetic import SyntheticConfig, generate_history
+
+        history = generate_history(args.synthetic, config=SyntheticConfig(years=args.years))
+    else:
+        from .data import fetch_histories
+
+        history = fetch_histories([args.ticker.upper()], args.period).get(args.ticker.upper())
+        if history is None:
+            raise SystemExit(f"No price history for {args.ticker}")
+    close = history["Close"]
+    stop_price = args.stop_price
+    if stop_price is None:
+        atr = compute_atr(history.get("High"), history.get("Low"), close)
+        if atr is not None and not pd.isna(atr):
+            stop_price = max(0.0, float(close.iloc[-1]) - 2 * atr)
+
+    started = time.perf_counter()
+    summary = simulate_risk(
+        close,
+        horizon=args.horizon,
+        paths=args.paths,
+        block=args.block,
+        lookback=args.lookback,
+        stop_price=stop_price,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+    )
+    elapsed = time.perf_counter() - started
+    if not summary:
+        raise SystemExit("Not enough price history to simulate")
+    print(f"{'stop_price':<24} {stop_price}")
+    for key, value in summary.items():
+        print(f"{key:<24} {value:.4f}" if isinstance(value, float) else f"{key:<24} {value}")
+    print(f"{args.paths} paths x {args.horizon} days in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
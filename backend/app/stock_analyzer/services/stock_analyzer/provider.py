@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Protocol
+
+import yfinance as yf
+
+
+class MarketDataProvider(Protocol):
+    """The slice of the ``yfinance`` module the analyzer uses.
+
+    ``download`` must accept the same keyword arguments as ``yf.download`` and
+    return a frame in the same layout; ``Ticker(symbol)`` must expose ``info``,
+    ``income_stmt`` and ``news``. The ``yfinance`` module itself is the default.
+    """
+
+    def download(self, tickers: Any, **kwargs: Any) -> Any: ...
+
+    def Ticker(self, ticker: str) -> Any: ...  # noqa: N802 - mirrors yfinance
+
+
+_lock = threading.Lock()
+_provider: MarketDataProvider = yf
+
+
+def get_provider() -> MarketDataProvider:
+    return _provider
+
+
+def set_provider(provider: MarketDataProvider | None) -> MarketDataProvider:
+    """Route all market-data calls to ``provider`` and return the previous one.
+
+    ``None`` restores yfinance.
+    """
+    global _provider
+    with _lock:
+        previous, _provider = _provider, provider if provider is not None else yf
+    return previous
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 import unicodedata
 
 from stock_analyzer.services.language import LanguagePack, LANGUAGE_KO
@@ -182,6 +183,17 @@ def render_cli_report(summary: dict, lang: LanguagePack | None = None) -> None:
                 benchmark=benchmark_return,
             ),
         ]
+        for row in summary.get("relative_performance_table") or []:
+            relative_lines.append(
+                lang.t(
+                    "relative_table_line",
+                    benchmark=row["benchmark"],
+                    window=row["window_days"],
+                    ticker=format_percent(row["ticker_return"], digits=1),
+                    benchmark_return=format_percent(row["benchmark_return"], digits=1),
+                    alpha=format_percent(row["alpha_pct"], digits=1),
+                )
+            )
         add_section(lang.t("heading_relative_performance"), relative_lines)
 
     risk_info = summary.get("risk")
@@ -212,11 +224,44 @@ def render_cli_report(summary: dict, lang: LanguagePack | None = None) -> None:
                 label=lang.t("risk_stop_loss"),
                 value=format_number(risk_info.get("stop_loss_price")),
             ),
+        ]
+        simulation = risk_info.get("monte_carlo")
+        if simulation:
+            horizon = simulation["horizon_days"]
+            risk_lines.extend(
+                [
+                    lang.t(
+                        "risk_metric_line",
+                        label=lang.t("risk_mc_var", days=horizon),
+                        value=format_percent(simulation.get("var_95"), digits=1),
+                    ),
+                    lang.t(
+                        "risk_metric_line",
+                        label=lang.t("risk_mc_cvar", days=horizon),
+                        value=format_percent(simulation.get("cvar_95"), digits=1),
+                    ),
+                    lang.t(
+                        "risk_metric_line",
+                        label=lang.t("risk_mc_stop_hit", days=horizon),
+                        value=format_percent(simulation.get("stop_hit_probability"), digits=0),
+                    ),
+                    lang.t(
+                        "risk_metric_line",
+                        label=lang.t("risk_mc_drawdown", days=horizon),
+                        value=lang.t(
+                            "risk_mc_drawdown_value",
+                            median=format_percent(simulation.get("drawdown_p50"), digits=1),
+                            tail=format_percent(simulation.get("drawdown_p95"), digits=1),
+                        ),
+                    ),
+                ]
+            )
+        risk_lines.append(
             lang.t(
                 "risk_level_line",
                 label=lang.t(risk_info.get("risk_level_key", "risk_level_unknown")),
-            ),
-        ]
+            )
+        )
         add_section(lang.t("heading_risk"), risk_lines)
 
     scorecard = summary.get("scorecard")
@@ -361,3 +406,58 @@ def render_cli_report(summary: dict, lang: LanguagePack | None = None) -> None:
             lang.t("backtest_note"),
         ]
         _assistant_panel(bt_lines)
+
+
+def _finite(value) -> float | None:
+    return float(value) if value is not None and math.isfinite(value) else None
+
+
+def _fixed(value: float | None, digits: int) -> str:
+    return "N/A" if value is None else f"{value:.{digits}f}"
+
+
+def _text_width(text: str) -> int:
+    return sum(_display_width(char) for char in text)
+
+
+SCREEN_TABLE_COLUMNS = ("ticker", "price", "change", "rsi", "score", "rating", "signal", "position")
+_SCREEN_NUMERIC = {"price", "change", "rsi", "score"}
+
+
+def render_screen_table(table, lang: LanguagePack | None = None) -> None:
+    """Print ``screener.screen_table`` rows, one ticker per line, in ``table`` order."""
+    lang = lang or LANGUAGE_KO
+    if table.empty:
+        print_instant(lang.t("screen_no_match"))
+        return
+    rows = []
+    for ticker, row in table.iterrows():
+        position = row.get("position")
+        rows.append(
+            [
+                str(ticker),
+                format_number(_finite(row["price"])),
+                format_percent(_finite(row["change"]), digits=1),
+                _fixed(_finite(row["rsi"]), 1),
+                _fixed(_finite(row["score"]), 1),
+                lang.t(row["rating"]),
+                lang.t(row["signal"]),
+                lang.t(f"channel_position_{position}") if isinstance(position, str) else "-",
+            ]
+        )
+    labels = [lang.t(f"screen_column_{name}") for name in SCREEN_TABLE_COLUMNS]
+    widths = [
+        max(_text_width(cells[index]) for cells in [labels, *rows]) for index in range(len(labels))
+    ]
+
+    def line(cells: list[str]) -> str:
+        padded = []
+        for name, cell, width in zip(SCREEN_TABLE_COLUMNS, cells, widths):
+            fill = " " * (width - _text_width(cell))
+            padded.append(fill + cell if name in _SCREEN_NUMERIC else cell + fill)
+        return "  ".join(padded).rstrip()
+
+    print_instant(line(labels))
+    print_instant("  ".join("-" * width for width in widths))
+    for cells in rows:
+        print_instant(line(cells))
@@ -7,7 +7,11 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from .cache import TTLCache
+from .provider import get_provider
+from .shared_cache import shared_tier
+from .singleflight import SingleFlight
 
 POSITIVE_WORDS = {
     "beat",
@@ -227,8 +231,26 @@ def _value_news_sentiment(ctx: Dict[str, Any]) -> Tuple[Optional[float], Optiona
     return sentiment, f"{sentiment * 100:.1f}% positive"
 
 
+# Excess 20-day return over the benchmark that moves the momentum score from 0.5 to ~0.73.
+MOMENTUM_SCALE = 0.03
+_MOMENTUM_FLIGHT = SingleFlight("momentum_benchmark")
+_MOMENTUM_CACHE: TTLCache[pd.Series] = TTLCache(
+    "momentum_benchmark", ttl=900, max_entries=16, shared=shared_tier("momentum_benchmark")
+)
+
+
 def _fetch_benchmark(symbol: str) -> pd.Series:
-    data = yf.download(
+    cached = _MOMENTUM_CACHE.get(symbol)
+    if cached is not None:
+        return cached
+    data = _MOMENTUM_FLIGHT.do(symbol, _download_benchmark, symbol)
+    if data is not None:
+        _MOMENTUM_CACHE.set(symbol, data)
+    return data
+
+
+def _download_benchmark(symbol: str) -> pd.Series:
+    data = get_provider().download(
         symbol,
         period="3mo",
         interval="1d",
@@ -238,19 +260,24 @@ def _fetch_benchmark(symbol: str) -> pd.Series:
     return data["Close"] if not data.empty else None
 
 
+def momentum_benchmark_symbol(symbol: str) -> str:
+    """Index the market-momentum indicator compares ``symbol`` against."""
+    return "^KS11" if symbol.endswith((".KS", ".KQ")) else "^GSPC"
+
+
 def _value_market_momentum(ctx: Dict[str, Any]) -> Tuple[Optional[float], Optional[str]]:
     close = ctx["close"]
     if len(close) < 20:
         return None, None
     ticker_return = close.pct_change().dropna().tail(20).add(1).prod() - 1
     symbol = ctx["symbol"]
-    benchmark_symbol = "^KS11" if symbol.endswith((".KS", ".KQ")) else "^GSPC"
+    benchmark_symbol = momentum_benchmark_symbol(symbol)
     benchmark = _fetch_benchmark(benchmark_symbol)
     if benchmark is None or len(benchmark) < 20:
         return None, None
     bench_return = benchmark.pct_change().dropna().tail(20).add(1).prod() - 1
     diff = ticker_return - bench_return
-    value = sigmoid(diff / 0.03)
+    value = sigmoid(diff / MOMENTUM_SCALE)
     return value, f"{diff * 100:.1f}% vs {benchmark_symbol}"
 
 
@@ -276,14 +303,21 @@ CATEGORY_LABEL_KEYS = {
     "sentiment": "category_sentiment",
 }
 
-def _rating_label(score_01: float) -> str:
-    if score_01 >= 0.8:
-        return "rating_strong_buy"
-    if score_01 >= 0.6:
-        return "rating_buy"
-    if score_01 >= 0.4:
-        return "rating_neutral"
-    return "rating_sell"
+
+# Lower bound of each rating, highest first; anything below the last is a sell.
+RATING_CUTOFFS: Tuple[Tuple[str, float], ...] = (
+    ("rating_strong_buy", 0.8),
+    ("rating_buy", 0.6),
+    ("rating_neutral", 0.4),
+)
+RATING_FLOOR = "rating_sell"
+
+
+def _rating_label(score_01: float, cutoffs: Tuple[Tuple[str, float], ...] = RATING_CUTOFFS) -> str:
+    for label, threshold in cutoffs:
+        if score_01 >= threshold:
+            return label
+    return RATING_FLOOR
 
 
 def build_scorecard(context: Dict[str, Any]) -> Dict[str, Any]:
@@ -340,6 +374,215 @@ def build_scorecard(context: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _sigmoid_array(values):
+    with np.errstate(over="ignore"):
+        return 1 / (1 + np.exp(-values))
+
+
+def _missing(like):
+    return like * np.nan
+
+
+def _warmed_up(values, reference, bars: int):
+    # Blank out each column's first ``bars - 1`` observations of ``reference``.
+    return values.where(reference.notna().cumsum() >= bars)
+
+
+# The series calculators accept a Series per context value (one ticker) or
+# (date x ticker) frames (a whole universe) and return the same shape.
+def _series_rsi(ctx: Dict[str, Any]):
+    # ``min_max`` maps a NaN (warm-up) RSI to 100, i.e. a score of 0; keep that.
+    return 1 - ctx["rsi_series"].clip(0, 100).fillna(100) / 100
+
+
+def _series_macd(ctx: Dict[str, Any]):
+    hist = ctx["macd_hist"]
+    window = hist.rolling(60, min_periods=1)
+    std = window.std(ddof=0).fillna(0.0)
+    z = (hist - window.mean()) / std.where(std > 1e-6, 1e-6)
+    return _sigmoid_array(z)
+
+
+def _series_volume_spike(ctx: Dict[str, Any]):
+    volume = ctx["volume"]
+    if volume is None:
+        return _missing(ctx["close"])
+    recent = volume.rolling(5, min_periods=1).mean()
+    baseline = volume.rolling(30, min_periods=1).mean()
+    ratio = _warmed_up(recent / baseline.where(baseline > 0), volume, 30)
+    return _sigmoid_array((ratio - 1.0) / 0.25)
+
+
+def _series_volatility(ctx: Dict[str, Any]):
+    vol = ctx["close"].pct_change().rolling(30).std(ddof=0) * np.sqrt(252)
+    return 1 - _sigmoid_array((vol - 0.35) / 0.15)
+
+
+def _series_ma_alignment(ctx: Dict[str, Any]):
+    close = ctx["close"]
+    sma5 = close.rolling(5).mean()
+    sma20 = close.rolling(20).mean()
+    sma60 = close.rolling(60).mean()
+    aligned = (sma5 > sma20).astype(int) + (sma20 > sma60).astype(int)
+    score = (aligned + (close > sma60).astype(int)) / 3
+    return _warmed_up(score, close, 60)
+
+
+def _series_52w_ratio(ctx: Dict[str, Any]):
+    close = ctx["close"]
+    high_52 = close.rolling(window=252, min_periods=50).max()
+    ratio = close / high_52.where(high_52 != 0)
+    return (1 - ratio).clip(0.0, 1.0)
+
+
+def _series_money_flow(ctx: Dict[str, Any]):
+    close, volume, open_ = ctx["close"], ctx["volume"], ctx.get("open")
+    if volume is None or open_ is None:
+        return _missing(close)
+    flow = ((close - open_) * volume).rolling(5, min_periods=1).sum()
+    # The first bar of each 5-bar window contributes no move, hence 4 terms.
+    scale = (close.diff().fillna(0) * volume).abs().rolling(4, min_periods=1).sum()
+    traded = volume.rolling(5, min_periods=1).sum()
+    normalized = (flow / scale).where((scale != 0) & (traded != 0))
+    return (normalized + 1) / 2
+
+
+def trailing_return(close, bars: int = 20):
+    # Compounded return of the last ``bars`` daily returns; only bars - 1 are
+    # available on bar ``bars``, which the scorecard still accepts.
+    seen = close.notna().cumsum()
+    first = close.where(seen == 1).ffill()
+    base = close.shift(bars).where(seen != bars, first)
+    return close / base - 1
+
+
+def _series_market_momentum(ctx: Dict[str, Any]):
+    close = ctx["close"]
+    benchmark = ctx.get("benchmark")
+    if benchmark is None or len(benchmark) < 20:
+        return _missing(close)
+    bench_return = trailing_return(benchmark.dropna()).reindex(close.index, method="ffill")
+    return _sigmoid_array(trailing_return(close).sub(bench_return, axis=0) / MOMENTUM_SCALE)
+
+
+def momentum_score(ticker_return, benchmark_return):
+    """Market-momentum score (0..1) from trailing 20-bar ticker and benchmark returns."""
+    return _sigmoid_array((ticker_return - benchmark_return) / MOMENTUM_SCALE)
+
+
+# Vectorized counterparts of the price-derived calculators: one score per bar.
+SERIES_CALCULATORS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "rsi": _series_rsi,
+    "macd": _series_macd,
+    "volume_spike": _series_volume_spike,
+    "volatility": _series_volatility,
+    "ma_alignment": _series_ma_alignment,
+    "fiftytwo_ratio": _series_52w_ratio,
+    "money_flow": _series_money_flow,
+    "market_momentum": _series_market_momentum,
+}
+
+
+def _weighted_scores(context: Dict[str, Any], static: Dict[str, float]) -> Dict[str, Any]:
+    """Per-indicator scores (missing -> 0.5) and their weighted ``total``."""
+    close = context["close"]
+    scores: Dict[str, Any] = {}
+    total = 0.0
+    total_weight = sum(ind.weight for ind in INDICATORS) or 1.0
+    for definition in INDICATORS:
+        calculator = SERIES_CALCULATORS.get(definition.key)
+        if calculator is not None:
+            values = calculator(context).clip(0.0, 1.0).fillna(0.5)
+        else:
+            values = close * 0.0 + static.get(definition.key, 0.5)
+        scores[definition.key] = values
+        total = total + values * definition.weight
+    scores["total"] = total / total_weight
+    return scores
+
+
+def build_scorecard_series(
+    history: pd.DataFrame,
+    *,
+    macd_df: pd.DataFrame | None = None,
+    rsi_series: pd.Series | None = None,
+    fundamentals: Dict[str, Any] | None = None,
+    benchmark: pd.Series | None = None,
+) -> pd.DataFrame:
+    """Point-in-time scorecard for every bar: (date x indicator) scores in 0..1 plus ``total``.
+
+    Each row uses only data up to that date, and the last row matches
+    ``build_scorecard`` for the same inputs. Indicators without a per-bar
+    series (valuation, EPS growth, news) are scored once from
+    ``fundamentals`` (``info``/``income_stmt``/``news``) and held constant, or
+    neutral when absent; ``market_momentum`` needs ``benchmark`` closes.
+    Missing values score 0.5, as in the scorecard. Multiply by 100 for the
+    report's scale.
+    """
+    from .indicators import compute_macd, compute_rsi
+
+    if history["Close"].isna().any():
+        history = history.loc[history["Close"].notna()]
+    close = history["Close"].astype(float)
+    context = {
+        "close": close,
+        "volume": history["Volume"].astype(float) if "Volume" in history else None,
+        "open": history["Open"].astype(float) if "Open" in history else None,
+        "macd_hist": (
+            compute_macd(close) if macd_df is None else macd_df.reindex(close.index)
+        )["hist"],
+        "rsi_series": compute_rsi(close) if rsi_series is None else rsi_series.reindex(close.index),
+        "benchmark": benchmark,
+    }
+    static: Dict[str, float] = {}
+    if fundamentals:
+        fundamentals_context = {**context, "history": history, **fundamentals}
+        for definition in INDICATORS:
+            if definition.key in SERIES_CALCULATORS:
+                continue
+            try:
+                raw_value, _ = definition.calculator(fundamentals_context)
+            except Exception:  # noqa: BLE001
+                raw_value = None
+            static[definition.key] = _neutralize(raw_value)[0]
+    return pd.DataFrame(_weighted_scores(context, static))
+
+
+def build_scorecard_matrix(
+    close: pd.DataFrame,
+    *,
+    volume: pd.DataFrame | None = None,
+    open_: pd.DataFrame | None = None,
+    benchmark: pd.Series | None = None,
+) -> Dict[str, pd.DataFrame]:
+    """``build_scorecard_series`` for a whole universe at once.
+
+    Takes aligned (date x ticker) matrices and returns one (date x ticker)
+    score frame per indicator plus ``total``. Gaps inside a ticker's history
+    are forward-filled (no move, no volume); cells before a ticker's first
+    close stay NaN. Fundamental indicators are neutral.
+    """
+    from .indicators import compute_rsi, macd_lines
+
+    listed = close.notna()
+    filled = close.astype(float).ffill()
+    macd, signal_line = macd_lines(filled)
+    if volume is not None:
+        volume = volume.reindex_like(close).astype(float).where(listed, 0.0).where(filled.notna())
+    if open_ is not None:
+        open_ = open_.reindex_like(close).astype(float).fillna(filled)
+    context = {
+        "close": filled,
+        "volume": volume,
+        "open": open_,
+        "macd_hist": macd - signal_line,
+        "rsi_series": compute_rsi(filled),
+        "benchmark": benchmark,
+    }
+    scores = _weighted_scores(context, {})
+    return {key: frame.where(filled.notna()) for key, frame in scores.items()}
+
+
 def _confidence_key(distance: float) -> str:
     if distance >= 0.25:
         return "prob_confidence_high"
@@ -0,0 +1,321 @@
+"""Universe screener: price-only scores for many tickers in one vectorized pass.
+
+Histories come from batched downloads (served from the price cache when warm)
+and are aligned into (date x ticker) matrices. ``scoring.build_scorecard_matrix``
+scores them, and RSI, the MACD/RSI signal and the price-channel position are
+read off the last bar of every ticker at once. ``stock-cli screen`` drives it:
+
+    stock-cli screen --universe sp500.txt --filter "rsi<30" --filter "position=lower" --top 20
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .backtest import ACTION_KEYS, rating_codes, signal_codes
+from .data import history_matrix
+from .indicators import compute_rsi, macd_lines
+from .scoring import (
+    INDICATORS,
+    RATING_CUTOFFS,
+    RATING_FLOOR,
+    SERIES_CALCULATORS,
+    build_scorecard_matrix,
+    momentum_score,
+    trailing_return,
+)
+
+CHANNEL_WINDOW = 60
+MIN_CHANNEL_BARS = 10
+# Printed by the CLI; every other column of the table can still be filtered on.
+SCREEN_COLUMNS = ("price", "change", "rsi", "score", "rating", "signal", "position")
+OPERATORS: Dict[str, Callable[[object, object], object]] = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "=": operator.eq,
+}
+_FILTER_PATTERN = re.compile(r"^\s*([A-Za-z_]\w*)\s*(<=|>=|!=|==|<|>|=)\s*(.+?)\s*$")
+# Label prefixes/suffixes accepted in filter values, e.g. "lower channel" or "action_bullish".
+_LABEL_PREFIXES = ("action_", "rating_", "channel_position_", "channel_trend_")
+_LABEL_SUFFIXES = (" channel", "_channel", " band", "_band")
+
+
+def _unknown_column(column: str, table: pd.DataFrame) -> str:
+    return f"Unknown screen column: {column} (choose from {', '.join(table.columns)})"
+
+
+@dataclass(frozen=True)
+class ScreenFilter:
+    column: str
+    operator: str
+    value: float | str
+
+    def mask(self, table: pd.DataFrame) -> pd.Series:
+        if self.column not in table:
+            raise ValueError(_unknown_column(self.column, table))
+        compare = OPERATORS[self.operator]
+        if isinstance(self.value, str):
+            if self.operator not in ("=", "!="):
+                raise ValueError(
+                    f"Only = and != apply to text values: {self.column}{self.operator}{self.value}"
+                )
+            return compare(table[self.column].map(_normalize_label), self.value)
+        values = pd.to_numeric(table[self.column], errors="coerce")
+        return compare(values, self.value) & values.notna()
+
+
+def _normalize_label(value: object) -> str:
+    text = str(value).strip().lower()
+    for prefix in _LABEL_PREFIXES:
+        if text.startswith(prefix):
+            text = text[len(prefix) :]
+    for suffix in _LABEL_SUFFIXES:
+        if text.endswith(suffix):
+            text = text[: -len(suffix)]
+    return text.replace(" ", "_")
+
+
+def parse_filter(expression: str) -> ScreenFilter:
+    """``column<op>value``, e.g. ``rsi<30``, ``score>=70`` or ``position=lower channel``."""
+    match = _FILTER_PATTERN.match(expression)
+    if not match:
+        raise ValueError(f"Invalid screen filter: {expression}")
+    column, op, raw = match.groups()
+    try:
+        value: float | str = float(raw)
+    except ValueError:
+        value = _normalize_label(raw)
+    return ScreenFilter(column.lower(), "=" if op == "==" else op, value)
+
+
+def read_universe(paths: Iterable[str | Path]) -> List[str]:
+    """Tickers from text files: separated by whitespace or commas, ``#`` starts a comment."""
+    tickers: List[str] = []
+    for path in paths:
+        for line in Path(path).read_text(encoding="utf-8").splitlines():
+            content = line.split("#", 1)[0]
+            tickers.extend(item.upper() for item in re.split(r"[\s,]+", content) if item)
+    return list(dict.fromkeys(tickers))
+
+
+def _bottom_align(frame: pd.DataFrame, order: np.ndarray) -> pd.DataFrame:
+    values = np.take_along_axis(frame.to_numpy(dtype=float), order, axis=0)
+    return pd.DataFrame(values, columns=frame.columns)
+
+
+def _own_bars(close: pd.DataFrame) -> np.ndarray:
+    """Row order that moves each column's NaNs to the top, keeping its closes in date order.
+
+    Applied with ``_bottom_align`` every column holds only the ticker's own
+    bars and ends on its latest one, so rolling indicators match a per-ticker
+    run even when calendars differ or a ticker stopped trading.
+    """
+    return np.argsort(close.notna().to_numpy(), axis=0, kind="stable")
+
+
+def channel_positions(close: pd.DataFrame, window: int = CHANNEL_WINDOW) -> pd.DataFrame:
+    """``analyze_price_channel`` trend and position for every column at once.
+
+    Each ticker's channel is fitted to its own last ``window`` closes, skipping
+    dates it has no close for; tickers with fewer than 10 get no channel.
+    """
+    recent = _bottom_align(close, _own_bars(close)).to_numpy()[-window:]
+    counts = np.minimum(close.notna().sum().to_numpy(), recent.shape[0])
+    x = np.arange(recent.shape[0])[:, None] - (recent.shape[0] - counts)
+    used = x >= 0
+    x = np.where(used, x, 0).astype(float)
+    y = np.where(used, recent, 0.0)
+    n = np.maximum(counts, 1).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = x.sum(axis=0) / n
+        y_mean = y.sum(axis=0) / n
+        dx = np.where(used, x - x_mean, 0.0)
+        slope = (dx * (y - y_mean)).sum(axis=0) / (dx**2).sum(axis=0)
+        intercept = y_mean - slope * x_mean
+        residuals = np.where(used, y - (slope * x + intercept), 0.0)
+        residual_mean = residuals.sum(axis=0) / n
+        band = np.sqrt((np.where(used, residuals - residual_mean, 0.0) ** 2).sum(axis=0) / n)
+    latest_pred = slope * (counts - 1) + intercept
+    latest = recent[-1] if len(recent) else np.full(close.shape[1], np.nan)
+    enough = counts >= MIN_CHANNEL_BARS
+    position = np.select(
+        [latest > latest_pred + 0.5 * band, latest < latest_pred - 0.5 * band],
+        ["upper", "lower"],
+        default="mid",
+    )
+    trend = np.select([slope > 0, slope < 0], ["up", "down"], default="flat")
+    return pd.DataFrame(
+        {
+            "trend": np.where(enough, trend, None),
+            "position": np.where(enough, position, None),
+            "channel_upper": np.where(enough, latest_pred + band, np.nan),
+            "channel_lower": np.where(enough, latest_pred - band, np.nan),
+        },
+        index=close.columns,
+    )
+
+
+def _momentum(
+    own: pd.DataFrame,
+    last_date: pd.Series,
+    benchmark: pd.Series | Mapping[str, pd.Series | None],
+) -> pd.Series:
+    """Market-momentum score on each ticker's latest bar.
+
+    Each ticker is compared with its benchmark's return up to that same date.
+    """
+    if isinstance(benchmark, Mapping):
+        per_ticker = benchmark
+    else:
+        per_ticker = dict.fromkeys(own.columns, benchmark)
+    groups: Dict[int, tuple[pd.Series | None, List[str]]] = {}
+    for ticker in own.columns:
+        series = per_ticker.get(ticker)
+        groups.setdefault(id(series), (series, []))[1].append(ticker)
+    benchmark_return = pd.Series(np.nan, index=own.columns)
+    for series, tickers in groups.values():
+        if series is None or len(series.dropna()) < 20:
+            continue
+        returns = trailing_return(series.dropna().sort_index())
+        on_last_date = returns.reindex(pd.DatetimeIndex(last_date[tickers]), method="ffill")
+        benchmark_return[tickers] = on_last_date.to_numpy()
+    ticker_return = trailing_return(own).iloc[-1]
+    return momentum_score(ticker_return, benchmark_return).clip(0.0, 1.0).fillna(0.5)
+
+
+def screen_table(
+    close: pd.DataFrame,
+    *,
+    volume: pd.DataFrame | None = None,
+    open_: pd.DataFrame | None = None,
+    benchmark: pd.Series | Mapping[str, pd.Series | None] | None = None,
+    channel_window: int = CHANNEL_WINDOW,
+) -> pd.DataFrame:
+    """One row per ticker (column of ``close``) describing its latest bar.
+
+    ``score`` is the weighted scorecard total over the price-derived
+    indicators only, on the report's 0..100 scale, and ``rating`` its label;
+    each indicator's own score is kept as ``score_<key>``. ``signal`` is the
+    ``determine_signal`` action and ``position``/``trend`` come from the
+    ``channel_window``-day price channel. Tickers are evaluated on their own
+    latest bar (``date``), so stale quotes are not padded with flat days.
+    ``benchmark`` (one close series, or one per ticker) drives market momentum.
+    """
+    close = close.sort_index().astype(float)
+    close = close.loc[:, close.notna().any()]
+    order = _own_bars(close)
+    own = _bottom_align(close, order)
+    scores = build_scorecard_matrix(
+        own,
+        volume=None if volume is None else _bottom_align(volume.reindex_like(close), order),
+        open_=None if open_ is None else _bottom_align(open_.reindex_like(close), order),
+    )
+    weights = {
+        definition.key: definition.weight
+        for definition in INDICATORS
+        if definition.key in SERIES_CALCULATORS
+    }
+    latest = {key: scores[key].iloc[-1] for key in weights}
+    last_date = close.apply(pd.Series.last_valid_index)
+    if benchmark is not None:
+        latest["market_momentum"] = _momentum(own, last_date, benchmark)
+    total = sum(latest[key] * weight for key, weight in weights.items()) / sum(weights.values())
+
+    rsi = compute_rsi(own).iloc[-1]
+    macd, signal_line = (line.iloc[-1] for line in macd_lines(own))
+    ratings = np.array([label for label, _ in RATING_CUTOFFS] + [RATING_FLOOR])
+    signals = signal_codes(macd.to_numpy(), signal_line.to_numpy(), rsi.to_numpy())
+    table = pd.DataFrame(
+        {
+            "date": last_date,
+            "price": own.iloc[-1],
+            "change": own.iloc[-1] / own.iloc[-2] - 1 if len(own) > 1 else np.nan,
+            "rsi": rsi,
+            "score": total * 100,
+            "rating": ratings[rating_codes(total.to_numpy())],
+            "signal": np.array(ACTION_KEYS)[signals],
+        },
+        index=close.columns,
+    )
+    table = table.join(channel_positions(close, channel_window))
+    for key in weights:
+        table[f"score_{key}"] = latest[key] * 100
+    table.index.name = "ticker"
+    return table
+
+
+def apply_filters(table: pd.DataFrame, filters: Sequence[ScreenFilter]) -> pd.DataFrame:
+    mask = pd.Series(True, index=table.index)
+    for screen_filter in filters:
+        mask &= screen_filter.mask(table)
+    return table.loc[mask]
+
+
+def rank_table(
+    table: pd.DataFrame,
+    sort_by: str = "score",
+    *,
+    top: int | None = None,
+    bottom: int | None = None,
+) -> pd.DataFrame:
+    """Highest ``top`` rows by ``sort_by`` followed by the lowest ``bottom``.
+
+    All rows are returned, sorted, when neither is set.
+    """
+    if sort_by not in table:
+        raise ValueError(_unknown_column(sort_by, table))
+    ordered = table.sort_values(sort_by, ascending=False, kind="stable")
+    if top is None and bottom is None:
+        return ordered
+    parts = [ordered.head(top)] if top else []
+    if bottom:
+        tail = ordered.tail(bottom)
+        parts.append(tail.loc[~tail.index.isin(parts[0].index)] if parts else tail)
+    return pd.concat(parts)
+
+
+def screen_histories(
+    histories: Mapping[str, pd.DataFrame],
+    *,
+    benchmark: pd.Series | Mapping[str, pd.Series | None] | None = None,
+    channel_window: int = CHANNEL_WINDOW,
+) -> pd.DataFrame:
+    """``screen_table`` for per-ticker OHLCV histories."""
+    close = history_matrix(histories)
+    if close.empty:
+        return pd.DataFrame()
+    volume, open_ = (history_matrix(histories, column) for column in ("Volume", "Open"))
+    return screen_table(
+        close,
+        volume=None if volume.empty else volume,
+        open_=None if open_.empty else open_,
+        benchmark=benchmark,
+        channel_window=channel_window,
+    )
+
+
+def export_table(table: pd.DataFrame, path: str | Path) -> Path:
+    """Write the screen to ``.json`` (records) or any other suffix as CSV."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    output = table.reset_index()
+    output["date"] = output["date"].map(
+        lambda value: None if pd.isna(value) else pd.Timestamp(value).date().isoformat()
+    )
+    if path.suffix.lower() == ".json":
+        path.write_text(
+            output.to_json(orient="records", force_ascii=False, indent=2), encoding="utf-8"
+        )
+    else:
+        output.to_csv(path, index=False)
+    return path
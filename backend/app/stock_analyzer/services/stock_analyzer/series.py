@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .indicators import compute_macd, compute_rsi
+
+DEFAULT_MAX_POINTS = 1000
+SERIES_DECIMALS = 6
+
+
+def lttb_indices(values: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of ``threshold`` points that keep the shape.
+
+    The first and last points are always kept; every bucket in between contributes
+    the point forming the largest triangle with the previously selected point and
+    the average of the next bucket. NaNs are treated as zero for selection only.
+    """
+    length = len(values)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    y = np.nan_to_num(np.asarray(values, dtype=float))
+    x = np.arange(length, dtype=float)
+    edges = np.linspace(1, length - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = length - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_start = stop
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else length
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def rolling_channel(close: pd.Series, window: int = 60) -> pd.DataFrame:
+    """Rolling version of ``analyze_price_channel``'s regression band, computed in one pass.
+
+    For each date the last ``window`` closes are regressed on 0..window-1; the
+    fitted value at the window end +/- the residual standard deviation gives the
+    channel, matching the latest-bar values reported by ``analyze_price_channel``.
+    """
+    y = close.astype(float)
+    x_mean = (window - 1) / 2
+    x_var = (window * window - 1) / 12
+    y_mean = y.rolling(window).mean()
+    y_var = y.rolling(window).var(ddof=0)
+    # sum_i i * y_{s+i} with s = t - window + 1 equals sum_m m * y_m - s * sum_m y_m.
+    position = np.arange(len(y), dtype=float)
+    weighted = pd.Series(position * y.to_numpy(), index=y.index).rolling(window).sum()
+    window_start = pd.Series(position - window + 1, index=y.index)
+    xy = weighted - window_start * y.rolling(window).sum()
+    cov = xy / window - x_mean * y_mean
+    slope = cov / x_var
+    band = np.sqrt((y_var - slope * slope * x_var).clip(lower=0))
+    fitted_end = y_mean + slope * (window - 1 - x_mean)
+    return pd.DataFrame(
+        {
+            "channel_mid": fitted_end,
+            "channel_upper": fitted_end + band,
+            "channel_lower": fitted_end - band,
+        }
+    )
+
+
+def rolling_volatility(close: pd.Series, window: int = 30) -> pd.Series:
+    returns = close.astype(float).pct_change()
+    return returns.rolling(window, min_periods=max(5, window // 2)).std(ddof=0) * np.sqrt(252)
+
+
+def _column(values) -> list:
+    array = np.round(np.asarray(values, dtype=float), SERIES_DECIMALS)
+    return [None if np.isnan(value) else value for value in array.tolist()]
+
+
+def build_chart_series(
+    history: pd.DataFrame,
+    *,
+    start: str | None = None,
+    end: str | None = None,
+    points: int | None = None,
+    channel_window: int = 60,
+    volatility_window: int = 30,
+    scores: bool = False,
+) -> dict:
+    """Columnar chart data: parallel arrays for price, volume and indicator series.
+
+    Indicators are computed over the full history before slicing so the first
+    visible values are already warmed up. The result is downsampled with LTTB on
+    the close price to ``points`` (default ``DEFAULT_MAX_POINTS``), applying the
+    same indices to every column so they stay aligned. With ``scores`` the
+    point-in-time scorecard (0..100, price-derived indicators only) is added as
+    ``score_total`` and one ``score_<indicator>`` column per indicator.
+    """
+    close = history["Close"].astype(float)
+    macd_df = compute_macd(close)
+    channel = rolling_channel(close, channel_window)
+    frame = pd.DataFrame(
+        {
+            "close": close,
+            "volume": history["Volume"].astype(float) if "Volume" in history else np.nan,
+            "macd": macd_df["macd"],
+            "macd_signal": macd_df["signal"],
+            "macd_hist": macd_df["hist"],
+            "rsi": compute_rsi(close),
+            "channel_mid": channel["channel_mid"],
+            "channel_upper": channel["channel_upper"],
+            "channel_lower": channel["channel_lower"],
+            "volatility": rolling_volatility(close, volatility_window),
+        },
+        index=history.index,
+    )
+    if scores:
+        from .scoring import build_scorecard_series
+
+        scorecard = build_scorecard_series(history, macd_df=macd_df, rsi_series=frame["rsi"]) * 100
+        scorecard.columns = [f"score_{column}" for column in scorecard.columns]
+        frame = frame.join(scorecard)
+    if start:
+        frame = frame.loc[frame.index >= pd.Timestamp(start)]
+    if end:
+        frame = frame.loc[frame.index <= pd.Timestamp(end)]
+
+    total = len(frame)
+    target = points or DEFAULT_MAX_POINTS
+    indices = lttb_indices(frame["close"].to_numpy(), target)
+    sampled = frame.iloc[indices]
+    return {
+        "points": len(sampled),
+        "total_points": total,
+        "downsampled": len(sampled) < total,
+        "dates": [pd.Timestamp(value).strftime("%Y-%m-%d") for value in sampled.index],
+        "series": {name: _column(sampled[name].to_numpy()) for name in sampled.columns},
+    }
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from stock_analyzer.metrics import CACHE_REQUESTS
+
+logger = logging.getLogger("stock_api")
+
+# Host-local file shared by every worker process; unset disables the shared tier.
+SHARED_CACHE_PATH = os.getenv("SHARED_CACHE_PATH", "")
+# Expired rows are purged after this many writes from one process.
+SHARED_CACHE_EVICT_EVERY = int(os.getenv("SHARED_CACHE_EVICT_EVERY", "256"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    blob BLOB NOT NULL
+)
+"""
+
+_LEASE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class SharedCache:
+    """TTL key/value store in a local SQLite file that all workers on a host can use.
+
+    Values are pickled, each write is a single ``INSERT OR REPLACE`` (atomic under
+    SQLite's locking) and expiry uses wall-clock time so it means the same thing
+    in every process. Failures are logged and treated as misses; the shared tier
+    must never break a request.
+    """
+
+    def __init__(self, path: str, *, clock: Callable[[], float] = time.time) -> None:
+        self.path = path
+        self._clock = clock
+        self._local = threading.local()
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.execute(_LEASE_SCHEMA)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return ``(value, remaining_ttl)`` or None when missing or expired."""
+        now = self._clock()
+        try:
+            row = self._connection().execute(
+                "SELECT expires_at, blob FROM cache_entries WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            return pickle.loads(row[1]), row[0] - now
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError) as exc:
+            logger.warning("Shared cache read failed for %s: %s", key, exc)
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, expires_at, blob) VALUES (?, ?, ?)",
+                (key, self._clock() + ttl, blob),
+            )
+        except (sqlite3.Error, pickle.PicklingError, TypeError) as exc:
+            logger.warning("Shared cache write failed for %s: %s", key, exc)
+            return
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % SHARED_CACHE_EVICT_EVERY == 0
+        if evict:
+            self.evict_expired()
+
+    def delete(self, key: str) -> None:
+        try:
+            self._connection().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        except sqlite3.Error as exc:
+            logger.warning("Shared cache delete failed for %s: %s", key, exc)
+
+    def evict_expired(self) -> int:
+        try:
+            cursor = self._connection().execute(
+                "DELETE FROM cache_entries WHERE expires_at <= ?", (self._clock(),)
+            )
+        except sqlite3.Error as exc:
+            logger.warning("Shared cache eviction failed: %s", exc)
+            return 0
+        return cursor.rowcount
+
+
+    def try_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """Claim or renew the named lease for ``ttl`` seconds; False while another owner holds it.
+
+        The upsert only overwrites a row that has expired or already belongs to
+        ``owner``, so exactly one process wins a contested claim. A failing store
+        grants the lease: duplicated work is better than none.
+        """
+        now = self._clock()
+        try:
+            cursor = self._connection().execute(
+                "INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, "
+                "expires_at = excluded.expires_at "
+                "WHERE leases.expires_at <= ? OR leases.owner = excluded.owner",
+                (name, owner, now + ttl, now),
+            )
+        except sqlite3.Error as exc:
+            logger.warning("Shared cache lease failed for %s: %s", name, exc)
+            return True
+        return cursor.rowcount == 1
+
+
+class SharedTier:
+    """One named namespace inside a ``SharedCache``, plugged behind a ``TTLCache``."""
+
+    def __init__(self, store: SharedCache, name: str) -> None:
+        self.store = store
+        self.name = name
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.name}:{key!r}"
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        entry = self.store.get(self._key(key))
+        CACHE_REQUESTS.inc(
+            cache=f"{self.name}_shared", result="hit" if entry is not None else "miss"
+        )
+        return entry
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        self.store.set(self._key(key), value, ttl)
+
+    def delete(self, key: Hashable) -> None:
+        self.store.delete(self._key(key))
+
+
+SHARED_CACHE: SharedCache | None = SharedCache(SHARED_CACHE_PATH) if SHARED_CACHE_PATH else None
+
+
+def shared_tier(name: str) -> SharedTier | None:
+    """Namespace in the process-wide shared cache, or None when it is disabled."""
+    return SharedTier(SHARED_CACHE, name) if SHARED_CACHE is not None else None
@@ -0,0 +1,328 @@
+"""Parallel parameter sweeps over the signal backtest.
+
+The MACD spans, RSI bands and rating cutoffs baked into the report are
+defaults, not facts. ``run_sweep`` backtests every combination of a parameter
+grid against every ticker of a (date x ticker) close matrix and ranks the
+combinations. The matrices are placed in shared memory once and mapped by each
+worker process, so only parameters and result rows cross process boundaries.
+
+    PYTHONPATH=backend/app python -m stock_analyzer.services.stock_analyzer.sweep \\
+        --synthetic 500 --years 10 --grid macd_fast=8,12,16 --grid rsi_overbought=65,70,75
+    ... --strategy rating --grid rating_buy=0.55,0.6,0.65 --grid rating_neutral=0.35,0.4
+
+The rating strategy trades the point-in-time scorecard total from
+``scoring.build_scorecard_series``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .backtest import (
+    ACTION_KEYS,
+    RATING_TARGETS,
+    SIGNAL_TARGETS,
+    hold_forward,
+    performance_stats,
+    rating_codes,
+    signal_codes,
+    simulate,
+    targets_from_codes,
+)
+from .indicators import MACD_SPANS, RSI_BANDS, compute_rsi, macd_lines
+from .scoring import RATING_CUTOFFS, RATING_FLOOR, build_scorecard_series
+
+DEFAULT_PARAMS: Dict[str, float] = {
+    "macd_fast": MACD_SPANS[0],
+    "macd_slow": MACD_SPANS[1],
+    "macd_signal": MACD_SPANS[2],
+    "rsi_overbought": RSI_BANDS[0],
+    "rsi_oversold": RSI_BANDS[1],
+    **{label: threshold for label, threshold in RATING_CUTOFFS},
+}
+# Parameters each strategy reads (and may sweep).
+STRATEGY_PARAMS: Dict[str, Tuple[str, ...]] = {
+    "signal": ("macd_fast", "macd_slow", "macd_signal", "rsi_overbought", "rsi_oversold"),
+    "rating": tuple(label for label, _ in RATING_CUTOFFS),
+}
+STRATEGIES = tuple(STRATEGY_PARAMS)
+METRICS = ("sharpe", "total_return", "cagr", "max_drawdown", "turnover", "trades", "exposure")
+# Metrics where smaller is better when ranking.
+ASCENDING_METRICS = {"max_drawdown", "turnover", "trades"}
+DEFAULT_CHUNK = 256
+
+# Shared arrays mapped by the current worker process: name -> (segment, array).
+_SHARED: Dict[str, Tuple[shared_memory.SharedMemory | None, np.ndarray]] = {}
+
+
+def expand_grid(
+    grid: Mapping[str, Sequence[float]], strategy: str = "signal"
+) -> List[Dict[str, float]]:
+    """Every combination of ``grid`` over ``DEFAULT_PARAMS``, minus inconsistent ones."""
+    if strategy not in STRATEGY_PARAMS:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    unknown = set(grid) - set(STRATEGY_PARAMS[strategy])
+    if unknown:
+        raise ValueError(f"Unknown {strategy} sweep parameters: {', '.join(sorted(unknown))}")
+    keys = list(grid)
+    combos = []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        params = {**DEFAULT_PARAMS, **dict(zip(keys, values))}
+        if strategy == "signal" and not (
+            params["macd_fast"] < params["macd_slow"]
+            and params["rsi_oversold"] < params["rsi_overbought"]
+        ):
+            continue
+        cutoffs = [params[label] for label, _ in RATING_CUTOFFS]
+        if strategy == "rating" and cutoffs != sorted(cutoffs, reverse=True):
+            continue
+        combos.append(params)
+    return combos
+
+
+def parse_grid(items: Iterable[str]) -> Dict[str, List[float]]:
+    """``["macd_fast=8,12", "rsi_overbought=65,70"]`` -> ``{"macd_fast": [8, 12], ...}``."""
+    grid: Dict[str, List[float]] = {}
+    for item in items:
+        key, _, raw = item.partition("=")
+        values = [float(value) for value in raw.split(",") if value.strip()]
+        if not values:
+            raise ValueError(f"No values given for {key!r}")
+        grid[key.strip()] = [int(value) if value.is_integer() else value for value in values]
+    return grid
+
+
+def _share(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, Tuple[str, tuple, str]]:
+    segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+    return segment, (segment.name, array.shape, array.dtype.str)
+
+
+def _attach(specs: Mapping[str, Tuple[str, tuple, str]]) -> None:
+    for key, (name, shape, dtype) in specs.items():
+        segment = shared_memory.SharedMemory(name=name)
+        _SHARED[key] = (segment, np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf))
+
+
+def _evaluate(
+    task: Tuple[str, int, int, List[Tuple[int, Dict[str, float]]], float]
+) -> Dict[str, np.ndarray]:
+    """Backtest ``combos`` (all sharing MACD spans) on columns ``start:stop``.
+
+    Returns the result columns.
+    """
+    strategy, start, stop, combos, cost_rate = task
+    close = pd.DataFrame(_SHARED["close"][1][:, start:stop])
+    width = stop - start
+    columns: Dict[str, List[np.ndarray]] = {
+        "combo": [],
+        "column": [],
+        **{key: [] for key in METRICS},
+    }
+    if strategy == "signal":
+        _, first = combos[0]
+        macd, signal_line = macd_lines(
+            close, int(first["macd_fast"]), int(first["macd_slow"]), int(first["macd_signal"])
+        )
+        macd, signal_line = macd.to_numpy(), signal_line.to_numpy()
+        rsi = compute_rsi(close).to_numpy()
+    else:
+        scores = _SHARED["scores"][1][:, start:stop]
+    prices = close.to_numpy()
+    for index, params in combos:
+        if strategy == "signal":
+            codes = signal_codes(
+                macd,
+                signal_line,
+                rsi,
+                overbought=params["rsi_overbought"],
+                oversold=params["rsi_oversold"],
+            )
+            targets = targets_from_codes(codes, ACTION_KEYS, SIGNAL_TARGETS)
+        else:
+            cutoffs = [(label, params[label]) for label, _ in RATING_CUTOFFS]
+            codes = rating_codes(scores, cutoffs)
+            labels = [label for label, _ in cutoffs] + [RATING_FLOOR]
+            targets = targets_from_codes(codes, labels, RATING_TARGETS)
+        positions = hold_forward(targets)
+        returns, traded = simulate(prices, positions, cost_bps=cost_rate * 10_000, slippage_bps=0.0)
+        stats = performance_stats(returns, traded, positions)
+        columns["combo"].append(np.full(width, index))
+        columns["column"].append(np.arange(start, stop))
+        for key in METRICS:
+            columns[key].append(np.asarray(stats[key], dtype=float))
+    return {key: np.concatenate(parts) for key, parts in columns.items()}
+
+
+def _tasks(
+    strategy: str, combos: List[Dict[str, float]], columns: int, chunk_size: int, cost_rate: float
+) -> List[tuple]:
+    groups: Dict[tuple, List[tuple]] = {}
+    for index, params in enumerate(combos):
+        spans = ()
+        if strategy == "signal":
+            spans = (params["macd_fast"], params["macd_slow"], params["macd_signal"])
+        groups.setdefault(spans, []).append((index, params))
+    return [
+        (strategy, start, min(start + chunk_size, columns), members, cost_rate)
+        for members in groups.values()
+        for start in range(0, columns, chunk_size)
+    ]
+
+
+def run_sweep(
+    close: pd.DataFrame,
+    grid: Mapping[str, Sequence[float]],
+    *,
+    strategy: str = "signal",
+    scores: pd.DataFrame | None = None,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK,
+    cost_bps: float = 5.0,
+    slippage_bps: float = 5.0,
+) -> pd.DataFrame:
+    """Backtest every grid combination on every ticker; one row per (combination, ticker).
+
+    ``close`` is a (date x ticker) frame; ``strategy="rating"`` trades the
+    rating cutoffs over ``scores`` (0..1, same shape). ``workers=1`` runs in
+    process; otherwise tasks of ``chunk_size`` tickers go to a process pool.
+    """
+    if strategy == "rating" and (scores is None or scores.shape != close.shape):
+        raise ValueError("The rating strategy needs a scores frame shaped like close")
+    combos = expand_grid(grid, strategy)
+    if not combos or close.empty:
+        return pd.DataFrame()
+    arrays = {"close": np.ascontiguousarray(close.ffill().to_numpy(dtype=float))}
+    if strategy == "rating":
+        arrays["scores"] = np.ascontiguousarray(scores.to_numpy(dtype=float))
+    tasks = _tasks(strategy, combos, close.shape[1], chunk_size, (cost_bps + slippage_bps) / 10_000)
+    workers = workers or os.cpu_count() or 1
+
+    parts: List[Dict[str, np.ndarray]] = []
+    if workers == 1 or len(tasks) == 1:
+        _SHARED.update({key: (None, array) for key, array in arrays.items()})
+        try:
+            for task in tasks:
+                parts.append(_evaluate(task))
+        finally:
+            _SHARED.clear()
+    else:
+        segments, specs = {}, {}
+        try:
+            for key, array in arrays.items():
+                segments[key], specs[key] = _share(array)
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_attach, initargs=(specs,)
+            ) as pool:
+                parts.extend(pool.map(_evaluate, tasks))
+        finally:
+            for segment in segments.values():
+                segment.close()
+                segment.unlink()
+
+    results = pd.DataFrame(
+        {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+    )
+    params = pd.DataFrame(combos)[list(STRATEGY_PARAMS[strategy])]
+    params = params.loc[results["combo"]].reset_index(drop=True)
+    tickers = pd.Series(close.columns, name="ticker").iloc[results["column"]].reset_index(drop=True)
+    return pd.concat([params, tickers, results.drop(columns=["column"])], axis=1)
+
+
+def rank_results(results: pd.DataFrame, rank_by: str = "sharpe") -> pd.DataFrame:
+    """Aggregate per-ticker rows into one row per combination, best first."""
+    if rank_by not in METRICS:
+        raise ValueError(f"Unknown metric: {rank_by}")
+    if results.empty:
+        return results
+    params = [column for column in DEFAULT_PARAMS if column in results]
+    grouped = results.groupby("combo")
+    table = grouped[params].first()
+    for metric in METRICS:
+        table[f"{metric}_mean"] = grouped[metric].mean()
+    table["sharpe_median"] = grouped["sharpe"].median()
+    table["positive_share"] = grouped["total_return"].apply(
+        lambda values: float((values > 0).mean())
+    )
+    table["tickers"] = grouped["ticker"].size()
+    table = table.sort_values(
+        f"{rank_by}_mean", ascending=rank_by in ASCENDING_METRICS, na_position="last"
+    )
+    table.insert(0, "rank", np.arange(1, len(table) + 1))
+    return table.reset_index(drop=True)
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Rank signal-backtest parameter combinations over a universe."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--tickers", help="comma-separated tickers to download")
+    source.add_argument("--synthetic", type=int, help="use this many synthetic tickers instead")
+    parser.add_argument("--period", default="5y", help="download period for --tickers")
+    parser.add_argument("--years", type=float, default=10, help="history length for --synthetic")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="signal")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    parser.add_argument("--cost-bps", type=float, default=5.0)
+    parser.add_argument("--slippage-bps", type=float, default=5.0)
+    parser.add_argument("--rank-by", choices=METRICS, default="sharpe")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--output", help="write the full ranked table to this CSV file")
+    args = parser.parse_args(argv)
+
+    if args.synthetic:
+        from .synthetic import SyntheticConfig, iter_histories, synthetic_symbols
+
+        histories = iter_histories(
+            synthetic_symbols(args.synthetic), SyntheticConfig(years=args.years)
+        )
+    else:
+        from .data import fetch_histories
+
+        symbols = [item.strip().upper() for item in args.tickers.split(",") if item.strip()]
+        histories = fetch_histories(symbols, args.period).items()
+    closes, scores = {}, {}
+    for symbol, frame in histories:
+        closes[symbol] = frame["Close"]
+        if args.strategy == "rating":
+            scores[symbol] = build_scorecard_series(frame)["total"]
+    close = pd.DataFrame(closes).sort_index()
+
+    started = time.perf_counter()
+    results = run_sweep(
+        close,
+        parse_grid(args.grid),
+        strategy=args.strategy,
+        scores=pd.DataFrame(scores).reindex_like(close) if scores else None,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        cost_bps=args.cost_bps,
+        slippage_bps=args.slippage_bps,
+    )
+    table = rank_results(results, args.rank_by)
+    elapsed = time.perf_counter() - started
+    if args.output:
+        table.to_csv(args.output, index=False)
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(
+            table.head(args.top).to_string(
+                index=False, float_format=lambda value: f"{value:.4f}"
+            )
+        )
+    combos = results["combo"].nunique() if not results.empty else 0
+    print(f"{combos} combinations x {close.shape[1]} tickers in {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+"""Deterministic synthetic market data for scale and load testing.
+
+Every series is a pure function of ``(config.seed, symbol)``: daily closes follow
+a geometric Brownian motion whose drift and volatility switch between regimes,
+with overnight gaps, volume spikes, occasional splits and randomly missing
+days. Frames use the same layout as ``fetch_price_history`` (``Open``/``High``/
+``Low``/``Close``/``Volume`` on a ``Date`` index), and matching ``info``,
+``income_stmt`` and ``news`` payloads are generated for the scorecard.
+
+``SyntheticMarketData`` mimics the ``yfinance`` surface, so it can be installed
+with ``provider.set_provider`` (or the ``synthetic_provider`` context manager) to
+run the real analysis pipeline offline. ``write_dataset`` streams a universe to
+disk one ticker at a time:
+
+    python -m stock_analyzer.services.stock_analyzer.synthetic \\
+        --tickers 10000 --years 20 --out data/
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .provider import set_provider
+
+TRADING_DAYS = 252
+PERIOD_DAYS = {
+    "1d": 1,
+    "5d": 5,
+    "1mo": 21,
+    "3mo": 63,
+    "6mo": 126,
+    "1y": 252,
+    "2y": 504,
+    "5y": 1260,
+    "10y": 2520,
+}
+
+# Independent random streams per symbol, so changing one feature does not shift the others.
+_STREAM_PRICES = 1
+_STREAM_FUNDAMENTALS = 2
+_STREAM_NEWS = 3
+
+_POSITIVE_HEADLINES = (
+    "{name} shares rally after earnings beat",
+    "Analysts upgrade {name} on strong growth outlook",
+    "{name} posts record revenue growth",
+)
+_NEGATIVE_HEADLINES = (
+    "{name} stock falls as results miss estimates",
+    "Broker downgrade weighs on {name}",
+    "{name} warns of weak demand, shares fall",
+)
+_NEUTRAL_HEADLINES = (
+    "{name} to present at industry conference",
+    "{name} announces board appointment",
+)
+_SECTORS = (
+    "Technology",
+    "Healthcare",
+    "Financial Services",
+    "Industrials",
+    "Energy",
+    "Consumer Cyclical",
+)
+
+
+@dataclass(frozen=True)
+class Regime:
+    name: str
+    drift: float  # annualized
+    volatility: float  # annualized
+
+
+DEFAULT_REGIMES = (
+    Regime("bull", 0.18, 0.16),
+    Regime("bear", -0.25, 0.32),
+    Regime("sideways", 0.02, 0.12),
+)
+
+
+@dataclass(frozen=True)
+class SyntheticConfig:
+    seed: int = 0
+    # Last bar of every series; None means today (UTC). Pin it for bit-identical
+    # output across days.
+    end: str | None = None
+    years: float = 20.0
+    regimes: Tuple[Regime, ...] = DEFAULT_REGIMES
+    mean_regime_days: float = 120.0
+    gap_probability: float = 0.01
+    gap_scale: float = 0.04
+    volume_spike_probability: float = 0.02
+    volume_spike_scale: float = 4.0
+    splits_per_decade: float = 0.5
+    missing_day_probability: float = 0.002
+    # Like ``auto_adjust=True``: split-adjusted prices. False emits raw prices
+    # that jump at each split (volume scaled the other way).
+    adjusted: bool = True
+    news_items: Tuple[int, int] = field(default=(3, 8))
+
+
+DEFAULT_CONFIG = SyntheticConfig()
+
+
+def _rng(config: SyntheticConfig, symbol: str, stream: int) -> np.random.Generator:
+    return np.random.default_rng([config.seed, zlib.crc32(symbol.encode()), stream])
+
+
+def _end_date(config: SyntheticConfig) -> pd.Timestamp:
+    if config.end:
+        return pd.Timestamp(config.end).normalize()
+    return pd.Timestamp.now(tz="UTC").normalize().tz_localize(None)
+
+
+@lru_cache(maxsize=64)
+def _calendar(end: pd.Timestamp, bars: int) -> pd.DatetimeIndex:
+    """``bars`` weekdays ending on or before ``end`` (numpy busday math is far cheaper
+    than ``bdate_range`` anchored at the end)."""
+    last = np.busday_offset(np.datetime64(end.date(), "D"), 0, roll="backward")
+    days = np.busday_offset(last, np.arange(-(bars - 1), 1), roll="backward")
+    return pd.DatetimeIndex(days.astype("datetime64[ns]"), name="Date")
+
+
+def _regime_path(rng: np.random.Generator, config: SyntheticConfig, bars: int) -> np.ndarray:
+    durations: List[int] = []
+    while sum(durations) < bars:
+        durations.append(int(rng.geometric(1.0 / config.mean_regime_days)))
+    states = rng.integers(0, len(config.regimes), len(durations))
+    return np.repeat(states, durations)[:bars]
+
+
+def generate_history(
+    symbol: str,
+    config: SyntheticConfig = DEFAULT_CONFIG,
+    *,
+    bars: int | None = None,
+) -> pd.DataFrame:
+    """Daily OHLCV for ``symbol`` ending at ``config.end``.
+
+    ``bars`` defaults to ``config.years`` of trading days; the returned frame is
+    slightly shorter when missing days are dropped. Split events are listed in
+    ``frame.attrs["splits"]`` as ``(date, ratio)`` pairs.
+    """
+    bars = bars or max(2, int(round(config.years * TRADING_DAYS)))
+    rng = _rng(config, symbol, _STREAM_PRICES)
+    dt = 1.0 / TRADING_DAYS
+
+    start_price = float(np.exp(rng.normal(np.log(50), 0.8)))
+    base_volume = float(np.exp(rng.normal(np.log(2_000_000), 0.7)))
+    vol_multiplier = rng.uniform(0.7, 1.6)
+
+    states = _regime_path(rng, config, bars)
+    drift = np.array([regime.drift for regime in config.regimes])[states]
+    sigma = np.array([regime.volatility for regime in config.regimes])[states] * vol_multiplier
+    daily_sigma = sigma * np.sqrt(dt)
+
+    shocks = rng.standard_normal(bars)
+    log_returns = (drift - 0.5 * sigma**2) * dt + daily_sigma * shocks
+    gap_mask = rng.random(bars) < config.gap_probability
+    gaps = np.where(gap_mask, rng.normal(0.0, config.gap_scale, bars), 0.0)
+    # Split each day's move into an overnight part (plus any gap) and an intraday part.
+    overnight = 0.3 * log_returns + gaps
+    log_returns = log_returns + gaps
+    log_returns[0] = 0.0
+    overnight[0] = 0.0
+
+    log_close = np.log(start_price) + np.cumsum(log_returns)
+    close = np.exp(log_close)
+    open_ = np.exp(np.concatenate(([log_close[0]], log_close[:-1])) + overnight)
+    wick = np.abs(rng.normal(0.0, 0.5, (2, bars))) * daily_sigma
+    high = np.maximum(open_, close) * np.exp(wick[0])
+    low = np.minimum(open_, close) * np.exp(-wick[1])
+
+    move = np.abs(log_returns) / np.maximum(daily_sigma, 1e-9)
+    volume = base_volume * np.exp(rng.normal(0.0, 0.3, bars)) * (1 + 0.25 * move)
+    spikes = rng.random(bars) < config.volume_spike_probability
+    boost = 1 + rng.exponential(config.volume_spike_scale, bars)
+    volume = np.where(spikes | gap_mask, volume * boost, volume)
+
+    index = _calendar(_end_date(config), bars)
+    splits: List[Tuple[str, float]] = []
+    split_count = rng.poisson(config.splits_per_decade * bars / (10 * TRADING_DAYS))
+    if split_count and bars > 2:
+        positions = np.sort(
+            rng.choice(np.arange(1, bars), size=min(split_count, bars - 1), replace=False)
+        )
+        ratios = rng.choice([2.0, 3.0, 4.0, 0.5], size=len(positions), p=[0.55, 0.2, 0.15, 0.1])
+        for position, ratio in zip(positions, ratios):
+            splits.append((index[position].strftime("%Y-%m-%d"), float(ratio)))
+            if not config.adjusted:
+                # Raw prices before the split are ``ratio`` times the adjusted ones.
+                for series in (open_, high, low, close):
+                    series[:position] *= ratio
+                volume[:position] /= ratio
+
+    frame = pd.DataFrame(
+        {
+            "Close": close,
+            "High": high,
+            "Low": low,
+            "Open": open_,
+            "Volume": np.round(volume),
+        },
+        index=index,
+    )
+    frame.columns.name = "Price"
+    missing = rng.random(bars) < config.missing_day_probability
+    missing[[0, -1]] = False
+    if missing.any():
+        frame = frame.loc[~missing]
+    frame.attrs["splits"] = splits
+    return frame
+
+
+def generate_fundamentals(
+    symbol: str, config: SyntheticConfig = DEFAULT_CONFIG
+) -> Tuple[Dict[str, Any], pd.DataFrame, List[Dict[str, Any]]]:
+    """``(info, income_stmt, news)`` shaped like the ``yfinance.Ticker`` attributes."""
+    rng = _rng(config, symbol, _STREAM_FUNDAMENTALS)
+    name = f"{symbol} Corp."
+    revenue = float(np.exp(rng.normal(np.log(5e9), 1.0)))
+    margin = rng.uniform(-0.05, 0.3)
+    last_year = _end_date(config).year - 1
+    years = pd.DatetimeIndex(
+        [pd.Timestamp(year=last_year - offset, month=12, day=31) for offset in range(4)]
+    )
+    growth = rng.normal(0.06, 0.12, len(years))
+    revenues = revenue / np.cumprod(1 + growth)  # newest first, like yfinance
+    net_income = revenues * (margin + rng.normal(0, 0.03, len(years)))
+    shares = revenue / rng.uniform(20, 200)
+    income_stmt = pd.DataFrame(
+        [revenues, net_income, net_income / shares],
+        index=["Total Revenue", "Net Income", "Diluted EPS"],
+        columns=years,
+    )
+    trailing_pe = float(rng.uniform(6, 60)) if net_income[0] > 0 else None
+    info = {
+        "symbol": symbol,
+        "shortName": name,
+        "currency": "USD",
+        "sector": _SECTORS[int(rng.integers(0, len(_SECTORS)))],
+        "trailingPE": trailing_pe,
+        "forwardPE": trailing_pe * rng.uniform(0.7, 1.1) if trailing_pe else None,
+        "priceToBook": float(rng.uniform(0.6, 12)),
+        "marketCap": float(revenues[0] * rng.uniform(1, 10)),
+    }
+    return info, income_stmt, generate_news(symbol, config)
+
+
+def generate_news(symbol: str, config: SyntheticConfig = DEFAULT_CONFIG) -> List[Dict[str, Any]]:
+    rng = _rng(config, symbol, _STREAM_NEWS)
+    name = f"{symbol} Corp."
+    tone = rng.uniform(-1, 1)
+    low, high = config.news_items
+    end = _end_date(config) + pd.Timedelta(hours=16)
+    items = []
+    for _ in range(int(rng.integers(low, high + 1))):
+        draw = rng.uniform(-1, 1) + tone
+        if draw > 0.5:
+            pool = _POSITIVE_HEADLINES
+        elif draw < -0.5:
+            pool = _NEGATIVE_HEADLINES
+        else:
+            pool = _NEUTRAL_HEADLINES
+        published = end - pd.Timedelta(hours=float(rng.uniform(0, 24 * 6)))
+        items.append(
+            {
+                "title": pool[int(rng.integers(0, len(pool)))].format(name=name),
+                "summary": "",
+                "publisher": "Synthetic Wire",
+                "providerPublishTime": int(published.tz_localize("UTC").timestamp()),
+            }
+        )
+    return sorted(items, key=lambda item: item["providerPublishTime"], reverse=True)
+
+
+def synthetic_symbols(count: int, prefix: str = "SYN") -> List[str]:
+    width = max(4, len(str(count - 1)))
+    return [f"{prefix}{index:0{width}d}" for index in range(count)]
+
+
+def iter_histories(
+    symbols: Iterable[str], config: SyntheticConfig = DEFAULT_CONFIG
+) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """Lazily yield ``(symbol, frame)`` so a whole universe never sits in memory."""
+    for symbol in symbols:
+        yield symbol, generate_history(symbol, config)
+
+
+class SyntheticTicker:
+    def __init__(self, symbol: str, config: SyntheticConfig) -> None:
+        self.ticker = symbol
+        self.info, self.income_stmt, self.news = generate_fundamentals(symbol, config)
+
+
+class SyntheticMarketData:
+    """Offline stand-in for the ``yfinance`` module (see ``provider.MarketDataProvider``).
+
+    Each symbol's full ``config.years`` history is generated once and sliced per
+    request, so different periods of one symbol agree with each other.
+    ``latency_ms`` adds a blocking delay per call to mimic a remote provider.
+    """
+
+    def __init__(
+        self,
+        config: SyntheticConfig = DEFAULT_CONFIG,
+        *,
+        latency_ms: float = 0.0,
+        cache_size: int = 256,
+    ) -> None:
+        self.config = config
+        self.latency = latency_ms / 1000.0
+        self.calls = 0
+        self._history = lru_cache(maxsize=cache_size)(self._generate)
+
+    def _generate(self, symbol: str) -> pd.DataFrame:
+        return generate_history(symbol, self.config)
+
+    def _tick(self) -> None:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def history(self, symbol: str, period: str = "1mo", start=None, end=None) -> pd.DataFrame:
+        frame = self._history(symbol)
+        if start is not None or end is not None:
+            if start is not None:
+                frame = frame.loc[frame.index >= pd.Timestamp(start)]
+            if end is not None:
+                frame = frame.loc[frame.index < pd.Timestamp(end)]
+            return frame.copy()
+        if period == "max":
+            return frame.copy()
+        if period == "ytd":
+            year_start = pd.Timestamp(year=frame.index[-1].year, month=1, day=1)
+            return frame.loc[frame.index >= year_start].copy()
+        return frame.tail(PERIOD_DAYS.get(period, TRADING_DAYS)).copy()
+
+    def download(
+        self, tickers, period: str = "1mo", start=None, end=None, **_kwargs
+    ) -> pd.DataFrame:
+        self._tick()
+        if isinstance(tickers, str) and " " not in tickers.strip():
+            return self.history(tickers.strip(), period, start, end)
+        symbols = tickers.split() if isinstance(tickers, str) else list(tickers)
+        frames = {symbol: self.history(symbol, period, start, end) for symbol in symbols}
+        combined = pd.concat(frames, axis=1, names=["Ticker", "Price"]).swaplevel(0, 1, axis=1)
+        return combined.sort_index(axis=1, level=0, sort_remaining=False)
+
+    def Ticker(self, symbol: str) -> SyntheticTicker:  # noqa: N802 - mirrors yfinance
+        self._tick()
+        return SyntheticTicker(symbol, self.config)
+
+
+@contextmanager
+def synthetic_provider(
+    config: SyntheticConfig = DEFAULT_CONFIG, **kwargs: Any
+) -> Iterator[SyntheticMarketData]:
+    """Route the analysis pipeline's market-data calls to synthetic data for the block."""
+    provider = SyntheticMarketData(config, **kwargs)
+    previous = set_provider(provider)
+    try:
+        yield provider
+    finally:
+        set_provider(previous)
+
+
+def _fundamentals_record(symbol: str, config: SyntheticConfig) -> Dict[str, Any]:
+    info, income_stmt, news = generate_fundamentals(symbol, config)
+    statement = {
+        column.strftime("%Y-%m-%d"): {
+            row: float(value) for row, value in income_stmt[column].items()
+        }
+        for column in income_stmt.columns
+    }
+    return {"symbol": symbol, "info": info, "income_stmt": statement, "news": news}
+
+
+def write_dataset(
+    symbols: Iterable[str],
+    directory: str | Path,
+    config: SyntheticConfig = DEFAULT_CONFIG,
+    *,
+    fmt: str = "csv",
+) -> int:
+    """Write one price file per symbol plus ``fundamentals.jsonl``; returns the ticker count.
+
+    ``fmt`` is ``csv`` (gzip-compressed) or ``parquet`` (needs pyarrow). Tickers
+    are generated and written one at a time, so memory stays flat.
+    """
+    if fmt not in {"csv", "parquet"}:
+        raise ValueError(f"Unsupported format: {fmt}")
+    target = Path(directory)
+    (target / "prices").mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(target / "fundamentals.jsonl", "w", encoding="utf-8") as fundamentals:
+        for symbol, frame in iter_histories(symbols, config):
+            if fmt == "parquet":
+                frame.to_parquet(target / "prices" / f"{symbol}.parquet")
+            else:
+                frame.to_csv(target / "prices" / f"{symbol}.csv.gz", compression="gzip")
+            fundamentals.write(json.dumps(_fundamentals_record(symbol, config)) + "\n")
+            count += 1
+    return count
+
+
+def dataset_symbols(directory: str | Path) -> List[str]:
+    """Symbols with a price file under ``directory/prices`` (as written by ``write_dataset``)."""
+    names = (path.name for path in (Path(directory) / "prices").iterdir())
+    return sorted(name.split(".", 1)[0] for name in names if name.endswith((".csv.gz", ".parquet")))
+
+
+def read_history(directory: str | Path, symbol: str) -> pd.DataFrame:
+    """Load one symbol's frame back from a ``write_dataset`` directory."""
+    prices = Path(directory) / "prices"
+    parquet = prices / f"{symbol}.parquet"
+    if parquet.exists():
+        return pd.read_parquet(parquet)
+    frame = pd.read_csv(prices / f"{symbol}.csv.gz", index_col="Date", parse_dates=["Date"])
+    frame.columns.name = "Price"
+    return frame
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Write a deterministic synthetic market-data universe to disk."
+    )
+    parser.add_argument("--tickers", type=int, default=100)
+    parser.add_argument("--years", type=float, default=DEFAULT_CONFIG.years)
+    parser.add_argument("--seed", type=int, default=DEFAULT_CONFIG.seed)
+    parser.add_argument("--end", help="last trading date (default: today)")
+    parser.add_argument("--prefix", default="SYN")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args(argv)
+
+    config = SyntheticConfig(seed=args.seed, end=args.end, years=args.years)
+    started = time.perf_counter()
+    symbols = synthetic_symbols(args.tickers, args.prefix)
+    count = write_dataset(symbols, args.out, config, fmt=args.format)
+    print(f"Wrote {count} tickers to {args.out} in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
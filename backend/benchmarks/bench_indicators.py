@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Microbenchmarks for indicators, scoring, backtest and report rendering across data sizes.
+
+Usage (from the repository root):
+
+    python backend/benchmarks/bench_indicators.py --sizes 250,2500,25000,250000 \
+        --batches 1,50,500,5000 --output bench.json
+    python backend/benchmarks/bench_indicators.py --save-baseline baseline.json
+    python backend/benchmarks/bench_indicators.py --baseline baseline.json --max-regression 0.25
+
+Each case is timed as the best of ``--repeat`` runs, then run once more under
+``tracemalloc`` for its peak allocation. Series sizes exercise single-ticker
+functions on 250..250k bars; batch sizes run the per-ticker indicator and
+scorecard pipeline over 1..5000 one-year tickers. With ``--baseline`` the run
+exits non-zero when any case's time or peak memory grows by more than
+``--max-regression`` (a fraction) over the stored value and by more than a
+small absolute noise floor (0.5 ms, 0.1 MB). Market data is
+generated by ``synthetic.py`` (also serving the market-momentum benchmark), so
+nothing touches the network; the CLI report's typing animation is disabled so
+only rendering is measured.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BACKEND_APP = Path(__file__).resolve().parents[1] / "app"
+if str(BACKEND_APP) not in sys.path:
+    sys.path.insert(0, str(BACKEND_APP))
+
+import pandas as pd  # noqa: E402
+
+from stock_analyzer.services.language import LANGUAGE_EN  # noqa: E402
+from stock_analyzer.services.stock_analyzer import report  # noqa: E402
+from stock_analyzer.services.stock_analyzer.analysis import run_backtest  # noqa: E402
+from stock_analyzer.services.stock_analyzer.indicators import (  # noqa: E402
+    analyze_price_channel,
+    compute_atr,
+    compute_channel_overview,
+    compute_macd,
+    compute_relative_performance,
+    compute_relative_strength,
+    compute_rsi,
+)
+from stock_analyzer.services.stock_analyzer.provider import set_provider  # noqa: E402
+from stock_analyzer.services.stock_analyzer.scoring import (  # noqa: E402
+    build_scorecard,
+    calculate_probability,
+)
+from stock_analyzer.services.stock_analyzer.synthetic import (  # noqa: E402
+    SyntheticConfig,
+    SyntheticMarketData,
+    generate_fundamentals,
+    generate_history,
+)
+
+DEFAULT_SIZES = "250,2500,25000,250000"
+DEFAULT_BATCHES = "1,50,500,5000"
+BATCH_BARS = 252
+# Absolute changes below these are treated as noise, whatever the relative change.
+NOISE_FLOOR = {"seconds": 0.0005, "peak_mb": 0.1}
+
+
+BENCH_CONFIG = SyntheticConfig(seed=0, end="2024-12-31")
+
+
+def synthetic_frame(symbol: str, bars: int) -> pd.DataFrame:
+    return generate_history(symbol, BENCH_CONFIG, bars=bars)
+
+
+def _fundamentals(symbol: str) -> Dict[str, object]:
+    info, income_stmt, news = generate_fundamentals(symbol, BENCH_CONFIG)
+    return {"info": info, "income_stmt": income_stmt, "news": news}
+
+
+def score_context(symbol: str, history: pd.DataFrame) -> Dict[str, object]:
+    close = history["Close"]
+    return {
+        "close": close,
+        "volume": history["Volume"],
+        "history": history,
+        "macd_df": compute_macd(close),
+        "rsi_series": compute_rsi(close),
+        "symbol": symbol,
+        **_fundamentals(symbol),
+    }
+
+
+def report_summary(history: pd.DataFrame) -> dict:
+    close = history["Close"]
+    macd_df = compute_macd(close)
+    scorecard = build_scorecard(score_context("BENCH", history))
+    return {
+        "ticker": "BENCH",
+        "latest_date": history.index[-1].strftime("%Y-%m-%d"),
+        "latest_close": float(close.iloc[-1]),
+        "macd": {
+            "macd": float(macd_df["macd"].iloc[-1]),
+            "signal": float(macd_df["signal"].iloc[-1]),
+            "hist": float(macd_df["hist"].iloc[-1]),
+        },
+        "rsi": float(compute_rsi(close).iloc[-1]),
+        "decision": {"action": "Neutral", "rationale": "Benchmark"},
+        "support_resistance": {},
+        "channels": compute_channel_overview(close),
+        "moving_averages": {
+            "sma20": float(close.tail(20).mean()),
+            "sma50": float(close.tail(50).mean()),
+        },
+        "volume": {
+            "latest": float(history["Volume"].iloc[-1]),
+            "avg20": float(history["Volume"].tail(20).mean()),
+        },
+        "scorecard": scorecard,
+        "probability": calculate_probability({"scorecard": scorecard}),
+    }
+
+
+def _render_silently(summary: dict) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        report.render_cli_report(summary, LANGUAGE_EN)
+
+
+def series_cases(bars: int) -> Dict[str, Callable[[], object]]:
+    history = synthetic_frame(f"BENCH{bars}", bars)
+    benchmark = synthetic_frame("SPY", bars)["Close"]
+    symbols = ("SPY", "QQQ", "XLK", "^KS11")
+    benchmarks = pd.DataFrame(
+        {symbol: synthetic_frame(symbol, bars)["Close"] for symbol in symbols}
+    )
+    close, high, low = history["Close"], history["High"], history["Low"]
+    context = score_context("BENCH", history)
+    summary = report_summary(history)
+    lookback = max(2, min(bars - 2, 252))
+    return {
+        "compute_macd": lambda: compute_macd(close),
+        "compute_rsi": lambda: compute_rsi(close),
+        "compute_atr": lambda: compute_atr(high, low, close),
+        "analyze_price_channel": lambda: analyze_price_channel(close, min(bars, 120)),
+        "compute_relative_strength": lambda: compute_relative_strength(
+            close, benchmark, benchmark_symbol="SPY", window=60
+        ),
+        "compute_relative_performance": lambda: compute_relative_performance(
+            close, benchmarks, windows=(20, 60, 120)
+        ),
+        "build_scorecard": lambda: build_scorecard(context),
+        "run_backtest": lambda: run_backtest(close, benchmark, lookback, "SPY"),
+        "render_cli_report": lambda: _render_silently(summary),
+    }
+
+
+def batch_case(tickers: int) -> Callable[[], object]:
+    symbols = [f"T{index:05d}" for index in range(tickers)]
+    frames = [synthetic_frame(symbol, BATCH_BARS) for symbol in symbols]
+    fundamentals = [_fundamentals(symbol) for symbol in symbols]
+
+    def run() -> None:
+        for symbol, history, extra in zip(symbols, frames, fundamentals):
+            close = history["Close"]
+            macd_df = compute_macd(close)
+            rsi_series = compute_rsi(close)
+            compute_atr(history["High"], history["Low"], close)
+            compute_channel_overview(close)
+            build_scorecard(
+                {
+                    "close": close,
+                    "volume": history["Volume"],
+                    "history": history,
+                    "macd_df": macd_df,
+                    "rsi_series": rsi_series,
+                    "symbol": symbol,
+                    **extra,
+                }
+            )
+
+    return run
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict:
+    func()  # warm caches / first-call overhead
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_mb": peak / 2**20}
+
+
+def run(sizes: List[int], batches: List[int], repeat: int) -> Dict[str, dict]:
+    results: Dict[str, dict] = {}
+    for bars in sizes:
+        for name, func in series_cases(bars).items():
+            results[f"{name}[bars={bars}]"] = measure(func, repeat)
+    for tickers in batches:
+        # Large batches are timed once; the run itself is already long enough.
+        results[f"pipeline[tickers={tickers}]"] = measure(
+            batch_case(tickers), repeat if tickers <= 50 else 1
+        )
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    failures = []
+    for case, current in results.items():
+        previous = baseline.get(case)
+        if not previous:
+            continue
+        for metric in ("seconds", "peak_mb"):
+            before, after = previous.get(metric), current[metric]
+            if before and after > before * (1 + threshold) and after - before > NOISE_FLOOR[metric]:
+                failures.append(
+                    f"{case} {metric}: {after:.6g} vs baseline {before:.6g} "
+                    f"(+{(after / before - 1) * 100:.0f}%)"
+                )
+    return failures
+
+
+def _int_list(raw: str) -> List[int]:
+    return [int(item) for item in raw.split(",") if item.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="series lengths in bars")
+    parser.add_argument(
+        "--batches", default=DEFAULT_BATCHES, help="ticker counts for the batch pipeline"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file and fail on regressions")
+    parser.add_argument("--save-baseline", help="write results as the new baseline")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    args = parser.parse_args()
+
+    set_provider(SyntheticMarketData(BENCH_CONFIG))
+    report.stream_print = lambda text, delay=0.0, newline=True: print(
+        text, end="\n" if newline else ""
+    )
+    results = run(_int_list(args.sizes), _int_list(args.batches), args.repeat)
+
+    print(f"{'case':<44} {'time':>12} {'peak MB':>10}")
+    for case, row in results.items():
+        print(f"{case:<44} {row['seconds'] * 1000:>9.3f} ms {row['peak_mb']:>10.2f}")
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        failures = compare(results, baseline, args.max_regression)
+        if failures:
+            print(f"\n{len(failures)} regression(s) beyond {args.max_regression:.0%}:")
+            for line in failures:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.max_regression:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
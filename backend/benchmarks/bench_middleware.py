@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Compare requests/sec of the ASGI middleware stack against the old BaseHTTPMiddleware one.
+
+Usage (from the repository root):
+
+    python backend/benchmarks/bench_middleware.py --requests 2000 --concurrency 32
+
+Requests are driven in-process through ``httpx.ASGITransport`` so the numbers
+isolate framework/middleware overhead. ``analyze_stock`` is replaced by a canned
+summary so `/analyze` never reaches Yahoo Finance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_APP = Path(__file__).resolve().parents[1] / "app"
+if str(BACKEND_APP) not in sys.path:
+    sys.path.insert(0, str(BACKEND_APP))
+
+os.environ.setdefault("SQLITE_PATH", str(Path(tempfile.mkdtemp()) / "bench.db"))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from stock_analyzer.middleware import LoggingMiddleware, TickerStatsMiddleware  # noqa: E402
+from stock_analyzer.middleware.stats_middleware import record_ticker  # noqa: E402
+from stock_analyzer.routes import all_routers  # noqa: E402
+from stock_analyzer.routes.analyze import analyze_crud  # noqa: E402
+from stock_analyzer.db import Base, get_engine  # noqa: E402
+
+logger = logging.getLogger("stock_api")
+
+CANNED_SUMMARY = {
+    "ticker": "AAPL",
+    "latest_date": "2024-01-02",
+    "latest_close": 185.64,
+    "decision": {"action": "Neutral", "rationale": "No clear trend signal."},
+    "macd": {"macd": 1.2, "signal": 1.1, "hist": 0.1},
+    "rsi": 55.0,
+    "support_resistance": {},
+    "channels": [],
+    "moving_averages": {"sma20": 184.0, "sma50": 180.0},
+    "volume": {"latest": 1.0e7, "avg20": 1.1e7},
+    "probability": {
+        "bullish": 0.55,
+        "bearish": 0.45,
+        "confidence_key": "prob_confidence_low",
+        "breakdown": [],
+        "method": "weighted_scorecard",
+    },
+    "scorecard": {
+        "indicators": [],
+        "total_score": 55.0,
+        "rating_label_key": "rating_neutral",
+        "category_scores": [],
+    },
+}
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start = time.perf_counter()
+        response = await call_next(request)
+        duration = (time.perf_counter() - start) * 1000
+        logger.info(
+            "%s %s -> %s (%.2f ms)",
+            request.method,
+            request.url.path,
+            response.status_code,
+            duration,
+        )
+        return response
+
+
+class LegacyTickerStatsMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        body_bytes = None
+        if request.method == "POST" and request.url.path.startswith("/analyze"):
+            body_bytes = await request.body()
+            if body_bytes:
+                try:
+                    payload = json.loads(body_bytes)
+                    record_ticker(str(payload.get("ticker", "")).strip().upper())
+                except Exception:
+                    pass
+        if body_bytes is not None:
+            async def receive() -> dict:
+                return {"type": "http.request", "body": body_bytes, "more_body": False}
+
+            request._receive = receive  # type: ignore[attr-defined]
+        return await call_next(request)
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+    if legacy:
+        app.add_middleware(LegacyLoggingMiddleware)
+        app.add_middleware(LegacyTickerStatsMiddleware)
+    else:
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(TickerStatsMiddleware)
+
+    @app.get("/health")
+    def health_check() -> dict:
+        return {"status": "ok"}
+
+    for router in all_routers:
+        app.include_router(router)
+    return app
+
+
+async def measure(app: FastAPI, method: str, path: str, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one() -> None:
+            async with semaphore:
+                if method == "POST":
+                    response = await client.post(path, json={"ticker": "AAPL"})
+                else:
+                    response = await client.get(path)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - start
+    return total / elapsed
+
+
+async def run(total: int, concurrency: int) -> list[dict]:
+    results = []
+    for path, method in (("/health", "GET"), ("/analyze", "POST")):
+        row = {"path": path}
+        for label, legacy in (("before", True), ("after", False)):
+            app = build_app(legacy)
+            await measure(app, method, path, min(total, 100), concurrency)
+            row[label] = await measure(app, method, path, total, concurrency)
+        row["speedup"] = row["after"] / row["before"]
+        results.append(row)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=get_engine())
+    analyze_crud.analyze_stock = lambda input_data: dict(CANNED_SUMMARY)
+
+    results = asyncio.run(run(args.requests, args.concurrency))
+    print(f"{'path':<10} {'before rps':>12} {'after rps':>12} {'speedup':>9}")
+    for row in results:
+        print(
+            f"{row['path']:<10} {row['before']:>12.1f} {row['after']:>12.1f}"
+            f" {row['speedup']:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
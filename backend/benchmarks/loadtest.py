@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Load-test the FastAPI app end to end against the synthetic market-data provider.
+
+Usage (from the repository root):
+
+    python backend/benchmarks/loadtest.py --requests 2000 --concurrency 32 \
+        --mix analyze=6,history=3,top=1 --tickers 50 --output loadtest.json
+
+The real application (middleware, routes, caches, SQLite history) is booted with
+its lifespan through ``httpx.ASGITransport``; only the market-data provider is
+replaced, by ``SyntheticMarketData`` (seeded OHLCV, fundamentals and news), so no
+request ever reaches Yahoo Finance. ``--provider-latency-ms`` adds a per-call delay to mimic a
+remote provider. Per-endpoint p50/p95/p99 latency and requests/sec are printed
+and written to ``--output`` as JSON so runs can be compared over time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+BACKEND_APP = Path(__file__).resolve().parents[1] / "app"
+if str(BACKEND_APP) not in sys.path:
+    sys.path.insert(0, str(BACKEND_APP))
+
+os.environ.setdefault("SQLITE_PATH", str(Path(tempfile.mkdtemp()) / "loadtest.db"))
+os.environ.setdefault("PREWARM_ENABLED", "false")
+
+import httpx  # noqa: E402
+import numpy as np  # noqa: E402
+
+from stock_analyzer.main import app  # noqa: E402
+from stock_analyzer.services.stock_analyzer.provider import set_provider  # noqa: E402
+from stock_analyzer.services.stock_analyzer.synthetic import (  # noqa: E402
+    SyntheticConfig,
+    SyntheticMarketData,
+    synthetic_symbols,
+)
+
+ENDPOINTS = {
+    "analyze": "POST /analyze",
+    "history": "GET /history",
+    "top": "GET /analytics/top-tickers",
+}
+
+
+def parse_mix(raw: str) -> Dict[str, float]:
+    mix = {}
+    for item in raw.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise SystemExit(
+                f"Unknown endpoint in --mix: {name} (choose from {', '.join(ENDPOINTS)})"
+            )
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> dict:
+    values = np.asarray(latencies) * 1000
+    if not len(values):
+        return {"requests": 0, "errors": errors}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "rps": round(len(values) / elapsed, 2),
+        "mean_ms": round(float(values.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(float(values.max()), 3),
+    }
+
+
+async def send(client: httpx.AsyncClient, endpoint: str, ticker: str) -> httpx.Response:
+    if endpoint == "analyze":
+        return await client.post("/analyze", json={"ticker": ticker, "lang": "en"})
+    if endpoint == "history":
+        return await client.get("/history", params={"limit": 20})
+    return await client.get("/analytics/top-tickers", params={"limit": 10, "window": "day"})
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float = 60.0) -> None:
+    deadline = time.perf_counter() + timeout
+    while (await client.get("/ready")).status_code != 200:
+        if time.perf_counter() > deadline:
+            raise SystemExit("App did not become ready")
+        await asyncio.sleep(0.05)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    mix = parse_mix(args.mix)
+    universe = synthetic_symbols(args.tickers)
+    plan = rng.choices(list(mix), weights=list(mix.values()), k=args.warmup + args.requests)
+    tickers = [rng.choice(universe) for _ in plan]
+
+    latencies: Dict[str, List[float]] = {name: [] for name in mix}
+    errors: Dict[str, int] = {name: 0 for name in mix}
+    semaphore = asyncio.Semaphore(args.concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            await wait_ready(client)
+
+            async def one(index: int) -> None:
+                endpoint = plan[index]
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await send(client, endpoint, tickers[index])
+                    duration = time.perf_counter() - start
+                if index < args.warmup:
+                    return
+                if response.status_code >= 400:
+                    errors[endpoint] += 1
+                else:
+                    latencies[endpoint].append(duration)
+
+            await asyncio.gather(*(one(index) for index in range(args.warmup)))
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(one(index) for index in range(args.warmup, args.warmup + args.requests))
+            )
+            elapsed = time.perf_counter() - start
+
+    everything = [value for values in latencies.values() for value in values]
+    return {
+        "elapsed_seconds": round(elapsed, 3),
+        "total": summarize(everything, sum(errors.values()), elapsed),
+        "endpoints": {
+            ENDPOINTS[name]: summarize(latencies[name], errors[name], elapsed) for name in mix
+        },
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--mix", default="analyze=6,history=3,top=1", help="endpoint=weight list")
+    parser.add_argument("--tickers", type=int, default=50, help="size of the synthetic universe")
+    parser.add_argument("--warmup", type=int, default=100, help="unrecorded requests sent first")
+    parser.add_argument("--provider-latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="loadtest-results.json")
+    args = parser.parse_args()
+
+    for name in ("stock_api", "httpx"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    provider = SyntheticMarketData(
+        SyntheticConfig(seed=args.seed, years=2), latency_ms=args.provider_latency_ms
+    )
+    set_provider(provider)
+    results = asyncio.run(run(args))
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "config": {key: value for key, value in vars(args).items() if key != "output"},
+        "provider_calls": provider.calls,
+        **results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    print(
+        f"{'endpoint':<28} {'req':>6} {'err':>5} {'rps':>9}"
+        f" {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    for name, row in {**report["endpoints"], "total": report["total"]}.items():
+        if not row.get("requests"):
+            print(f"{name:<28} {0:>6} {row['errors']:>5}")
+            continue
+        print(
+            f"{name:<28} {row['requests']:>6} {row['errors']:>5} {row['rps']:>9.1f} "
+            f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}"
+        )
+    print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
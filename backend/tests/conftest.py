@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# The database URL is read when stock_analyzer.db is imported, so point it at a
+# scratch file before any test module imports the app.
+os.environ.setdefault(
+    "SQLITE_PATH", os.path.join(tempfile.mkdtemp(prefix="stock-tests-"), "stock.db")
+)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
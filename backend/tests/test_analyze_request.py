@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from stock_analyzer.routes.analyze.analyze_schema import (
+    MAX_BENCHMARKS,
+    MAX_RELATIVE_WINDOWS,
+    AnalyzeRequest,
+)
+
+
+def test_benchmark_and_window_lists_up_to_the_limit():
+    request = AnalyzeRequest(
+        ticker="AAPL",
+        benchmarks=", ".join(f"B{index}" for index in range(MAX_BENCHMARKS)),
+        relative_windows=",".join(["20"] * MAX_RELATIVE_WINDOWS),
+    )
+    assert request.benchmarks.count(",") == MAX_BENCHMARKS - 1
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("benchmarks", ",".join(f"B{index}" for index in range(MAX_BENCHMARKS + 1))),
+        ("benchmarks", "QQQ,,SPY"),
+        ("relative_windows", ",".join(["20"] * (MAX_RELATIVE_WINDOWS + 1))),
+        ("relative_windows", "20,abc"),
+    ],
+)
+def test_oversized_or_malformed_lists_are_rejected(field, value):
+    with pytest.raises(ValidationError):
+        AnalyzeRequest(ticker="AAPL", **{field: value})
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import asyncio
+
+from stock_analyzer.models import AnalysisInput
+from stock_analyzer.routes.analyze import analyze_crud
+
+
+def _collect(events) -> list[str]:
+    async def run() -> list[str]:
+        return [event async for event in events]
+
+    return asyncio.run(run())
+
+
+def test_failed_history_write_still_ends_stream(monkeypatch):
+    async def broken_save(*_args) -> None:
+        raise RuntimeError("table analysis_history has no column named payload_hash")
+
+    monkeypatch.setattr(analyze_crud, "save_history", broken_save)
+    sections = iter([("price", {"ticker": "AAA", "latest_close": 1.0})])
+    events = _collect(analyze_crud._render_events(AnalysisInput(ticker="AAA"), sections))
+
+    assert events[0].startswith("event: price\n")
+    assert events[-1] == 'event: done\ndata: {"ticker": "AAA", "saved": false}\n\n'
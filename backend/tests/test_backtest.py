@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from stock_analyzer.services.stock_analyzer.backtest import backtest_signal_rules, performance_stats
+
+
+def _close(bars: int = 120) -> pd.Series:
+    rng = np.random.default_rng(1)
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+    return pd.Series(values, index=pd.bdate_range("2024-01-01", periods=bars))
+
+
+def test_empty_history_has_undefined_stats():
+    result = backtest_signal_rules(_close().iloc[:0])
+    assert result.equity.empty
+    assert result.stats["total_return"] is None
+    assert result.stats["cagr"] is None
+    assert result.stats["max_drawdown"] is None
+    assert result.stats["trades"] == 0
+    assert result.stats["costs"] == 0.0
+
+
+def test_empty_matrix_keeps_the_asset_axis():
+    empty = np.zeros((0, 3))
+    stats = performance_stats(empty, empty, empty)
+    assert np.isnan(stats["total_return"]).all() and stats["total_return"].shape == (3,)
+    assert np.isnan(stats["cagr"]).all()
+    assert (stats["trades"] == 0).all()
+
+
+def test_single_bar_is_flat():
+    stats = backtest_signal_rules(_close().iloc[:1]).stats
+    assert stats["total_return"] == 0.0
+    assert stats["cagr"] == 0.0
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from stock_analyzer.services.stock_analyzer import cli
+
+
+@pytest.fixture
+def context():
+    return cli._build_context("en")
+
+
+def test_relative_windows_parse_to_ints(context):
+    args = cli.parse_args(["analyze", "AAPL", "--relative-windows", " 20, 120 "], context)
+    assert args.relative_windows == [20, 120]
+
+
+@pytest.mark.parametrize("value", ["20,x", "5,-3", "0", ","])
+def test_bad_relative_windows_are_usage_errors(context, value, capsys):
+    with pytest.raises(SystemExit) as exc:
+        cli.parse_args(["analyze", "AAPL", "--relative-windows", value], context)
+    assert exc.value.code == 2
+    assert "--relative-windows" in capsys.readouterr().err
+
+
+def test_bad_relative_windows_stop_interactive_mode(capsys):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["--relative-windows", "20,x"])
+    assert exc.value.code == 2
+    assert "--relative-windows" in capsys.readouterr().err
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from stock_analyzer.db import Base, SessionLocal, dispose_engines, get_engine
+from stock_analyzer.models import AnalysisHistory
+from stock_analyzer.routes.history.history_router import NEXT_CURSOR_HEADER, router
+
+
+@pytest.fixture()
+def client():
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    app = FastAPI()
+    app.include_router(router)
+    with TestClient(app) as test_client:
+        yield test_client
+    asyncio.run(dispose_engines())
+
+
+def _insert_server_stamped(count: int, created_at: list[str] | None = None) -> None:
+    """Rows as older releases wrote them.
+
+    ``created_at`` comes from CURRENT_TIMESTAMP or is a literal in that format.
+    """
+    with get_engine().begin() as conn:
+        for index in range(count):
+            if created_at is None:
+                conn.execute(
+                    text("INSERT INTO analysis_history (ticker, lang) VALUES ('AAA', 'en')")
+                )
+            else:
+                conn.execute(
+                    text(
+                        "INSERT INTO analysis_history (ticker, lang, created_at) "
+                        "VALUES ('AAA', 'en', :at)"
+                    ),
+                    {"at": created_at[index]},
+                )
+
+
+def _walk(client: TestClient, **params) -> list[list[int]]:
+    pages, cursor = [], None
+    while True:
+        query = {"limit": 2, "fields": "id", **params}
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get("/history", params=query)
+        assert response.status_code == 200
+        pages.append([entry["id"] for entry in response.json()])
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return pages
+        assert len(pages) < 20, "cursor does not advance"
+
+
+def _assert_each_once(pages: list[list[int]], expected: list[int]) -> None:
+    walked = [row_id for page in pages for row_id in page]
+    assert walked == expected
+    assert len(walked) == len(set(walked))
+
+
+def test_pages_one_second_apart(client):
+    _insert_server_stamped(5, [f"2024-01-01 10:00:0{second}" for second in range(5)])
+    _assert_each_once(_walk(client), [5, 4, 3, 2, 1])
+
+
+def test_pages_within_one_second(client):
+    _insert_server_stamped(5)
+    _assert_each_once(_walk(client), [5, 4, 3, 2, 1])
+
+
+def test_pages_of_client_stamped_rows(client):
+    start = datetime(2024, 1, 1, 10)
+    with SessionLocal() as session:
+        session.add_all(
+            AnalysisHistory(
+                ticker="AAA", lang="en", created_at=start + timedelta(seconds=index // 2)
+            )
+            for index in range(7)
+        )
+        session.commit()
+    _assert_each_once(_walk(client), [7, 6, 5, 4, 3, 2, 1])
+
+
+def test_since_until_bounds_are_exact(client):
+    start = datetime(2024, 1, 1, 10)
+    with SessionLocal() as session:
+        session.add_all(
+            AnalysisHistory(ticker="AAA", lang="en", created_at=start + timedelta(seconds=index))
+            for index in range(5)
+        )
+        session.commit()
+    pages = _walk(client, since="2024-01-01T10:00:01", until="2024-01-01T10:00:04")
+    _assert_each_once(pages, [4, 3, 2])
+    pages = _walk(client, since="2024-01-01T19:00:01+09:00")
+    _assert_each_once(pages, [5, 4, 3, 2])
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import asyncio
+
+from stock_analyzer.db import Base, SessionLocal, dispose_engines, get_engine
+from stock_analyzer.middleware import stats_middleware
+from stock_analyzer.models import TickerStat
+from stock_analyzer.services.analytics import TickerLeaderboard
+
+
+def _broken_session():
+    raise RuntimeError("database is locked")
+
+
+def test_failed_load_is_retried(monkeypatch):
+    engine = get_engine()
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with SessionLocal() as session:
+        session.add(TickerStat(ticker="AAA", count=5))
+        session.commit()
+    leaderboard = TickerLeaderboard()
+    monkeypatch.setattr(stats_middleware, "LEADERBOARD", leaderboard)
+
+    async def scenario() -> list[dict]:
+        with monkeypatch.context() as broken:
+            broken.setattr(stats_middleware, "AsyncSessionLocal", _broken_session)
+            leaderboard.record("AAA")
+            await stats_middleware.load_leaderboard()
+            assert not leaderboard.loaded
+            # Nothing is written while the stored totals are unknown.
+            await stats_middleware.flush_ticker_stats()
+        top = await stats_middleware.get_top_tickers(window="all")
+        await stats_middleware.flush_ticker_stats()
+        await dispose_engines()
+        return top
+
+    assert asyncio.run(scenario()) == [{"ticker": "AAA", "count": 6}]
+    with SessionLocal() as session:
+        assert session.get(TickerStat, 1).count == 6
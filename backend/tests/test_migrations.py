@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from alembic import command
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from stock_analyzer.db import Base
+from stock_analyzer.migrations import alembic_config
+from stock_analyzer.models import AnalysisHistory
+
+# analysis_history / ticker_stats as Base.metadata.create_all made them before
+# analysis_payloads existed, without an alembic_version table.
+BASELINE_SCHEMA = (
+    """CREATE TABLE ticker_stats (
+        id INTEGER PRIMARY KEY, ticker VARCHAR(32) NOT NULL UNIQUE, count INTEGER NOT NULL,
+        updated_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL)""",
+    """CREATE TABLE analysis_history (
+        id INTEGER PRIMARY KEY, ticker VARCHAR(32) NOT NULL, lang VARCHAR(8) NOT NULL,
+        benchmark VARCHAR(32), payload_json VARCHAR NOT NULL,
+        created_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL)""",
+)
+
+
+@pytest.fixture()
+def database(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'migrate.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    engine = create_engine(url)
+    yield engine
+    engine.dispose()
+
+
+def _head() -> str:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def _version(engine) -> str:
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT version_num FROM alembic_version")).scalar_one()
+
+
+def _assert_orm_insert_works(engine) -> None:
+    with Session(engine) as session:
+        session.add(AnalysisHistory(ticker="NEW", lang="en", payload_hash=None))
+        session.commit()
+
+
+def test_upgrade_baseline_create_all_database(database):
+    with database.begin() as conn:
+        for statement in BASELINE_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(
+            text(
+                "INSERT INTO analysis_history (ticker, lang, payload_json) "
+                "VALUES ('AAA', 'en', :payload)"
+            ),
+            {"payload": json.dumps({"ticker": "AAA"})},
+        )
+
+    command.upgrade(alembic_config(), "head")
+
+    assert _version(database) == _head()
+    with database.connect() as conn:
+        row = conn.execute(
+            text("SELECT payload_json, payload_hash, created_at FROM analysis_history")
+        ).one()
+    assert row.payload_json is None and row.payload_hash
+    assert len(row.created_at) == len("YYYY-MM-DD HH:MM:SS.ffffff")
+    _assert_orm_insert_works(database)
+
+
+def test_upgrade_database_created_at_current_models(database):
+    Base.metadata.create_all(database)
+    command.upgrade(alembic_config(), "head")
+    assert _version(database) == _head()
+    _assert_orm_insert_works(database)
+
+
+def test_upgrade_empty_database(database):
+    command.upgrade(alembic_config(), "head")
+    tables = set(inspect(database).get_table_names())
+    assert {"ticker_stats", "analysis_history", "analysis_payloads"} <= tables
+    _assert_orm_insert_works(database)
+    command.upgrade(alembic_config(), "head")
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_analyzer.services.stock_analyzer.portfolio import rebalance_dates, run_portfolio_backtest
+
+COST_RATE = (5.0 + 5.0) / 10_000
+
+
+def _universe(seed: int = 3, bars: int = 320, width: int = 12):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2022-01-03", periods=bars)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, (bars, width)), axis=0))
+    close[rng.random((bars, width)) < 0.03] = np.nan
+    close[:90, 0] = np.nan  # listed late
+    close[200:, 1] = np.nan  # delisted: the last price is carried
+    scores = rng.random((bars, width))
+    scores[rng.random((bars, width)) < 0.1] = np.nan
+    columns = [f"T{i}" for i in range(width)]
+    return pd.DataFrame(close, dates, columns), pd.DataFrame(scores, dates, columns)
+
+
+def _naive(close, scores, *, top_k, weighting, rebalance):
+    prices = close.ffill().to_numpy()
+    raw_close, raw_scores = close.to_numpy(), scores.to_numpy()
+    rebalance_rows = set(close.index.get_indexer(rebalance_dates(close.index, rebalance)))
+    holdings = np.zeros(close.shape[1])  # value of each position per unit of equity
+    cash = 1.0
+    returns, turnover, weights = [], [], []
+    for t in range(len(prices)):
+        value_before = holdings.sum() + cash
+        if t:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                growth = np.where(holdings > 0, prices[t] / prices[t - 1], 1.0)
+            holdings = holdings * growth
+        value = holdings.sum() + cash
+        gross = value / value_before - 1
+        if t not in rebalance_rows:
+            returns.append(gross)
+            continue
+        candidates = [
+            (raw_scores[t, j], j)
+            for j in range(len(prices[t]))
+            if not np.isnan(raw_close[t, j]) and prices[t, j] > 0 and not np.isnan(raw_scores[t, j])
+        ]
+        chosen = sorted(candidates, reverse=True)[:top_k]
+        target = np.zeros(len(prices[t]))
+        for score, j in chosen:
+            target[j] = 1.0 if weighting == "equal" else max(score, 0.0)
+        if target.sum() > 0:
+            target /= target.sum()
+        traded = np.abs(target - holdings / value).sum()
+        returns.append(gross - traded * COST_RATE)
+        turnover.append(traded / 2)
+        weights.append(target)
+        holdings, cash = target.copy(), 1.0 - target.sum()
+    return np.array(returns), np.array(turnover), np.array(weights)
+
+
+@pytest.mark.parametrize("weighting", ["equal", "score"])
+@pytest.mark.parametrize("rebalance", ["M", "W", 7])
+def test_matches_per_bar_simulation(weighting, rebalance):
+    close, scores = _universe()
+    options = {"top_k": 4, "weighting": weighting, "rebalance": rebalance}
+    result = run_portfolio_backtest(close, scores, **options)
+    returns, turnover, weights = _naive(close, scores, **options)
+    np.testing.assert_allclose(result.weights.to_numpy(), weights, rtol=0, atol=1e-15)
+    np.testing.assert_allclose(result.turnover.to_numpy(), turnover, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(result.returns.to_numpy(), returns, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(result.equity.to_numpy(), np.cumprod(1 + returns), rtol=1e-12)
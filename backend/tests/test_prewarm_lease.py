@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+
+from stock_analyzer import prewarm
+from stock_analyzer.services.stock_analyzer.shared_cache import SharedCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lease_has_one_holder_until_it_expires(tmp_path):
+    clock = _Clock()
+    path = str(tmp_path / "shared.db")
+    first = SharedCache(path, clock=clock)
+    second = SharedCache(path, clock=clock)
+    assert first.try_lease("prewarm", "worker-1", 60)
+    assert not second.try_lease("prewarm", "worker-2", 60)
+    # The holder renews its own lease.
+    clock.now += 59
+    assert first.try_lease("prewarm", "worker-1", 60)
+    clock.now += 59
+    assert not second.try_lease("prewarm", "worker-2", 60)
+    clock.now += 2
+    assert second.try_lease("prewarm", "worker-2", 60)
+    assert not first.try_lease("prewarm", "worker-1", 60)
+
+
+def test_prewarm_skips_while_another_worker_holds_the_lease(tmp_path, monkeypatch):
+    store = SharedCache(str(tmp_path / "shared.db"))
+    store.try_lease(prewarm.PREWARM_LEASE_NAME, "other-host:1", 3600)
+    monkeypatch.setattr(prewarm, "SHARED_CACHE", store)
+
+    async def no_tickers(limit: int = 0) -> list[str]:
+        raise AssertionError("the losing worker must not read the hot tickers")
+
+    monkeypatch.setattr(prewarm, "load_hot_tickers", no_tickers)
+    assert asyncio.run(prewarm.prewarm_once(ttl=600)) == 0
+
+
+def test_prewarm_runs_when_it_wins_the_lease(tmp_path, monkeypatch):
+    store = SharedCache(str(tmp_path / "shared.db"))
+    monkeypatch.setattr(prewarm, "SHARED_CACHE", store)
+    calls = []
+
+    async def no_tickers(limit: int = 0) -> list[str]:
+        calls.append(limit)
+        return []
+
+    monkeypatch.setattr(prewarm, "load_hot_tickers", no_tickers)
+    assert asyncio.run(prewarm.prewarm_once(ttl=600)) == 0
+    assert len(calls) == 1
+    assert not store.try_lease(prewarm.PREWARM_LEASE_NAME, "other-host:1", 3600)
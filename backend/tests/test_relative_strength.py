@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_analyzer.services.stock_analyzer.indicators import (
+    compute_relative_performance,
+    compute_relative_strength,
+)
+
+
+def _reference(close, benchmark_close, *, benchmark_symbol, window=60):
+    # The pairwise concat/dropna computation compute_relative_performance replaced.
+    if benchmark_close is None or benchmark_close.empty:
+        return {}
+    joined = pd.concat(
+        {"asset": close.astype(float), "benchmark": benchmark_close.astype(float)},
+        axis=1,
+        join="inner",
+    ).dropna()
+    if len(joined) < window + 1:
+        window = len(joined) - 1
+    if window <= 1:
+        return {}
+    segment = joined.tail(window + 1)
+    asset_start, asset_end = segment["asset"].iloc[0], segment["asset"].iloc[-1]
+    bench_start, bench_end = segment["benchmark"].iloc[0], segment["benchmark"].iloc[-1]
+    if asset_start <= 0 or bench_start <= 0:
+        return {}
+    asset_return = asset_end / asset_start - 1
+    bench_return = bench_end / bench_start - 1
+    alpha = asset_return - bench_return
+    if alpha > 0.03:
+        label_key = "relative_label_outperform"
+    elif alpha < -0.03:
+        label_key = "relative_label_underperform"
+    else:
+        label_key = "relative_label_neutral"
+    return {
+        "benchmark": benchmark_symbol,
+        "window_days": window,
+        "ticker_return": float(asset_return),
+        "benchmark_return": float(bench_return),
+        "alpha_pct": float(alpha),
+        "label_key": label_key,
+    }
+
+
+def _walk(rng, dates, missing=0.0):
+    values = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+    values[rng.random(len(dates)) < missing] = np.nan
+    return pd.Series(values, index=dates)
+
+
+def _cases():
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2023-01-02", periods=300)
+    asset = _walk(rng, dates, missing=0.05)
+    # The benchmark trades on a different calendar: some asset dates are absent,
+    # others are extra, and a few closes are NaN.
+    bench_dates = dates.delete(rng.choice(len(dates), 20, replace=False)).append(
+        pd.bdate_range("2024-03-01", periods=10)
+    )
+    benchmark = _walk(rng, bench_dates.unique().sort_values(), missing=0.05)
+    yield asset, benchmark
+    yield asset.iloc[-40:], benchmark
+    yield asset.iloc[:3], benchmark
+    yield asset, benchmark.iloc[:0]
+    ends_with_gap = asset.copy()
+    ends_with_gap.iloc[-5:] = np.nan
+    yield ends_with_gap, benchmark
+    non_positive = asset.copy()
+    non_positive.iloc[-80:-50] = 0.0
+    yield non_positive, benchmark
+
+
+@pytest.mark.parametrize("window", [2, 5, 20, 60, 250, 1000])
+def test_matches_pairwise_computation(window):
+    for asset, benchmark in _cases():
+        expected = _reference(asset, benchmark, benchmark_symbol="^IDX", window=window)
+        result = compute_relative_strength(asset, benchmark, benchmark_symbol="^IDX", window=window)
+        assert result == pytest.approx(expected, rel=1e-12, abs=1e-15)
+
+
+def test_many_benchmarks_match_each_pair():
+    rng = np.random.default_rng(11)
+    dates = pd.bdate_range("2023-01-02", periods=200)
+    asset = _walk(rng, dates, missing=0.03)
+    benchmarks = pd.DataFrame(
+        {
+            "A": _walk(rng, dates),
+            "B": _walk(rng, dates, missing=0.1),
+            "C": _walk(rng, dates, missing=0.5),
+        }
+    )
+    benchmarks.loc[dates[:150], "C"] = np.nan
+    windows = (5, 20, 60, 120)
+    table = compute_relative_performance(asset, benchmarks, windows=windows)
+    expected = []
+    for symbol in benchmarks.columns:
+        rows = [
+            _reference(asset, benchmarks[symbol], benchmark_symbol=symbol, window=window)
+            for window in windows
+        ]
+        seen = set()
+        for row in rows:
+            if row and row["window_days"] not in seen:
+                seen.add(row["window_days"])
+                expected.append(row)
+    assert table.to_dict("records") == pytest.approx(expected, rel=1e-12, abs=1e-15)
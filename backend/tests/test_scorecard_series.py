@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from stock_analyzer.services.stock_analyzer import scoring
+from stock_analyzer.services.stock_analyzer.indicators import compute_macd, compute_rsi
+from stock_analyzer.services.stock_analyzer.synthetic import (
+    SyntheticConfig,
+    generate_fundamentals,
+    generate_history,
+)
+
+CONFIG = SyntheticConfig(seed=5, end="2024-12-31", years=2)
+CHECKPOINTS = [1, 5, 14, 15, 20, 21, 30, 45, 60, 61, 100, 250]
+
+
+@pytest.fixture(scope="module", params=["XYZ", "ABC"])
+def inputs(request):
+    history = generate_history(request.param, CONFIG)
+    info, income_stmt, news = generate_fundamentals(request.param, CONFIG)
+    fundamentals = {"info": info, "income_stmt": income_stmt, "news": news}
+    benchmark = generate_history("^GSPC", CONFIG)["Close"]
+    return request.param, history, fundamentals, benchmark
+
+
+def test_rows_match_the_scorecard(inputs, monkeypatch):
+    symbol, history, fundamentals, benchmark = inputs
+    series = scoring.build_scorecard_series(history, fundamentals=fundamentals, benchmark=benchmark)
+    for bars in CHECKPOINTS + [len(history)]:
+        window = history.iloc[:bars]
+        close = window["Close"]
+        # The scorecard downloads three months of the index ending on the same day.
+        recent = benchmark.loc[: window.index[-1]].tail(63)
+        monkeypatch.setattr(scoring, "_fetch_benchmark", lambda _symbol, recent=recent: recent)
+        card = scoring.build_scorecard(
+            {
+                "close": close,
+                "volume": window["Volume"],
+                "history": window,
+                "macd_df": compute_macd(close),
+                "rsi_series": compute_rsi(close),
+                "symbol": symbol,
+                **fundamentals,
+            }
+        )
+        row = series.iloc[bars - 1] * 100
+        for indicator in card["indicators"]:
+            assert indicator["score"] == pytest.approx(row[indicator["key"]], abs=0.05 + 1e-9), (
+                bars,
+                indicator["key"],
+            )
+        assert card["total_score"] == pytest.approx(row["total"], abs=0.05 + 1e-9), bars
+
+
+def test_truncated_history_reproduces_each_row(inputs):
+    _, history, fundamentals, benchmark = inputs
+    series = scoring.build_scorecard_series(history, fundamentals=fundamentals, benchmark=benchmark)
+    for bars in CHECKPOINTS:
+        window = history.iloc[:bars]
+        partial = scoring.build_scorecard_series(
+            window,
+            fundamentals=fundamentals,
+            benchmark=benchmark.loc[: window.index[-1]],
+        )
+        assert partial.index.equals(series.index[:bars])
+        np.testing.assert_allclose(
+            partial.to_numpy(), series.iloc[:bars].to_numpy(), rtol=1e-12, atol=1e-12
+        )